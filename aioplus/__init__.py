@@ -1,43 +1,72 @@
-from aioplus.internal.aall import aall
-from aioplus.internal.aany import aany
-from aioplus.internal.abatched import abatched
-from aioplus.internal.achain import achain
-from aioplus.internal.acount import acount
-from aioplus.internal.acycle import acycle
-from aioplus.internal.aempty import aempty
-from aioplus.internal.aenumerate import aenumerate
-from aioplus.internal.afirst import afirst
-from aioplus.internal.ahead import ahead
-from aioplus.internal.aislice import aislice
-from aioplus.internal.alast import alast
-from aioplus.internal.alen import alen
-from aioplus.internal.amax import amax
-from aioplus.internal.amin import amin
-from aioplus.internal.aminmax import aminmax
-from aioplus.internal.anextify import anextify
-from aioplus.internal.anth import anth
-from aioplus.internal.apairwise import apairwise
-from aioplus.internal.apostpend import apostpend
-from aioplus.internal.aprepend import aprepend
-from aioplus.internal.arace import arace
-from aioplus.internal.arange import arange
-from aioplus.internal.arepeat import arepeat
-from aioplus.internal.areversed import areversed
-from aioplus.internal.asum import asum
-from aioplus.internal.atabulate import atabulate
-from aioplus.internal.atail import atail
-from aioplus.internal.atriplewise import atriplewise
-from aioplus.internal.awaitify import awaitify
-from aioplus.internal.awindowed import awindowed
-from aioplus.internal.azip import azip
-from aioplus.internal.caller_thread_executor import CallerThreadExecutor
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from aioplus.internal.aall import aall
+    from aioplus.internal.aany import aany
+    from aioplus.internal.abatched import abatched
+    from aioplus.internal.achain import achain
+    from aioplus.internal.acount import acount
+    from aioplus.internal.acycle import acycle
+    from aioplus.internal.aempty import aempty
+    from aioplus.internal.aenumerate import aenumerate
+    from aioplus.internal.afirst import afirst
+    from aioplus.internal.ahead import ahead
+    from aioplus.internal.aislice import aislice
+    from aioplus.internal.alast import alast
+    from aioplus.internal.alen import alen
+    from aioplus.internal.amap import amap
+    from aioplus.internal.amax import amax
+    from aioplus.internal.amean import amean
+    from aioplus.internal.amin import amin
+    from aioplus.internal.aminmax import aminmax
+    from aioplus.internal.anextify import anextify
+    from aioplus.internal.anlargest import anlargest
+    from aioplus.internal.ansmallest import ansmallest
+    from aioplus.internal.anth import anth
+    from aioplus.internal.apairwise import apairwise
+    from aioplus.internal.apostpend import apostpend
+    from aioplus.internal.aprepend import aprepend
+    from aioplus.internal.arace import arace
+    from aioplus.internal.arange import arange
+    from aioplus.internal.arepeat import arepeat
+    from aioplus.internal.areversed import areversed
+    from aioplus.internal.ashare import AsyncShare, ashare
+    from aioplus.internal.astream import AsyncStream, astream
+    from aioplus.internal.asum import asum
+    from aioplus.internal.atabulate import atabulate
+    from aioplus.internal.atail import atail
+    from aioplus.internal.atee import atee
+    from aioplus.internal.atriplewise import atriplewise
+    from aioplus.internal.avar import avar
+    from aioplus.internal.awaitify import awaitify
+    from aioplus.internal.awindowed import awindowed
+    from aioplus.internal.azip import azip
+    from aioplus.internal.azip_longest import azip_longest
+    from aioplus.internal.caller_thread_executor import (
+        CallerThreadExecutor,
+        CallerThreadExecutorStats,
+    )
+    from aioplus.internal.instrument import IteratorStats, instrument
+    from aioplus.internal.trace import Exporter, HistogramData, InMemoryExporter, SpanData, trace
+    from aioplus.internal.yield_policy import YieldPolicy, yield_policy
 
 
 __author__ = "Sergei Y. Bogdanov <syubogdanov@outlook.com>"
 __version__ = "0.7.0"
 
 __all__: list[str] = [
+    "AsyncShare",
+    "AsyncStream",
     "CallerThreadExecutor",
+    "CallerThreadExecutorStats",
+    "Exporter",
+    "HistogramData",
+    "InMemoryExporter",
+    "IteratorStats",
+    "SpanData",
+    "YieldPolicy",
     "aall",
     "aany",
     "abatched",
@@ -51,10 +80,14 @@ __all__: list[str] = [
     "aislice",
     "alast",
     "alen",
+    "amap",
     "amax",
+    "amean",
     "amin",
     "aminmax",
     "anextify",
+    "anlargest",
+    "ansmallest",
     "anth",
     "apairwise",
     "apostpend",
@@ -63,46 +96,96 @@ __all__: list[str] = [
     "arange",
     "arepeat",
     "areversed",
+    "ashare",
+    "astream",
     "asum",
     "atabulate",
     "atail",
+    "atee",
     "atriplewise",
+    "avar",
     "awaitify",
     "awindowed",
     "azip",
+    "azip_longest",
+    "instrument",
+    "trace",
+    "yield_policy",
 ]
 
 
-CallerThreadExecutor.__module__ = "aioplus"
-aall.__module__ = "aioplus"
-aany.__module__ = "aioplus"
-abatched.__module__ = "aioplus"
-achain.__module__ = "aioplus"
-acount.__module__ = "aioplus"
-acycle.__module__ = "aioplus"
-aempty.__module__ = "aioplus"
-aenumerate.__module__ = "aioplus"
-afirst.__module__ = "aioplus"
-ahead.__module__ = "aioplus"
-aislice.__module__ = "aioplus"
-alast.__module__ = "aioplus"
-alen.__module__ = "aioplus"
-amax.__module__ = "aioplus"
-amin.__module__ = "aioplus"
-aminmax.__module__ = "aioplus"
-anextify.__module__ = "aioplus"
-anth.__module__ = "aioplus"
-apairwise.__module__ = "aioplus"
-apostpend.__module__ = "aioplus"
-aprepend.__module__ = "aioplus"
-arace.__module__ = "aioplus"
-arange.__module__ = "aioplus"
-arepeat.__module__ = "aioplus"
-areversed.__module__ = "aioplus"
-asum.__module__ = "aioplus"
-atabulate.__module__ = "aioplus"
-atail.__module__ = "aioplus"
-atriplewise.__module__ = "aioplus"
-awaitify.__module__ = "aioplus"
-awindowed.__module__ = "aioplus"
-azip.__module__ = "aioplus"
+# Public names are imported on first access, see PEP 562
+_MODULES: dict[str, str] = {
+    "AsyncShare": "aioplus.internal.ashare",
+    "AsyncStream": "aioplus.internal.astream",
+    "CallerThreadExecutor": "aioplus.internal.caller_thread_executor",
+    "CallerThreadExecutorStats": "aioplus.internal.caller_thread_executor",
+    "Exporter": "aioplus.internal.trace",
+    "HistogramData": "aioplus.internal.trace",
+    "InMemoryExporter": "aioplus.internal.trace",
+    "IteratorStats": "aioplus.internal.instrument",
+    "SpanData": "aioplus.internal.trace",
+    "YieldPolicy": "aioplus.internal.yield_policy",
+    "aall": "aioplus.internal.aall",
+    "aany": "aioplus.internal.aany",
+    "abatched": "aioplus.internal.abatched",
+    "achain": "aioplus.internal.achain",
+    "acount": "aioplus.internal.acount",
+    "acycle": "aioplus.internal.acycle",
+    "aempty": "aioplus.internal.aempty",
+    "aenumerate": "aioplus.internal.aenumerate",
+    "afirst": "aioplus.internal.afirst",
+    "ahead": "aioplus.internal.ahead",
+    "aislice": "aioplus.internal.aislice",
+    "alast": "aioplus.internal.alast",
+    "alen": "aioplus.internal.alen",
+    "amap": "aioplus.internal.amap",
+    "amax": "aioplus.internal.amax",
+    "amean": "aioplus.internal.amean",
+    "amin": "aioplus.internal.amin",
+    "aminmax": "aioplus.internal.aminmax",
+    "anextify": "aioplus.internal.anextify",
+    "anlargest": "aioplus.internal.anlargest",
+    "ansmallest": "aioplus.internal.ansmallest",
+    "anth": "aioplus.internal.anth",
+    "apairwise": "aioplus.internal.apairwise",
+    "apostpend": "aioplus.internal.apostpend",
+    "aprepend": "aioplus.internal.aprepend",
+    "arace": "aioplus.internal.arace",
+    "arange": "aioplus.internal.arange",
+    "arepeat": "aioplus.internal.arepeat",
+    "areversed": "aioplus.internal.areversed",
+    "ashare": "aioplus.internal.ashare",
+    "astream": "aioplus.internal.astream",
+    "asum": "aioplus.internal.asum",
+    "atabulate": "aioplus.internal.atabulate",
+    "atail": "aioplus.internal.atail",
+    "atee": "aioplus.internal.atee",
+    "atriplewise": "aioplus.internal.atriplewise",
+    "avar": "aioplus.internal.avar",
+    "awaitify": "aioplus.internal.awaitify",
+    "awindowed": "aioplus.internal.awindowed",
+    "azip": "aioplus.internal.azip",
+    "azip_longest": "aioplus.internal.azip_longest",
+    "instrument": "aioplus.internal.instrument",
+    "trace": "aioplus.internal.trace",
+    "yield_policy": "aioplus.internal.yield_policy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public name on first access."""
+    if (module := _MODULES.get(name)) is None:
+        detail = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(detail)
+
+    obj = getattr(import_module(module), name)
+    obj.__module__ = __name__
+    globals()[name] = obj
+
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Return the names of the module, including the ones not imported yet."""
+    return sorted({*globals(), *__all__})
@@ -1,5 +1,6 @@
 from collections.abc import AsyncIterable
 
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
 from aioplus.internal.utils.typing import SupportsBool
 
 
@@ -23,6 +24,11 @@ async def aall(aiterable: AsyncIterable[SupportsBool], /) -> bool:
     >>> await aall(aiterable)
     False
 
+    Notes
+    -----
+    * If ``aiterable`` implements ``__anext_batch__()``, it is consumed by batches. Items after
+      the one that decides the result may be consumed as well.
+
     See Also
     --------
     :func:`all`
@@ -31,7 +37,15 @@ async def aall(aiterable: AsyncIterable[SupportsBool], /) -> bool:
         detail = "'aiterable' must be 'AsyncIterable'"
         raise TypeError(detail)
 
-    async for item in aiterable:
+    aiterator = aiter(aiterable)
+
+    if supports_anext_batch(aiterator):
+        while items := await anext_batch(aiterator):
+            if not all(items):
+                return False
+        return True
+
+    async for item in aiterator:
         if not item:
             return False
 
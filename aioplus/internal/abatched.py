@@ -1,20 +1,32 @@
-from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
-from typing import Self, TypeVar
+from asyncio import Task, get_running_loop, wait
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Self, TypeVar, cast
 
-from aioplus.internal.aislice import aislice
+from aioplus.internal.utils.batching import BATCH_SIZE, anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.tasks import spawn
+from aioplus.internal.utils.typing import AcloseableIterator
 
 
 T = TypeVar("T")
 
+MISSING = object()
+TIMEOUT = object()
 
+
+@instrumented("abatched")
 def abatched(
     aiterable: AsyncIterable[T],
     /,
     *,
-    n: int,
+    n: int | None = None,
     strict: bool = False,
-) -> AsyncIterator[tuple[T, ...]]:
+    timeout: float | None = None,
+    max_weight: float | None = None,
+    weight: Callable[[T], float] | None = None,
+) -> AcloseableIterator[tuple[T, ...]]:
     """Iterate ``aiterable`` by batches of length ``n``.
 
     Parameters
@@ -22,16 +34,26 @@ def abatched(
     aiterable : AsyncIterable[T]
         The asynchronous iterable.
 
-    n : int
-        The batch size.
+    n : int, optional
+        The batch size. If :obj:`None`, batches are only cut by ``max_weight``.
 
     strict : bool, default False
         If :obj:`True`, raises :exc:`ValueError` if the total number of objects is not divisible
         by ``n``. If :obj:`False`, the last batch may be shorter than ``n``.
 
+    timeout : float, optional
+        The maximum number of seconds the first item of a batch may wait for the batch to fill up.
+        If :obj:`None`, batches are not cut by time.
+
+    max_weight : float, optional
+        The maximum total weight of a batch. If :obj:`None`, batches are not cut by weight.
+
+    weight : Callable[[T], float], optional
+        The callable that returns the weight of an item. Required if ``max_weight`` is provided.
+
     Returns
     -------
-    AsyncIterator[tuple[T, ...]]
+    AcloseableIterator[tuple[T, ...]]
         The asynchronous iterator.
 
     Examples
@@ -40,6 +62,15 @@ def abatched(
     >>> [batch async for batch in abatched(aiterable, n=3)]
     [(0, 1, 2), (3, 4, 5), ..., (18, 19, 20), (21, 22)]
 
+    Notes
+    -----
+    * If ``timeout`` is provided, a pull that is still in flight when the batch is emitted is not
+      cancelled. Its item becomes the first item of the next batch;
+    * It is recommended to explicitly close this iterator using ``aclose()`` if ``timeout`` is
+      provided. Otherwise, the pull in flight may never be awaited;
+    * If ``max_weight`` is provided, an item that would overflow the batch is carried into the
+      next one. An item heavier than ``max_weight`` is returned in a batch of its own.
+
     See Also
     --------
     :func:`itertools.batched`
@@ -48,11 +79,15 @@ def abatched(
         detail = "'aiterable' must be 'AsyncIterable'"
         raise TypeError(detail)
 
-    if not isinstance(n, int):
-        detail = "'n' must be 'int'"
+    if n is None and max_weight is None:
+        detail = "'n' or 'max_weight' must be provided"
         raise TypeError(detail)
 
-    if n <= 0:
+    if n is not None and not isinstance(n, int):
+        detail = "'n' must be 'int' or 'None'"
+        raise TypeError(detail)
+
+    if n is not None and n <= 0:
         detail = "'n' must be positive"
         raise ValueError(detail)
 
@@ -60,21 +95,65 @@ def abatched(
         detail = "'strict' must be 'bool'"
         raise TypeError(detail)
 
+    if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, int | float)):
+        detail = "'timeout' must be 'float' or 'None'"
+        raise TypeError(detail)
+
+    if timeout is not None and timeout <= 0:
+        detail = "'timeout' must be positive"
+        raise ValueError(detail)
+
+    if max_weight is not None and (
+        isinstance(max_weight, bool) or not isinstance(max_weight, int | float)
+    ):
+        detail = "'max_weight' must be 'float' or 'None'"
+        raise TypeError(detail)
+
+    if max_weight is not None and max_weight <= 0:
+        detail = "'max_weight' must be positive"
+        raise ValueError(detail)
+
+    if weight is not None and not callable(weight):
+        detail = "'weight' must be 'Callable' or 'None'"
+        raise TypeError(detail)
+
+    if (max_weight is None) != (weight is None):
+        detail = "'max_weight' and 'weight' must be provided together"
+        raise ValueError(detail)
+
+    if strict and (timeout is not None or max_weight is not None):
+        detail = "'strict' is not supported if 'timeout' or 'max_weight' is provided"
+        raise ValueError(detail)
+
     aiterator = aiter(aiterable)
-    return AbatchedIterator(aiterator, n, strict)
+    return AbatchedIterator(aiterator, n, strict, timeout, max_weight, weight)
 
 
-@dataclass(repr=False)
-class AbatchedIterator(AsyncIterator[tuple[T, ...]]):
+@dataclass(repr=False, slots=True)
+class AbatchedIterator(AcloseableIterator[tuple[T, ...]]):
     """An asynchronous iterator."""
 
     aiterator: AsyncIterator[T]
-    n: int
+    n: int | None
     strict: bool
+    timeout: float | None = None
+    max_weight: float | None = None
+    weight: Callable[[T], float] | None = None
+    _finished_flg: bool = field(init=False)
+    _exhausted_flg: bool = field(init=False)
+    _task: Task[T] | None = field(init=False)
+    _carry: Any = field(init=False)
+    _total: float = field(init=False)
+    _exception: Exception | None = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._finished_flg: bool = False
+        self._finished_flg = False
+        self._exhausted_flg = False
+        self._task = None
+        self._carry = MISSING
+        self._total = 0
+        self._exception = None
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -82,23 +161,185 @@ class AbatchedIterator(AsyncIterator[tuple[T, ...]]):
 
     async def __anext__(self) -> tuple[T, ...]:
         """Return the next item."""
-        if self._finished_flg:
+        if self._exception is not None:
+            self._finished_flg = True
+            deferred, self._exception = self._exception, None
+            raise deferred
+
+        if self._finished_flg or self._exhausted_flg:
+            self._finished_flg = True
             raise StopAsyncIteration
 
+        batch: list[T] = []
+        self._total = 0
+
         try:
-            batch = [item async for item in aislice(self.aiterator, self.n)]
+            if self._carry is not MISSING:
+                carry, self._carry = self._carry, MISSING
+                self._add(batch, carry)
+
+            if self.timeout is not None:
+                await self._fill_timed(batch, self.timeout)
+            elif self.max_weight is not None:
+                await self._fill_weighted(batch)
+            else:
+                await self._fill(batch)
+
+        except StopAsyncIteration:
+            self._exhausted_flg = True
 
         except BaseException:
-            self._finished_flg = True
+            self.close()
             raise
 
         if not batch:
             self._finished_flg = True
             raise StopAsyncIteration
 
-        if self.strict and len(batch) < self.n:
+        if self.strict and len(batch) < cast("int", self.n):
             self._finished_flg = True
             detail = "abatched(): incomplete batch"
             raise ValueError(detail)
 
         return tuple(batch)
+
+    async def __anext_batch__(self, max_n: int, /) -> list[tuple[T, ...]]:
+        """Return up to ``max_n`` next items."""
+        if self.n is None or self.timeout is not None or self.max_weight is not None:
+            return [await self.__anext__()]
+
+        if self._exception is not None:
+            self._finished_flg = True
+            deferred, self._exception = self._exception, None
+            raise deferred
+
+        if self._finished_flg or self._exhausted_flg:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        # Pull about `BATCH_SIZE` items, however large the batches are
+        items: list[T] = []
+        total = self.n * min(max_n, max(1, BATCH_SIZE // self.n))
+
+        try:
+            while len(items) < total:
+                chunk = await anext_batch(self.aiterator, total - len(items))
+                if not chunk:
+                    self._exhausted_flg = True
+                    break
+                items.extend(chunk)
+
+        except BaseException:
+            self.close()
+            raise
+
+        batches = [tuple(items[index : index + self.n]) for index in range(0, len(items), self.n)]
+
+        if self.strict and batches and len(batches[-1]) < self.n:
+            batches.pop()
+            detail = "abatched(): incomplete batch"
+            self._exception = ValueError(detail)
+
+        if not batches:
+            return await self.__anext_batch__(max_n)
+
+        return batches
+
+    def __del__(self) -> None:
+        """Call the destructor."""
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        task = self._task
+        self.close()
+
+        if task is not None:
+            await wait({task})
+
+    def close(self) -> None:
+        """Close the iterator."""
+        self._finished_flg = True
+        self._carry = MISSING
+
+        if self._task is not None:
+            # The event loop may already be closed
+            with suppress(RuntimeError):
+                self._task.cancel()
+            self._task = None
+
+    async def _fill(self, batch: list[T], /) -> None:
+        """Pull items until the batch is full."""
+        for _ in range(cast("int", self.n)):
+            item = await anext(self.aiterator)
+            batch.append(item)
+
+    async def _fill_weighted(self, batch: list[T], /) -> None:
+        """Pull items until the batch is full or heavy enough."""
+        while self._room(batch):
+            item = await anext(self.aiterator)
+            self._add(batch, item)
+
+    async def _fill_timed(self, batch: list[T], delay: float, /) -> None:
+        """Pull items until the batch is full or its first item has waited ``delay`` seconds."""
+        if not batch:
+            item = await self._pull(None)
+            self._add(batch, item)
+
+        deadline = get_running_loop().time() + delay
+
+        while self._room(batch):
+            item = await self._pull(deadline)
+            if item is TIMEOUT:
+                break
+            self._add(batch, item)
+
+    def _add(self, batch: list[T], item: T, /) -> None:
+        """Add the item to the batch, or carry it into the next one if it overflows."""
+        if self.weight is None or self.max_weight is None:
+            batch.append(item)
+            return
+
+        weight = self.weight(item)
+
+        if batch and self._total + weight > self.max_weight:
+            self._carry = item
+            return
+
+        batch.append(item)
+        self._total += weight
+
+    def _room(self, batch: list[T], /) -> bool:
+        """Return :obj:`True` if the batch may take more items."""
+        if self._carry is not MISSING:
+            return False
+
+        if self.n is not None and len(batch) >= self.n:
+            return False
+
+        return self.max_weight is None or self._total < self.max_weight
+
+    async def _pull(self, deadline: float | None, /) -> Any:
+        """Pull the next item, or return ``TIMEOUT`` if the deadline has passed.
+
+        Notes
+        -----
+        * ``__anext__()`` runs in a task, kept across batches until it completes, so that the pull
+          survives the deadline without moving to another task.
+        """
+        if self._task is None:
+            self._task = spawn(self._anext())
+
+        loop = get_running_loop()
+        timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+        done, _ = await wait({self._task}, timeout=timeout)
+
+        if not done:
+            return TIMEOUT
+
+        task, self._task = self._task, None
+        return task.result()
+
+    async def _anext(self) -> T:
+        """Return the next item of the asynchronous iterator."""
+        return await anext(self.aiterator)
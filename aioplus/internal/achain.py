@@ -1,7 +1,10 @@
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar, overload
 
+from aioplus.internal.utils.batching import anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 
@@ -71,6 +74,7 @@ def achain(
 def achain(*aiterables: AsyncIterable[T]) -> AsyncIterator[T]: ...
 
 
+@instrumented("achain")
 def achain(*aiterables: AsyncIterable[T]) -> AsyncIterator[T]:
     """Iterate ``*aiterables`` sequentially.
 
@@ -104,11 +108,12 @@ def achain(*aiterables: AsyncIterable[T]) -> AsyncIterator[T]:
     return AchainIterator(aiterators)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AchainIterator(AsyncIterator[T]):
     """An asynchronous iterator."""
 
     aiterators: list[AsyncIterator[T]]
+    _stack: list[AsyncIterator[T]] = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
@@ -136,3 +141,21 @@ class AchainIterator(AsyncIterator[T]):
             return item
 
         raise StopAsyncIteration
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        while self._stack:
+            aiterator = self._stack[-1]
+            try:
+                items = await anext_batch(aiterator, max_n)
+
+            except BaseException:
+                self._stack.clear()
+                raise
+
+            if items:
+                return items
+
+            self._stack.pop()
+
+        raise StopAsyncIteration
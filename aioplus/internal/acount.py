@@ -1,11 +1,21 @@
 import asyncio
 
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self
 
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.yielding import Yielder
+from aioplus.internal.yield_policy import YieldPolicy
 
-def acount(start: int = 0, step: int = 1) -> AsyncIterator[int]:
+
+@instrumented("acount")
+def acount(
+    start: int = 0,
+    step: int = 1,
+    *,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[int]:
     """Return evenly spaced integers.
 
     Parameters
@@ -16,6 +26,10 @@ def acount(start: int = 0, step: int = 1) -> AsyncIterator[int]:
     step : int, default 1
         The difference between consecutives.
 
+    yield_policy : YieldPolicy, optional
+        The policy of yielding control to the event loop. If :obj:`None`, the default policy set by
+        :func:`aioplus.yield_policy` is used.
+
     Returns
     -------
     AsyncIterator[int]
@@ -38,15 +52,22 @@ def acount(start: int = 0, step: int = 1) -> AsyncIterator[int]:
         detail = "'step' must be 'int'"
         raise TypeError(detail)
 
-    return AcountIterator(start, step)
+    if yield_policy is not None and not isinstance(yield_policy, YieldPolicy):
+        detail = "'yield_policy' must be 'YieldPolicy' or 'None'"
+        raise TypeError(detail)
+
+    yielder = Yielder.from_policy(yield_policy)
+    return AcountIterator(start, step, yielder)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AcountIterator(AsyncIterator[int]):
     """An asynchronous iterator."""
 
     start: int
     step: int
+    yielder: Yielder
+    _next_value: int = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
@@ -62,6 +83,7 @@ class AcountIterator(AsyncIterator[int]):
         self._next_value += self.step
 
         # Move to the next coroutine!
-        await asyncio.sleep(0.0)
+        if self.yielder.due():
+            await asyncio.sleep(0.0)
 
         return value
@@ -2,14 +2,26 @@ import asyncio
 
 from collections import deque
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.batching import anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.yielding import Yielder
+from aioplus.internal.yield_policy import YieldPolicy
+
 
 T = TypeVar("T")
 
 
-def acycle(aiterable: AsyncIterable[T], /) -> AsyncIterator[T]:
+@instrumented("acycle")
+def acycle(
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[T]:
     """Make ``aiterable`` looped.
 
     Parameters
@@ -17,6 +29,10 @@ def acycle(aiterable: AsyncIterable[T], /) -> AsyncIterator[T]:
     aiterable : AsyncIterable[T]
         The asynchronous iterable.
 
+    yield_policy : YieldPolicy, optional
+        The policy of yielding control to the event loop. If :obj:`None`, the default policy set by
+        :func:`aioplus.yield_policy` is used.
+
     Returns
     -------
     AsyncIterator[T]
@@ -36,21 +52,30 @@ def acycle(aiterable: AsyncIterable[T], /) -> AsyncIterator[T]:
         detail = "'aiterable' must be 'AsyncIterable'"
         raise TypeError(detail)
 
+    if yield_policy is not None and not isinstance(yield_policy, YieldPolicy):
+        detail = "'yield_policy' must be 'YieldPolicy' or 'None'"
+        raise TypeError(detail)
+
     aiterator = aiter(aiterable)
-    return AcycleIterator(aiterator)
+    yielder = Yielder.from_policy(yield_policy)
+    return AcycleIterator(aiterator, yielder)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AcycleIterator(AsyncIterator[T]):
     """An asynchronous iterator."""
 
     aiterator: AsyncIterator[T]
+    yielder: Yielder
+    _deque: deque[T] = field(init=False)
+    _initialized_flg: bool = field(init=False)
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._deque: deque[T] = deque()
-        self._initialized_flg: bool = False
-        self._finished_flg: bool = False
+        self._deque = deque()
+        self._initialized_flg = False
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -82,6 +107,40 @@ class AcycleIterator(AsyncIterator[T]):
         self._deque.append(item)
 
         # Move to the next coroutine!
-        await asyncio.sleep(0.0)
+        if self.yielder.due():
+            await asyncio.sleep(0.0)
 
         return item
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        if self._finished_flg:
+            raise StopAsyncIteration
+
+        if not self._initialized_flg:
+            try:
+                items = await anext_batch(self.aiterator, max_n)
+            except BaseException:
+                self._finished_flg = True
+                self._deque.clear()
+                raise
+
+            if items:
+                self._deque.extend(items)
+                return items
+
+            self._initialized_flg = True
+
+        if not self._deque:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        count = min(max_n, len(self._deque))
+        items = list(islice(self._deque, count))
+        self._deque.rotate(-count)
+
+        # Move to the next coroutine!
+        if self.yielder.due(count):
+            await asyncio.sleep(0.0)
+
+        return items
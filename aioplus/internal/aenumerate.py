@@ -1,11 +1,15 @@
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.batching import anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 
 
+@instrumented("aenumerate")
 def aenumerate(aiterable: AsyncIterable[T], /, start: int = 0) -> AsyncIterator[tuple[int, T]]:
     """Enumerate ``aiterable``.
 
@@ -44,17 +48,19 @@ def aenumerate(aiterable: AsyncIterable[T], /, start: int = 0) -> AsyncIterator[
     return AenumerateIterator(aiterator, start)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AenumerateIterator(AsyncIterator[tuple[int, T]]):
     """An asynchronous iterator."""
 
     aiterator: AsyncIterator[T]
     start: int
+    _next_index: int = field(init=False)
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._next_index: int = self.start
-        self._finished_flg: bool = False
+        self._next_index = self.start
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -76,3 +82,24 @@ class AenumerateIterator(AsyncIterator[tuple[int, T]]):
         self._next_index += 1
 
         return (index, item)
+
+    async def __anext_batch__(self, max_n: int, /) -> list[tuple[int, T]]:
+        """Return up to ``max_n`` next items."""
+        if self._finished_flg:
+            raise StopAsyncIteration
+
+        try:
+            items = await anext_batch(self.aiterator, max_n)
+
+        except BaseException:
+            self._finished_flg = True
+            raise
+
+        if not items:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        index = self._next_index
+        self._next_index += len(items)
+
+        return list(enumerate(items, index))
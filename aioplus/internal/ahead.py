@@ -2,11 +2,13 @@ from collections.abc import AsyncIterable, AsyncIterator
 from typing import TypeVar
 
 from aioplus.internal.aislice import aislice
+from aioplus.internal.utils.instrumentation import instrumented
 
 
 T = TypeVar("T")
 
 
+@instrumented("ahead")
 def ahead(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[T]:
     """Return the first ``n`` items of ``aiterable``.
 
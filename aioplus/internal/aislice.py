@@ -1,7 +1,10 @@
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar, overload
 
+from aioplus.internal.utils.batching import anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 
@@ -24,6 +27,7 @@ def aislice(
 ) -> AsyncIterator[T]: ...
 
 
+@instrumented("aislice")
 def aislice(
     aiterable: AsyncIterable[T],
     start: int,
@@ -108,7 +112,7 @@ def aislice(
     return AisliceIterator(aiterator, start, stop, step)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AisliceIterator(AsyncIterator[T]):
     """An asynchronous slice iterator."""
 
@@ -116,12 +120,15 @@ class AisliceIterator(AsyncIterator[T]):
     start: int
     stop: int
     step: int
+    _next_index: int = field(init=False)
+    _yield_index: int = field(init=False)
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._next_index: int = 0
-        self._yield_index: int = self.start
-        self._finished_flg: bool = False
+        self._next_index = 0
+        self._yield_index = self.start
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -151,3 +158,36 @@ class AisliceIterator(AsyncIterator[T]):
         self._yield_index += self.step
 
         return item
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        if self._finished_flg:
+            raise StopAsyncIteration
+
+        count = min(max_n, len(range(self._yield_index, self.stop, self.step)))
+        last_index = self._yield_index + (count - 1) * self.step
+
+        items: list[T] = []
+
+        try:
+            while self._next_index <= last_index:
+                chunk = await anext_batch(self.aiterator, last_index - self._next_index + 1)
+                if not chunk:
+                    break
+
+                if self._yield_index < self._next_index + len(chunk):
+                    picked = chunk[self._yield_index - self._next_index :: self.step]
+                    items.extend(picked)
+                    self._yield_index += len(picked) * self.step
+
+                self._next_index += len(chunk)
+
+        except BaseException:
+            self._finished_flg = True
+            raise
+
+        if not items:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        return items
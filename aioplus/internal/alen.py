@@ -1,8 +1,11 @@
 from collections.abc import AsyncIterable
 from typing import Any
 
+from aioplus.internal.utils.arrays import size_of
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
 
-async def alen(aiterable: AsyncIterable[Any], /) -> int:
+
+async def alen(aiterable: AsyncIterable[Any], /, *, flatten: bool = False) -> int:
     """Return length of ``aiterable``.
 
     Parameters
@@ -10,6 +13,10 @@ async def alen(aiterable: AsyncIterable[Any], /) -> int:
     aiterable : AsyncIterable[Any]
         The asynchronous iterable.
 
+    flatten : bool, default False
+        If :obj:`True`, items implementing ``__array__()`` or the buffer protocol are treated as
+        chunks of elements, each counted without iterating over it.
+
     Returns
     -------
     :class:`int`
@@ -29,8 +36,19 @@ async def alen(aiterable: AsyncIterable[Any], /) -> int:
         detail = "'aiterable' must be 'AsyncIterable'"
         raise TypeError(detail)
 
+    if not isinstance(flatten, bool):
+        detail = "'flatten' must be 'bool'"
+        raise TypeError(detail)
+
+    aiterator = aiter(aiterable)
     count = 0
-    async for _ in aiterable:
-        count += 1
+
+    if supports_anext_batch(aiterator):
+        while items := await anext_batch(aiterator):
+            count += sum(map(size_of, items)) if flatten else len(items)
+        return count
+
+    async for item in aiterator:
+        count += size_of(item) if flatten else 1
 
     return count
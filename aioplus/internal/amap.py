@@ -0,0 +1,286 @@
+from asyncio import Task
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Self, TypeVar, cast
+
+from aioplus.internal.utils.inline import anext_or_ellipsis
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.tasks import TaskQueue
+from aioplus.internal.utils.typing import AcloseableIterator
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The key of the task refilling the free slots
+PULL = -1
+
+
+@instrumented("amap")
+def amap(
+    afunc: Callable[[T], Awaitable[R]],
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+) -> AcloseableIterator[R]:
+    """Return ``await afunc(item)`` for each item of ``aiterable``, running calls concurrently.
+
+    Parameters
+    ----------
+    afunc : Callable[[T], Awaitable[R]]
+        The callable.
+
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    concurrency : int, default 1
+        The maximum number of calls in flight.
+
+    ordered : bool, default True
+        If :obj:`True`, results are returned in the order of ``aiterable``. If :obj:`False`,
+        results are returned as soon as they become available.
+
+    Returns
+    -------
+    AcloseableIterator[R]
+        The asynchronous iterator.
+
+    Examples
+    --------
+    >>> afunc = awaitify(lambda x: x * x)
+    >>> aiterable = arange(23)
+    >>> [num async for num in amap(afunc, aiterable, concurrency=4)]
+    [0, 1, 4, 9, 16, 25, 36, 49, ..., 441, 484]
+
+    Notes
+    -----
+    * Items are pulled from ``aiterable`` only when a slot is free. If ``ordered=True``, results
+      waiting for an earlier one occupy their slots, so memory is bounded by ``concurrency``;
+    * Results are returned as soon as they are ready, even while ``aiterable`` is being pulled;
+    * If any call raises an exception, or is cancelled, the remaining calls are cancelled;
+    * It is recommended to explicitly close this iterator using ``aclose()``. Otherwise, warnings
+      about unawaited tasks may be emitted.
+
+    See Also
+    --------
+    :func:`map`
+    """
+    if not callable(afunc):
+        detail = "'afunc' must be 'Callable'"
+        raise TypeError(detail)
+
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    if not isinstance(concurrency, int):
+        detail = "'concurrency' must be 'int'"
+        raise TypeError(detail)
+
+    if concurrency <= 0:
+        detail = "'concurrency' must be positive"
+        raise ValueError(detail)
+
+    if not isinstance(ordered, bool):
+        detail = "'ordered' must be 'bool'"
+        raise TypeError(detail)
+
+    aiterator = aiter(aiterable)
+    return AmapIterator(afunc, aiterator, concurrency, ordered)
+
+
+@dataclass(repr=False, slots=True)
+class AmapIterator(AcloseableIterator[R]):
+    """An asynchronous iterator."""
+
+    afunc: Callable[[Any], Awaitable[R]]
+    aiterator: AsyncIterator[Any]
+    concurrency: int
+    ordered: bool
+    _exhausted_flg: bool = field(init=False)
+    _finished_flg: bool = field(init=False)
+    _next_index: int = field(init=False)
+    _yield_index: int = field(init=False)
+    _pulling_flg: bool = field(init=False)
+    _reorder: dict[int, Task[Any]] = field(init=False)
+    _tasks: TaskQueue[int, Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._exhausted_flg = False
+        self._finished_flg = False
+        self._pulling_flg = False
+        self._next_index = 0
+        self._yield_index = 0
+        self._reorder = {}
+        self._tasks = TaskQueue("amap")
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> R:
+        """Return the next item."""
+        if self._finished_flg:
+            raise StopAsyncIteration
+
+        exceptions: list[BaseException] = []
+
+        while not exceptions:
+            if self.ordered and self._yield_index in self._reorder:
+                task = self._reorder.pop(self._yield_index)
+
+            elif self._tasks.done:
+                task, index = self._tasks.popleft()
+
+                if index == PULL:
+                    self._pulling_flg = False
+                    self._collect(task, exceptions)
+                    continue
+
+                if self.ordered and index != self._yield_index:
+                    self._reorder[index] = task
+                    continue
+
+            else:
+                try:
+                    pending = await self._schedule()
+                except Exception as exception:
+                    exceptions.append(exception)
+                    continue
+
+                if not pending:
+                    self._finished_flg = True
+                    raise StopAsyncIteration
+
+                continue
+
+            self._yield_index += 1
+            try:
+                return cast("R", task.result())
+            except BaseException as exception:
+                exceptions.append(exception)
+
+        raise await self._fail(exceptions)
+
+    def __del__(self) -> None:
+        """Call the destructor."""
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        if self._tasks.pending:
+            self._tasks.cancel_all()
+            await self._tasks.wait_all()
+
+        self.close()
+
+    def close(self) -> None:
+        """Close the iterator."""
+        self._finished_flg = True
+        self._reorder.clear()
+        self._tasks.close()
+
+    async def _schedule(self) -> bool:
+        """Pull items if a slot is free, or wait until a task is done.
+
+        Returns
+        -------
+        bool
+            :obj:`False` if there is nothing left to wait for, :obj:`True` otherwise.
+
+        Notes
+        -----
+        * If no call is in flight, a single item is pulled in the current task. Otherwise, free
+          slots are refilled by a task, so that the results of the calls are returned as soon as
+          they are ready, even if ``aiterator`` is slow.
+        """
+        if not self._exhausted_flg and not self._pulling_flg and self._free():
+            if not self._tasks and not self._reorder:
+                self._pulled_item(await anext_or_ellipsis(self.aiterator))
+                return True
+
+            self._pulling_flg = True
+            self._tasks.schedule(self._refill(), PULL)
+
+        if not self._tasks:
+            return False
+
+        await self._tasks.wait_once()
+        return True
+
+    async def _refill(self) -> None:
+        """Pull items until there are no free slots or ``aiterator`` is exhausted."""
+        while not self._exhausted_flg and self._free():
+            self._pulled_item(await anext_or_ellipsis(self.aiterator))
+
+    def _free(self) -> bool:
+        """Check if there is a free slot."""
+        occupied = len(self._tasks) - self._pulling_flg + len(self._reorder)
+        return occupied < self.concurrency
+
+    def _pulled_item(self, item: Any, /) -> None:
+        """Schedule the call of the item, or mark ``aiterator`` as exhausted."""
+        if item is ...:
+            self._exhausted_flg = True
+            return
+
+        self._tasks.schedule(self._call(item), self._next_index)
+        self._next_index += 1
+
+    async def _call(self, item: Any, /) -> R:
+        """Call the function."""
+        return await self.afunc(item)
+
+    @staticmethod
+    def _collect(task: Task[Any], exceptions: list[BaseException], /) -> None:
+        """Collect the exception of the task, if any."""
+        try:
+            task.result()
+        except BaseException as exception:
+            exceptions.append(exception)
+
+    async def _fail(self, exceptions: list[BaseException], /) -> BaseExceptionGroup[BaseException]:
+        """Cancel the remaining calls and group the collected exceptions."""
+        self._finished_flg = True
+
+        for task in self._reorder.values():
+            self._collect(task, exceptions)
+        self._reorder.clear()
+
+        while self._tasks.done:
+            task, _ = self._tasks.popleft()
+            self._collect(task, exceptions)
+
+        if self._tasks.pending:
+            self._tasks.cancel_all()
+            await self._tasks.wait_all()
+
+        # The calls cancelled above are not failures
+        while self._tasks.done:
+            task, _ = self._tasks.popleft()
+            if not task.cancelled():
+                self._collect(task, exceptions)
+
+        base_exceptions: list[BaseException] = []
+        regular_exceptions: list[Exception] = []
+
+        for exception in exceptions:
+            if isinstance(exception, ExceptionGroup):
+                regular_exceptions.extend(exception.exceptions)
+            elif isinstance(exception, BaseExceptionGroup):
+                base_exceptions.extend(exception.exceptions)
+
+            elif isinstance(exception, Exception):
+                regular_exceptions.append(exception)
+            else:
+                base_exceptions.append(exception)
+
+        if base_exceptions:
+            detail = "amap(): base exception(-s) occurred"
+            return BaseExceptionGroup(detail, [*base_exceptions, *regular_exceptions])
+
+        detail = "amap(): exception(-s) occurred"
+        return ExceptionGroup(detail, regular_exceptions)
@@ -1,6 +1,8 @@
 from collections.abc import AsyncIterable, Callable
 from typing import Any, TypeAlias, TypeVar, overload
 
+from aioplus.internal.utils.arrays import ChunkReducer, max_of
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
 from aioplus.internal.utils.typing import SupportsDunderGT, SupportsDunderLT
 
 
@@ -17,6 +19,7 @@ async def amax(
     /,
     *,
     key: None = None,
+    flatten: bool = False,
 ) -> SupportsRichComparisonT: ...
 
 
@@ -26,6 +29,7 @@ async def amax(
     /,
     *,
     key: Callable[[T], SupportsRichComparison],
+    flatten: bool = False,
 ) -> T: ...
 
 
@@ -35,6 +39,7 @@ async def amax(
     /,
     *,
     key: None = None,
+    flatten: bool = False,
     default: T,
 ) -> SupportsRichComparisonT | T: ...
 
@@ -45,6 +50,7 @@ async def amax(
     /,
     *,
     key: Callable[[T], SupportsRichComparison],
+    flatten: bool = False,
     default: D,
 ) -> T | D: ...
 
@@ -54,6 +60,7 @@ async def amax(
     /,
     *,
     key: Callable[[Any], Any] | None = None,
+    flatten: bool = False,
     default: Any = ...,
 ) -> Any:
     """Return the largest item in ``aiterable``.
@@ -66,6 +73,10 @@ async def amax(
     key : Callable[[T], SupportsRichComparison], optional
         A function that extracts a comparison key from each element in the iterable.
 
+    flatten : bool, default False
+        If :obj:`True`, items implementing ``__array__()`` or the buffer protocol are treated as
+        chunks of elements, each reduced by a single vectorized call.
+
     default : D, unset
         A default value to return if the iterable is empty.
 
@@ -92,12 +103,41 @@ async def amax(
         detail = "'key' must be 'Callable' or 'None'"
         raise TypeError(detail)
 
+    if not isinstance(flatten, bool):
+        detail = "'flatten' must be 'bool'"
+        raise TypeError(detail)
+
+    if flatten and key is not None:
+        detail = "'key' is not supported if 'flatten' is provided"
+        raise ValueError(detail)
+
     aiterator = aiter(aiterable)
+
+    if flatten:
+        aiterator = ChunkReducer(aiterator, max_of)
+
     largest = await anext(aiterator, ...)
 
+    if largest is not ... and key is None and supports_anext_batch(aiterator):
+        while items := await anext_batch(aiterator):
+            largest = max(largest, *items)
+        return largest
+
+    if largest is not ... and key is not None and supports_anext_batch(aiterator):
+        largest_key = key(largest)
+        while items := await anext_batch(aiterator):
+            keys = list(map(key, items))
+            index = max(range(len(keys)), key=keys.__getitem__)
+            if keys[index] > largest_key:
+                largest, largest_key = items[index], keys[index]
+        return largest
+
     if largest is not ...:
+        largest_key = largest if key is None else key(largest)
         async for item in aiterator:
-            largest = max(largest, item, key=key)
+            value = item if key is None else key(item)
+            if value > largest_key:
+                largest, largest_key = item, value
         return largest
 
     if default is not ...:
@@ -0,0 +1,82 @@
+from collections.abc import AsyncIterable
+from typing import Any, TypeVar, overload
+
+from aioplus.internal.utils.moments import Moments
+
+
+D = TypeVar("D")
+
+
+@overload
+async def amean(aiterable: AsyncIterable[Any], /, *, flatten: bool = False) -> float: ...
+
+
+@overload
+async def amean(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    flatten: bool = False,
+    default: D,
+) -> float | D: ...
+
+
+async def amean(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    flatten: bool = False,
+    default: Any = ...,
+) -> Any:
+    """Return the arithmetic mean of ``aiterable``.
+
+    Parameters
+    ----------
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    flatten : bool, default False
+        If :obj:`True`, items implementing ``__array__()`` or the buffer protocol are treated as
+        chunks of elements, each reduced by a single vectorized call.
+
+    default : D, unset
+        A default value to return if the iterable is empty.
+
+    Returns
+    -------
+    float | D
+        The arithmetic mean.
+
+    Examples
+    --------
+    >>> aiterable = arange(23)
+    >>> await amean(aiterable)
+    11.0
+
+    Notes
+    -----
+    * The mean is updated incrementally, so the iterable is consumed in ``O(1)`` memory.
+
+    See Also
+    --------
+    :func:`statistics.fmean`
+    """
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    if not isinstance(flatten, bool):
+        detail = "'flatten' must be 'bool'"
+        raise TypeError(detail)
+
+    aiterator = aiter(aiterable)
+    moments = await Moments.from_aiterator(aiterator, flatten=flatten)
+
+    if moments.count:
+        return float(moments.mean)
+
+    if default is not ...:
+        return default
+
+    detail = "amean(): empty iterable"
+    raise ValueError(detail)
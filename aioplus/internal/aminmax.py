@@ -1,6 +1,9 @@
 from collections.abc import AsyncIterable, Callable
 from typing import Any, TypeAlias, TypeVar, overload
 
+from aioplus.internal.utils.arrays import ChunkReducer, minmax_of
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
+from aioplus.internal.utils.extremes import MinMax
 from aioplus.internal.utils.typing import SupportsDunderGT, SupportsDunderLT
 
 
@@ -19,6 +22,7 @@ async def aminmax(
     /,
     *,
     key: None = None,
+    flatten: bool = False,
 ) -> tuple[SupportsRichComparisonT, SupportsRichComparisonT]: ...
 
 
@@ -28,6 +32,7 @@ async def aminmax(
     /,
     *,
     key: Callable[[T], SupportsRichComparison],
+    flatten: bool = False,
 ) -> tuple[T, T]: ...
 
 
@@ -37,6 +42,7 @@ async def aminmax(
     /,
     *,
     key: None = None,
+    flatten: bool = False,
     default: tuple[T, T],
 ) -> tuple[SupportsRichComparisonT | T, SupportsRichComparisonT | T]: ...
 
@@ -47,6 +53,7 @@ async def aminmax(
     /,
     *,
     key: Callable[[T], SupportsRichComparison],
+    flatten: bool = False,
     default: tuple[D1, D2],
 ) -> tuple[T | D1, T | D2]: ...
 
@@ -56,6 +63,7 @@ async def aminmax(
     /,
     *,
     key: Callable[[Any], Any] | None = None,
+    flatten: bool = False,
     default: Any = ...,
 ) -> tuple[Any, Any]:
     """Return the smallest and the largest items in ``aiterable``.
@@ -68,6 +76,10 @@ async def aminmax(
     key : Callable[[T], SupportsRichComparison], optional
         A function that extracts a comparison key from each element in the iterable.
 
+    flatten : bool, default False
+        If :obj:`True`, items implementing ``__array__()`` or the buffer protocol are treated as
+        chunks of elements, each reduced by a single vectorized call.
+
     default : tuple[D1, D2], unset
         Default values to return if the iterable is empty.
 
@@ -84,7 +96,8 @@ async def aminmax(
 
     Notes
     -----
-    * This function is not comparison-optimized.
+    * ``key`` is called exactly once per item;
+    * Items are compared pairwise, which takes ``3`` comparisons per ``2`` items.
 
     See Also
     --------
@@ -99,6 +112,14 @@ async def aminmax(
         detail = "'key' must be 'Callable' or 'None'"
         raise TypeError(detail)
 
+    if not isinstance(flatten, bool):
+        detail = "'flatten' must be 'bool'"
+        raise TypeError(detail)
+
+    if flatten and key is not None:
+        detail = "'key' is not supported if 'flatten' is provided"
+        raise ValueError(detail)
+
     if default is not ... and not isinstance(default, tuple):
         detail = "'default' must be 'tuple[D1, D2]'"
         raise TypeError(detail)
@@ -108,13 +129,30 @@ async def aminmax(
         raise ValueError(detail)
 
     aiterator = aiter(aiterable)
-    smallest = largest = await anext(aiterator, ...)
 
-    if smallest is not ...:
+    if flatten:
+        aiterator = ChunkReducer(aiterator, minmax_of)
+
+    first = await anext(aiterator, ...)
+
+    if first is not ... and supports_anext_batch(aiterator):
+        extremes = MinMax.from_item(first, key)
+        while items := await anext_batch(aiterator):
+            extremes.update(items)
+        return (extremes.smallest, extremes.largest)
+
+    if first is not ...:
+        extremes = MinMax.from_item(first, key)
+        pending = ...
         async for item in aiterator:
-            smallest = min(smallest, item, key=key)
-            largest = max(largest, item, key=key)
-        return (smallest, largest)
+            if pending is ...:
+                pending = item
+                continue
+            extremes.update((pending, item))
+            pending = ...
+        if pending is not ...:
+            extremes.update((pending,))
+        return (extremes.smallest, extremes.largest)
 
     if default is ...:
         detail = "aminmax(): empty iterable"
@@ -1,21 +1,32 @@
-from collections.abc import AsyncIterator, Iterable, Iterator
+from asyncio import AbstractEventLoop, Future, get_running_loop
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from functools import partial
-from typing import Self, TypeVar
+from contextlib import suppress
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from time import monotonic
+from typing import Generic, Literal, Self, TypeVar
 
 from aioplus.internal.awaitify import awaitify
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.typing import AcloseableIterator
 
 
 T = TypeVar("T")
 
 
+@instrumented("anextify")
 def anextify(
     iterable: Iterable[T],
     /,
     *,
     executor: ThreadPoolExecutor | None = None,
-) -> AsyncIterator[T]:
+    chunksize: int = 1,
+    max_latency: float | None = None,
+    mode: Literal["executor", "thread"] = "executor",
+    maxsize: int = 1,
+) -> AcloseableIterator[T]:
     """Make ``iterable`` asynchronous.
 
     Parameters
@@ -27,9 +38,24 @@ def anextify(
         An optional :class:`concurrent.futures.ThreadPoolExecutor` to run the iterable in. If
         :obj:`None`, the default executor is used.
 
+    chunksize : int, default 1
+        The maximum number of items pulled from ``iterable`` per executor call.
+
+    max_latency : float, optional
+        The maximum number of seconds to spend on filling one chunk. Once exceeded, the partial
+        chunk is returned early. If :obj:`None`, chunks are only limited by ``chunksize``.
+
+    mode : {'executor', 'thread'}, default 'executor'
+        If ``'executor'``, items are pulled by executor calls on demand. If ``'thread'``, a
+        dedicated thread drains ``iterable`` into a bounded queue in the background.
+
+    maxsize : int, default 1
+        The maximum number of items the dedicated thread may queue ahead of the consumer. Only
+        used if ``mode='thread'``.
+
     Returns
     -------
-    AsyncIterator[T]
+    AcloseableIterator[T]
         The asynchronous iterator.
 
     Examples
@@ -39,6 +65,13 @@ def anextify(
     >>> [num async for num in aiterable]
     [0, 1, 2, 3, 4, 5]
 
+    Notes
+    -----
+    * The latency budget is checked between items, so a single slow item still blocks the chunk;
+    * If ``iterable`` raises an exception, items pulled before it are returned first;
+    * If ``mode='thread'``, the event loop is only woken up when the consumer waits for an empty
+      queue. Closing the iterator, or dropping it, stops the thread after its current item.
+
     See Also
     --------
     :meth:`asyncio.loop.run_in_executor`
@@ -51,20 +84,67 @@ def anextify(
         detail = "'executor' must be 'ThreadPoolExecutor' or 'None'"
         raise TypeError(detail)
 
+    if not isinstance(chunksize, int):
+        detail = "'chunksize' must be 'int'"
+        raise TypeError(detail)
+
+    if chunksize <= 0:
+        detail = "'chunksize' must be positive"
+        raise ValueError(detail)
+
+    if max_latency is not None and not isinstance(max_latency, float):
+        detail = "'max_latency' must be 'float' or 'None'"
+        raise TypeError(detail)
+
+    if max_latency is not None and max_latency < 0.0:
+        detail = "'max_latency' must be non-negative"
+        raise ValueError(detail)
+
+    if mode not in {"executor", "thread"}:
+        detail = "'mode' must be 'executor' or 'thread'"
+        raise ValueError(detail)
+
+    if not isinstance(maxsize, int):
+        detail = "'maxsize' must be 'int'"
+        raise TypeError(detail)
+
+    if maxsize <= 0:
+        detail = "'maxsize' must be positive"
+        raise ValueError(detail)
+
+    if mode == "thread" and (executor is not None or chunksize != 1 or max_latency is not None):
+        detail = "'executor', 'chunksize' and 'max_latency' are not supported if mode='thread'"
+        raise ValueError(detail)
+
     iterator = iter(iterable)
-    return AnextifyIterator(iterator, executor)
 
+    if mode == "thread":
+        return AnextifyThreadIterator(iterator, maxsize)
 
-@dataclass(repr=False)
-class AnextifyIterator(AsyncIterator[T]):
+    return AnextifyIterator(iterator, executor, chunksize, max_latency)
+
+
+@dataclass(repr=False, slots=True)
+class AnextifyIterator(AcloseableIterator[T]):
     """An asynchronous iterator."""
 
     iterator: Iterator[T]
     executor: ThreadPoolExecutor | None
+    chunksize: int
+    max_latency: float | None
+    _finished_flg: bool = field(init=False)
+    _exhausted_flg: bool = field(init=False)
+    _exception: Exception | None = field(init=False)
+    _buffer: deque[T] = field(init=False)
+    _apull: Callable[[], Awaitable[bool]] = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._finished_flg: bool = False
+        self._finished_flg = False
+        self._exhausted_flg = False
+        self._exception = None
+        self._buffer = deque()
+        self._apull = awaitify(self._pull, executor=self.executor)
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -75,18 +155,232 @@ class AnextifyIterator(AsyncIterator[T]):
         if self._finished_flg:
             raise StopAsyncIteration
 
-        func = partial(next, self.iterator, ...)
-        afunc = awaitify(func, executor=self.executor)
+        if not self._buffer and not self._exhausted_flg and self._exception is None:
+            try:
+                self._exhausted_flg = await self._apull()
 
-        try:
-            item = await afunc()
+            except Exception as exception:
+                self._exception = exception
+
+            except BaseException:
+                self._finished_flg = True
+                self._buffer.clear()
+                raise
+
+        if self._buffer:
+            return self._buffer.popleft()
+
+        self._finished_flg = True
+
+        if self._exception is not None:
+            deferred, self._exception = self._exception, None
+            raise deferred
+
+        raise StopAsyncIteration
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        item = await self.__anext__()
+
+        count = min(max_n - 1, len(self._buffer))
+        return [item, *(self._buffer.popleft() for _ in range(count))]
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the iterator."""
+        self._finished_flg = True
+        self._exception = None
+        self._buffer.clear()
+
+    def _pull(self) -> bool:
+        """Pull the next chunk into the buffer.
+
+        Returns
+        -------
+        bool
+            :obj:`True` if the iterator is exhausted, :obj:`False` otherwise.
+        """
+        deadline = None if self.max_latency is None else monotonic() + self.max_latency
+
+        for _ in range(self.chunksize):
+            item = next(self.iterator, ...)
+            if item is ...:
+                return True
+
+            self._buffer.append(item)
+
+            if deadline is not None and monotonic() >= deadline:
+                break
+
+        return False
+
+
+@dataclass(repr=False, slots=True)
+class AnextifyThreadIterator(AcloseableIterator[T]):
+    """An asynchronous iterator."""
+
+    iterator: Iterator[T]
+    maxsize: int
+    _started_flg: bool = field(init=False)
+    _finished_flg: bool = field(init=False)
+    _channel: "AnextifyChannel[T]" = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._started_flg = False
+        self._finished_flg = False
+        self._channel = AnextifyChannel(self.iterator, self.maxsize)
 
-        except (StopAsyncIteration, BaseException):
-            self._finished_flg = True
-            raise
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
 
-        if item is ...:
-            self._finished_flg = True
+    async def __anext__(self) -> T:
+        """Return the next item."""
+        if self._finished_flg:
             raise StopAsyncIteration
 
-        return item
+        channel = self._channel
+
+        if not self._started_flg:
+            self._started_flg = True
+            channel.loop = get_running_loop()
+            thread = Thread(target=channel.produce, name="aioplus-anextify", daemon=True)
+            thread.start()
+
+        while True:
+            with channel.condition:
+                if channel.buffer:
+                    item = channel.buffer.popleft()
+                    if len(channel.buffer) == self.maxsize - 1:
+                        channel.condition.notify()
+                    return item
+
+                if channel.exhausted:
+                    break
+
+                waiter = channel.waiter = get_running_loop().create_future()
+
+            try:
+                await waiter
+
+            except BaseException:
+                self.close()
+                raise
+
+        self.close()
+
+        if channel.exception is not None:
+            deferred, channel.exception = channel.exception, None
+            raise deferred
+
+        raise StopAsyncIteration
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        item = await self.__anext__()
+        channel = self._channel
+
+        with channel.condition:
+            count = min(max_n - 1, len(channel.buffer))
+            items = [item, *(channel.buffer.popleft() for _ in range(count))]
+
+            if count:
+                channel.condition.notify()
+
+        return items
+
+    def __del__(self) -> None:
+        """Call the destructor."""
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the iterator."""
+        self._finished_flg = True
+        self._channel.close()
+
+
+@dataclass(repr=False, slots=True)
+class AnextifyChannel(Generic[T]):
+    """The state shared by :class:`AnextifyThreadIterator` and its thread.
+
+    Notes
+    -----
+    * The thread only holds the channel, never the iterator. An abandoned iterator is garbage
+      collected, and its destructor closes the channel, which stops the thread.
+    """
+
+    iterator: Iterator[T]
+    maxsize: int
+    closed: bool = field(init=False)
+    exhausted: bool = field(init=False)
+    exception: BaseException | None = field(init=False)
+    buffer: deque[T] = field(init=False)
+    loop: AbstractEventLoop | None = field(init=False)
+    waiter: Future[None] | None = field(init=False)
+    condition: Condition = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self.closed = False
+        self.exhausted = False
+        self.exception = None
+        self.buffer = deque()
+        self.loop = None
+        self.waiter = None
+        self.condition = Condition()
+
+    def close(self) -> None:
+        """Stop the thread after its current item."""
+        with self.condition:
+            self.closed = True
+            self.buffer.clear()
+            self.waiter = None
+            self.condition.notify()
+
+    def produce(self) -> None:
+        """Drain the iterator into the buffer."""
+        try:
+            for item in self.iterator:
+                with self.condition:
+                    while len(self.buffer) >= self.maxsize and not self.closed:
+                        self.condition.wait()
+
+                    if self.closed:
+                        return
+
+                    self.buffer.append(item)
+                    self._wake()
+
+        except BaseException as exception:
+            with self.condition:
+                self.exception = exception
+
+        finally:
+            with self.condition:
+                self.exhausted = True
+                self._wake()
+
+    def _wake(self) -> None:
+        """Wake up the waiting consumer, if any."""
+        if self.loop is None or self.waiter is None:
+            return
+
+        waiter, self.waiter = self.waiter, None
+
+        # The event loop may already be closed
+        with suppress(RuntimeError):
+            self.loop.call_soon_threadsafe(self._resolve, waiter)
+
+    @staticmethod
+    def _resolve(waiter: Future[None], /) -> None:
+        """Resolve the waiter."""
+        if not waiter.done():
+            waiter.set_result(None)
@@ -0,0 +1,102 @@
+from collections.abc import AsyncIterable, Callable
+from typing import Any, TypeAlias, TypeVar, overload
+
+from aioplus.internal.utils.heaps import aselect
+from aioplus.internal.utils.typing import SupportsDunderGT, SupportsDunderLT
+
+
+T = TypeVar("T")
+D = TypeVar("D")
+
+SupportsRichComparison: TypeAlias = SupportsDunderLT[Any] | SupportsDunderGT[Any]
+SupportsRichComparisonT = TypeVar("SupportsRichComparisonT", bound=SupportsRichComparison)
+
+
+@overload
+async def ansmallest(
+    iterable: AsyncIterable[SupportsRichComparisonT],
+    /,
+    *,
+    n: int,
+    key: None = None,
+) -> list[SupportsRichComparisonT]: ...
+
+
+@overload
+async def ansmallest(
+    iterable: AsyncIterable[T],
+    /,
+    *,
+    n: int,
+    key: Callable[[T], SupportsRichComparison],
+) -> list[T]: ...
+
+
+@overload
+async def ansmallest(
+    iterable: AsyncIterable[SupportsRichComparisonT],
+    /,
+    *,
+    n: int,
+    key: None = None,
+    default: D,
+) -> list[SupportsRichComparisonT] | D: ...
+
+
+@overload
+async def ansmallest(
+    iterable: AsyncIterable[T],
+    /,
+    *,
+    n: int,
+    key: Callable[[T], SupportsRichComparison],
+    default: D,
+) -> list[T] | D: ...
+
+
+async def ansmallest(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    n: int,
+    key: Callable[[Any], Any] | None = None,
+    default: Any = ...,
+) -> Any:
+    """Return the ``n`` smallest items in ``aiterable``.
+
+    Parameters
+    ----------
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    n : int
+        The number of items.
+
+    key : Callable[[T], SupportsRichComparison], optional
+        A function that extracts a comparison key from each element in the iterable.
+
+    default : D, unset
+        A default value to return if the iterable is empty.
+
+    Returns
+    -------
+    list[T] | D
+        The smallest items, in ascending order.
+
+    Examples
+    --------
+    >>> aiterable = arange(23)
+    >>> await ansmallest(aiterable, n=3)
+    [0, 1, 2]
+
+    Notes
+    -----
+    * Only ``n`` items are kept in memory. The iterable is consumed in ``O(len * log(n))`` time;
+    * Equal items are returned in the order of ``aiterable``;
+    * If ``n == 0``, the iterable is not consumed and an empty list is returned.
+
+    See Also
+    --------
+    :func:`heapq.nsmallest`
+    """
+    return await aselect(aiterable, n=n, key=key, default=default, largest=False)
@@ -2,11 +2,13 @@ from collections.abc import AsyncIterable, AsyncIterator
 from typing import TypeVar
 
 from aioplus.internal.awindowed import awindowed
+from aioplus.internal.utils.instrumentation import instrumented
 
 
 T = TypeVar("T")
 
 
+@instrumented("apairwise")
 def apairwise(aiterable: AsyncIterable[T], /) -> AsyncIterator[tuple[T, T]]:
     """Return a sliding window of width ``n=2`` over ``aiterable``.
 
@@ -1,12 +1,15 @@
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 V = TypeVar("V")
 
 
+@instrumented("apostpend", upstream=slice(0, 1))
 def apostpend(aiterable: AsyncIterable[T], value: V, /) -> AsyncIterator[T | V]:
     """Yield elements in ``aiterable``, followed by ``value``.
 
@@ -36,16 +39,17 @@ def apostpend(aiterable: AsyncIterable[T], value: V, /) -> AsyncIterator[T | V]:
     return ApostpendIterator(aiterator, value)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class ApostpendIterator(AsyncIterator[T | V]):
     """An asynchronous iterator."""
 
     aiterator: AsyncIterator[T]
     value: V
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._finished_flg: bool = False
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -1,12 +1,15 @@
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 V = TypeVar("V")
 
 
+@instrumented("aprepend", upstream=slice(1, 2))
 def aprepend(value: V, aiterable: AsyncIterable[T], /) -> AsyncIterator[V | T]:
     """Yield ``value``, followed by elements in ``aiterable``.
 
@@ -36,17 +39,19 @@ def aprepend(value: V, aiterable: AsyncIterable[T], /) -> AsyncIterator[V | T]:
     return AprependIterator(value, aiterator)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AprependIterator(AsyncIterator[V | T]):
     """An asynchronous iterator."""
 
     value: V
     aiterator: AsyncIterator[T]
+    _started_flg: bool = field(init=False)
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._started_flg: bool = False
-        self._finished_flg: bool = False
+        self._started_flg = False
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
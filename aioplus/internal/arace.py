@@ -1,16 +1,15 @@
-import asyncio
-
-from asyncio import FIRST_COMPLETED, Task, create_task
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import EllipsisType
 from typing import TYPE_CHECKING, Self, TypeVar, overload
-from warnings import warn
 
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.tasks import TaskQueue
 from aioplus.internal.utils.typing import AcloseableIterator
 
 
 if TYPE_CHECKING:
-    from types import EllipsisType
+    from asyncio import Task
 
 
 T = TypeVar("T")
@@ -24,7 +23,12 @@ T6 = TypeVar("T6")
 
 
 @overload
-def arace(aiterable: AsyncIterable[T], /) -> AcloseableIterator[T]: ...
+def arace(
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    prefetch: int = 1,
+) -> AcloseableIterator[T]: ...
 
 
 @overload
@@ -32,6 +36,8 @@ def arace(
     aiterable1: AsyncIterable[T1],
     aiterable2: AsyncIterable[T2],
     /,
+    *,
+    prefetch: int = 1,
 ) -> AcloseableIterator[T1 | T2]: ...
 
 
@@ -41,6 +47,8 @@ def arace(
     aiterable2: AsyncIterable[T2],
     aiterable3: AsyncIterable[T3],
     /,
+    *,
+    prefetch: int = 1,
 ) -> AcloseableIterator[T1 | T2 | T3]: ...
 
 
@@ -51,6 +59,8 @@ def arace(
     aiterable3: AsyncIterable[T3],
     aiterable4: AsyncIterable[T4],
     /,
+    *,
+    prefetch: int = 1,
 ) -> AcloseableIterator[T1 | T2 | T3 | T4]: ...
 
 
@@ -62,6 +72,8 @@ def arace(
     aiterable4: AsyncIterable[T4],
     aiterable5: AsyncIterable[T5],
     /,
+    *,
+    prefetch: int = 1,
 ) -> AcloseableIterator[T1 | T2 | T3 | T4 | T5]: ...
 
 
@@ -74,14 +86,17 @@ def arace(
     aiterable5: AsyncIterable[T5],
     aiterable6: AsyncIterable[T6],
     /,
+    *,
+    prefetch: int = 1,
 ) -> AcloseableIterator[T1 | T2 | T3 | T4 | T5 | T6]: ...
 
 
 @overload
-def arace(*aiterables: AsyncIterable[T]) -> AcloseableIterator[T]: ...
+def arace(*aiterables: AsyncIterable[T], prefetch: int = 1) -> AcloseableIterator[T]: ...
 
 
-def arace(*aiterables: AsyncIterable[T]) -> AcloseableIterator[T]:
+@instrumented("arace")
+def arace(*aiterables: AsyncIterable[T], prefetch: int = 1) -> AcloseableIterator[T]:
     """Iterate ``*aiterables``, returning values as they become available.
 
     Parameters
@@ -89,6 +104,10 @@ def arace(*aiterables: AsyncIterable[T]) -> AcloseableIterator[T]:
     *aiterables : AsyncIterable[T]
         The asynchronous iterables.
 
+    prefetch : int, default 1
+        The maximum number of items pulled ahead of the consumer from each asynchronous iterable.
+        Items of the same iterable are always returned in order.
+
     Returns
     -------
     AcloseableIterator[T]
@@ -100,12 +119,15 @@ def arace(*aiterables: AsyncIterable[T]) -> AcloseableIterator[T]:
     >>> nums2 = arange(3, 6)
     >>> nums3 = arange(6, 9)
     >>> [num async for num in arace(nums1, nums2, nums3)]
-    [0, 6, 3, 1, 4, 7, 5, 2, 8]
+    [0, 3, 6, 1, 4, 7, 2, 5, 8]
 
     Notes
     -----
     * It is recommended to explicitly close this iterator using ``aclose()``. Otherwise, warnings
-      about unawaited tasks may be emitted.
+      about unawaited tasks may be emitted;
+    * Each asynchronous iterable is still pulled sequentially. If ``prefetch`` is greater than
+      ``1``, the next pull starts as soon as the previous one completes, until ``prefetch`` items
+      are waiting to be consumed.
     """
     if not aiterables:
         detail = "'*aiterables' must be non-empty"
@@ -116,21 +138,35 @@ def arace(*aiterables: AsyncIterable[T]) -> AcloseableIterator[T]:
             detail = "'*aiterables' must be 'AsyncIterable'"
             raise TypeError(detail)
 
+    if not isinstance(prefetch, int):
+        detail = "'prefetch' must be 'int'"
+        raise TypeError(detail)
+
+    if prefetch <= 0:
+        detail = "'prefetch' must be positive"
+        raise ValueError(detail)
+
     aiterators = [aiter(aiterable) for aiterable in aiterables]
-    return AraceIterator(aiterators)
+    return AraceIterator(aiterators, prefetch)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AraceIterator(AcloseableIterator[T]):
     """An asynchronous iterator."""
 
     aiterators: list[AsyncIterator[T]]
+    prefetch: int
+    _started_flg: bool = field(init=False)
+    _counts: list[int] = field(init=False)
+    _idle: set[int] = field(init=False)
+    _tasks: TaskQueue[int, T | EllipsisType] = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._started_flg: bool = False
-        self._pending: dict[Task[T | EllipsisType], int] = {}
-        self._done: dict[Task[T | EllipsisType], int] = {}
+        self._started_flg = False
+        self._counts = [0] * len(self.aiterators)
+        self._idle = set()
+        self._tasks = TaskQueue("arace", self._on_done)
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -142,21 +178,20 @@ class AraceIterator(AcloseableIterator[T]):
             self._started_flg = True
             self._schedule_all()
 
-        if not (count := len(self._pending) + len(self._done)):
+        if not (count := len(self._tasks)):
             raise StopAsyncIteration
 
         exceptions: list[Exception] = []
         base_exceptions: list[BaseException] = []
 
         for _ in range(count):
-            if (base_exceptions or exceptions) and self._pending:
-                self._cancel_all()
-                await self._wait_all()
+            if (base_exceptions or exceptions) and self._tasks.pending:
+                self._tasks.cancel_all()
+                await self._tasks.wait_all()
 
-            if not self._done:
-                await self._wait_once()
+            await self._tasks.wait_once()
 
-            task, index = self._done.popitem()
+            task, index = self._tasks.popleft()
             if task.cancelled():
                 continue
 
@@ -175,7 +210,7 @@ class AraceIterator(AcloseableIterator[T]):
 
             else:
                 if not base_exceptions and not exceptions and (maybe_result is not ...):
-                    self._schedule_once(index)
+                    self._consume_once(index)
                     return maybe_result
 
         if base_exceptions:
@@ -194,74 +229,46 @@ class AraceIterator(AcloseableIterator[T]):
 
     async def aclose(self) -> None:
         """Close the iterator."""
-        if self._pending:
-            self._cancel_all()
-            await self._wait_all()
+        if self._tasks.pending:
+            self._tasks.cancel_all()
+            await self._tasks.wait_all()
 
         self.close()
 
     def close(self) -> None:
         """Close the iterator."""
-        for task in list(self._pending):
-            if task.done():
-                index = self._pending.pop(task)
-                self._done[task] = index
-
-        if tasks := list(self._pending):
-            detail = f"arace.close(): task(-s) will never be awaited: {tasks!r}"
-            warn(detail, RuntimeWarning, stacklevel=2)
-
-        base_exceptions: list[BaseException] = []
-
-        while self._done:
-            task, _ = self._done.popitem()
-            try:
-                if not task.cancelled():
-                    task.result()
-
-            except BaseExceptionGroup as group:
-                base_exceptions.extend(group.exceptions)
-            except BaseException as exception:
-                base_exceptions.append(exception)
+        self._tasks.close()
+        self._idle.clear()
+
+    def _consume_once(self, index: int, /) -> None:
+        """Release a prefetched item of the asynchronous iterator."""
+        self._counts[index] -= 1
+        if index in self._idle:
+            self._idle.discard(index)
+            self._schedule_once(index)
 
-        if base_exceptions:
-            detail = f"arace.close(): base exception(-s) occurred: {base_exceptions!r}"
-            warn(detail, RuntimeWarning, stacklevel=2)
+    def _on_done(self, task: "Task[T | EllipsisType]", index: int, /) -> None:
+        """Pull the asynchronous iterator ahead, if allowed."""
+        if self._tasks.stopped or task.cancelled() or task.exception() is not None:
+            return
 
-        self._pending.clear()
-        self._done.clear()
+        if task.result() is ...:
+            return
 
-    def _cancel_all(self) -> None:
-        """Cancel all pending tasks."""
-        for task in self._pending:
-            if not task.done():
-                task.cancel()
+        if self._counts[index] < self.prefetch:
+            self._schedule_once(index)
+        else:
+            self._idle.add(index)
 
     def _schedule_once(self, index: int, /) -> None:
         """Schedule the asynchronous iterator."""
         aiterator = self.aiterators[index]
         coroutine = anext(aiterator, ...)
-        task = create_task(coroutine)
-        self._pending[task] = index
+        self._counts[index] += 1
+        self._tasks.schedule(coroutine, index)
 
     def _schedule_all(self) -> None:
         """Schedule all asynchronous iterators."""
         count = len(self.aiterators)
         for index in range(count):
             self._schedule_once(index)
-
-    async def _wait_all(self) -> None:
-        """Wait until all tasks are done."""
-        if self._pending:
-            done, _ = await asyncio.wait(self._pending)
-            for task in done:
-                index = self._pending.pop(task)
-                self._done[task] = index
-
-    async def _wait_once(self) -> None:
-        """Wait until at least one task is done."""
-        if self._pending:
-            done, _ = await asyncio.wait(self._pending, return_when=FIRST_COMPLETED)
-            for task in done:
-                index = self._pending.pop(task)
-                self._done[task] = index
@@ -1,27 +1,52 @@
 import asyncio
 
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, overload
 
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.yielding import Yielder
+from aioplus.internal.yield_policy import YieldPolicy
+
 
 @overload
-def arange(stop: int, /) -> AsyncIterator[int]: ...
+def arange(
+    stop: int,
+    /,
+    *,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[int]: ...
 
 
 @overload
-def arange(start: int, stop: int, /) -> AsyncIterator[int]: ...
+def arange(
+    start: int,
+    stop: int,
+    /,
+    *,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[int]: ...
 
 
 @overload
-def arange(start: int, stop: int, step: int, /) -> AsyncIterator[int]: ...
+def arange(
+    start: int,
+    stop: int,
+    step: int,
+    /,
+    *,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[int]: ...
 
 
+@instrumented("arange")
 def arange(
     start: int,
     stop: int | None = None,
     step: int | None = None,
     /,
+    *,
+    yield_policy: YieldPolicy | None = None,
 ) -> AsyncIterator[int]:
     """Iterate a range of integers.
 
@@ -39,6 +64,10 @@ def arange(
         The difference between consecutive values. Defaults to ``1`` if not specified. May be
         negative to produce a decreasing sequence.
 
+    yield_policy : YieldPolicy, optional
+        The policy of yielding control to the event loop. If :obj:`None`, the default policy set by
+        :func:`aioplus.yield_policy` is used.
+
     Returns
     -------
     AsyncIterator[int]
@@ -81,16 +110,23 @@ def arange(
         detail = "'step' must not be zero"
         raise ValueError(detail)
 
-    return ArangeIterator(start, stop, step)
+    if yield_policy is not None and not isinstance(yield_policy, YieldPolicy):
+        detail = "'yield_policy' must be 'YieldPolicy' or 'None'"
+        raise TypeError(detail)
+
+    yielder = Yielder.from_policy(yield_policy)
+    return ArangeIterator(start, stop, step, yielder)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class ArangeIterator(AsyncIterator[int]):
     """An asynchronous iterator."""
 
     start: int
     stop: int
     step: int
+    yielder: Yielder
+    _next_value: int = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
@@ -112,6 +148,22 @@ class ArangeIterator(AsyncIterator[int]):
         self._next_value += self.step
 
         # Move to the next coroutine!
-        await asyncio.sleep(0.0)
+        if self.yielder.due():
+            await asyncio.sleep(0.0)
 
         return value
+
+    async def __anext_batch__(self, max_n: int, /) -> list[int]:
+        """Return up to ``max_n`` next items."""
+        values = range(self._next_value, self.stop, self.step)[:max_n]
+
+        if not values:
+            raise StopAsyncIteration
+
+        self._next_value = values[-1] + self.step
+
+        # Move to the next coroutine!
+        if self.yielder.due(len(values)):
+            await asyncio.sleep(0.0)
+
+        return list(values)
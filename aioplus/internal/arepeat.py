@@ -1,14 +1,25 @@
 import asyncio
 
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.yielding import Yielder
+from aioplus.internal.yield_policy import YieldPolicy
+
 
 T = TypeVar("T")
 
 
-def arepeat(obj: T, /, *, times: int | None = None) -> AsyncIterator[T]:
+@instrumented("arepeat")
+def arepeat(
+    obj: T,
+    /,
+    *,
+    times: int | None = None,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[T]:
     """Return the same object repeatedly.
 
     Parameters
@@ -19,6 +30,10 @@ def arepeat(obj: T, /, *, times: int | None = None) -> AsyncIterator[T]:
     times : int, optional
         The number of repetitions. If :obj:`None`, then the iterable will be infinite.
 
+    yield_policy : YieldPolicy, optional
+        The policy of yielding control to the event loop. If :obj:`None`, the default policy set by
+        :func:`aioplus.yield_policy` is used.
+
     Returns
     -------
     AsyncIterator[T]
@@ -41,19 +56,26 @@ def arepeat(obj: T, /, *, times: int | None = None) -> AsyncIterator[T]:
         detail = "'times' must be non-negative"
         raise ValueError(detail)
 
-    return ArepeatIterator(obj, times)
+    if yield_policy is not None and not isinstance(yield_policy, YieldPolicy):
+        detail = "'yield_policy' must be 'YieldPolicy' or 'None'"
+        raise TypeError(detail)
+
+    yielder = Yielder.from_policy(yield_policy)
+    return ArepeatIterator(obj, times, yielder)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class ArepeatIterator(AsyncIterator[T]):
     """An asynchronous iterator."""
 
     obj: T
     times: int | None
+    yielder: Yielder
+    _count: int = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._count: int = 0
+        self._count = 0
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -67,6 +89,22 @@ class ArepeatIterator(AsyncIterator[T]):
         self._count += 1
 
         # Move to the next coroutine!
-        await asyncio.sleep(0.0)
+        if self.yielder.due():
+            await asyncio.sleep(0.0)
 
         return self.obj
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        count = max_n if self.times is None else min(max_n, self.times - self._count)
+
+        if count <= 0:
+            raise StopAsyncIteration
+
+        self._count += count
+
+        # Move to the next coroutine!
+        if self.yielder.due(count):
+            await asyncio.sleep(0.0)
+
+        return [self.obj] * count
@@ -1,14 +1,25 @@
 import asyncio
 
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.yielding import Yielder
+from aioplus.internal.yield_policy import YieldPolicy
+
 
 T = TypeVar("T")
 
 
-def areversed(aiterable: AsyncIterable[T], /) -> AsyncIterator[T]:
+@instrumented("areversed")
+def areversed(
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[T]:
     """Return reversed ``aiterable``.
 
     Parameters
@@ -16,6 +27,10 @@ def areversed(aiterable: AsyncIterable[T], /) -> AsyncIterator[T]:
     aiterable : AsyncIterable[T]
         The asynchronous iterable.
 
+    yield_policy : YieldPolicy, optional
+        The policy of yielding control to the event loop. If :obj:`None`, the default policy set by
+        :func:`aioplus.yield_policy` is used.
+
     Returns
     -------
     AsyncIterator[T]
@@ -35,21 +50,30 @@ def areversed(aiterable: AsyncIterable[T], /) -> AsyncIterator[T]:
         detail = "'aiterable' must be 'AsyncIterable'"
         raise TypeError(detail)
 
+    if yield_policy is not None and not isinstance(yield_policy, YieldPolicy):
+        detail = "'yield_policy' must be 'YieldPolicy' or 'None'"
+        raise TypeError(detail)
+
     aiterator = aiter(aiterable)
-    return AreversedIterator(aiterator)
+    yielder = Yielder.from_policy(yield_policy)
+    return AreversedIterator(aiterator, yielder)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AreversedIterator(AsyncIterator[T]):
     """A asynchronous iterator."""
 
     aiterator: AsyncIterator[T]
+    yielder: Yielder
+    _started_flg: bool = field(init=False)
+    _finished_flg: bool = field(init=False)
+    _stack: list[T] = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._started_flg: bool = False
-        self._finished_flg: bool = False
-        self._stack: list[T] = []
+        self._started_flg = False
+        self._finished_flg = False
+        self._stack = []
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -57,27 +81,60 @@ class AreversedIterator(AsyncIterator[T]):
 
     async def __anext__(self) -> T:
         """Return the next item."""
+        await self._start()
+
+        if not self._stack:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        item = self._stack.pop()
+
+        # Move to the next coroutine!
+        if self.yielder.due():
+            await asyncio.sleep(0.0)
+
+        return item
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        await self._start()
+
+        if not self._stack:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        count = min(max_n, len(self._stack))
+        items = self._stack[-count:]
+        items.reverse()
+        del self._stack[-count:]
+
+        # Move to the next coroutine!
+        if self.yielder.due(len(items)):
+            await asyncio.sleep(0.0)
+
+        return items
+
+    async def _start(self) -> None:
+        """Consume ``aiterator`` on the first call."""
         if self._finished_flg:
             raise StopAsyncIteration
 
         try:
             if not self._started_flg:
                 self._started_flg = True
-                async for item in self.aiterator:
-                    self._stack.append(item)
+                await self._consume()
 
         except BaseException:
             self._finished_flg = True
             self._stack.clear()
             raise
 
-        if not self._stack:
-            self._finished_flg = True
-            raise StopAsyncIteration
-
-        item = self._stack.pop()
-
-        # Move to the next coroutine!
-        await asyncio.sleep(0.0)
+    async def _consume(self) -> None:
+        """Consume ``aiterator``, by batches if supported."""
+        if supports_anext_batch(self.aiterator):
+            while items := await anext_batch(self.aiterator):
+                self._stack.extend(items)
+            return
 
-        return item
+        async for item in self.aiterator:
+            self._stack.append(item)
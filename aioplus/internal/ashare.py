@@ -0,0 +1,355 @@
+from asyncio import Event, QueueFull, Task, sleep, wait
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+from typing import Generic, Literal, Self, TypeVar
+from weakref import WeakSet
+
+from aioplus.internal.utils.batching import BATCH_SIZE, anext_batch
+from aioplus.internal.utils.tasks import spawn
+from aioplus.internal.utils.typing import AcloseableIterator
+
+
+T = TypeVar("T")
+
+
+def ashare(
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    maxsize: int = 1024,
+    overflow: Literal["block", "drop", "disconnect"] = "block",
+) -> "AsyncShare[T]":
+    """Broadcast ``aiterable`` to any number of subscribers.
+
+    Parameters
+    ----------
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    maxsize : int, default 1024
+        The maximum number of items queued per subscriber.
+
+    overflow : {'block', 'drop', 'disconnect'}, default 'block'
+        If ``'block'``, ``aiterable`` is not pulled until every subscriber has room for the next
+        item. If ``'drop'``, the oldest items of a full subscriber are dropped. If ``'disconnect'``,
+        a full subscriber is unsubscribed, and raises :exc:`asyncio.QueueFull` once it has returned
+        its queued items.
+
+    Returns
+    -------
+    AsyncShare[T]
+        The broadcaster.
+
+    Examples
+    --------
+    >>> share = ashare(arange(4))
+    >>> aiterator1 = share.subscribe()
+    >>> aiterator2 = share.subscribe()
+    >>> [num async for num in aiterator1]
+    [0, 1, 2, 3]
+    >>> [num async for num in aiterator2]
+    [0, 1, 2, 3]
+
+    See Also
+    --------
+    :class:`aioplus.AsyncShare`
+    """
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    if not isinstance(maxsize, int):
+        detail = "'maxsize' must be 'int'"
+        raise TypeError(detail)
+
+    if maxsize <= 0:
+        detail = "'maxsize' must be positive"
+        raise ValueError(detail)
+
+    if overflow not in {"block", "drop", "disconnect"}:
+        detail = "'overflow' must be 'block', 'drop' or 'disconnect'"
+        raise ValueError(detail)
+
+    aiterator = aiter(aiterable)
+    return AsyncShare(aiterator, maxsize, overflow)
+
+
+@dataclass(repr=False, slots=True)
+class AsyncShare(AsyncIterable[T]):
+    """A hot asynchronous stream, broadcast to its subscribers.
+
+    A single task pulls the asynchronous iterator and puts each item into the queue of every
+    current subscriber. Subscribers only see the items pulled after they have subscribed.
+
+    Examples
+    --------
+    >>> async with ashare(arange(4)) as share:
+    ...     [num async for num in share]
+    [0, 1, 2, 3]
+
+    Notes
+    -----
+    * The task is started by the first subscription. Items pulled while there are no subscribers
+      are lost;
+    * The task yields control to the event loop after each pull, so subscribers get a chance to
+      run even if the asynchronous iterator never suspends;
+    * Iterating the broadcaster subscribes to it, so each ``async for`` is a new subscription;
+    * Subscribers are held by weak references. A subscriber that is garbage collected is
+      unsubscribed, so it never blocks the others;
+    * If the asynchronous iterator raises an exception, every subscriber raises it once it has
+      returned its queued items. Subscribers added later raise it immediately.
+
+    See Also
+    --------
+    :func:`aioplus.ashare`
+    """
+
+    aiterator: AsyncIterator[T]
+    maxsize: int
+    overflow: str
+    _hub: "AshareHub[T]" = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._hub = AshareHub(self.aiterator, self.maxsize, self.overflow)
+
+    def __aiter__(self) -> AcloseableIterator[T]:
+        """Return an asynchronous iterator."""
+        return self.subscribe()
+
+    async def __aenter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit the context manager."""
+        await self.aclose()
+
+    @property
+    def subscribers(self) -> int:
+        """Return the number of subscribers."""
+        return len(self._hub.subscribers)
+
+    def subscribe(self) -> AcloseableIterator[T]:
+        """Return an asynchronous iterator over the items pulled from now on.
+
+        Notes
+        -----
+        * Closing the asynchronous iterator unsubscribes it. Its queued items are discarded.
+        """
+        return self._hub.subscribe()
+
+    async def aclose(self) -> None:
+        """Stop pulling the asynchronous iterator.
+
+        Notes
+        -----
+        * Subscribers stop once they have returned their queued items.
+        """
+        await self._hub.aclose()
+
+
+@dataclass(repr=False, slots=True)
+class AshareHub(Generic[T]):
+    """The state shared by :class:`AsyncShare` and its subscribers."""
+
+    aiterator: AsyncIterator[T]
+    maxsize: int
+    overflow: str
+    finished: bool = field(init=False)
+    exception: Exception | None = field(init=False)
+    subscribers: "WeakSet[AshareIterator[T]]" = field(init=False)
+    space: Event = field(init=False)
+    _pump: Task[None] | None = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self.finished = False
+        self.exception = None
+        self.subscribers = WeakSet()
+        self.space = Event()
+        self._pump = None
+
+    def subscribe(self) -> "AshareIterator[T]":
+        """Add a subscriber, starting the pump if needed."""
+        subscriber = AshareIterator(self)
+
+        if not self.finished:
+            self.subscribers.add(subscriber)
+
+        if self._pump is None and not self.finished:
+            self._pump = spawn(self._run())
+
+        return subscriber
+
+    def unsubscribe(self, subscriber: "AshareIterator[T]", /) -> None:
+        """Remove a subscriber, waking up the pump if it waits for room."""
+        self.subscribers.discard(subscriber)
+        self.space.set()
+
+    async def aclose(self) -> None:
+        """Cancel the pump."""
+        if self._pump is not None:
+            self._pump.cancel()
+            await wait((self._pump,))
+
+        self._finish()
+
+    async def _run(self) -> None:
+        """Pull the asynchronous iterator, putting the items into the queues of the subscribers."""
+        try:
+            while items := await anext_batch(self.aiterator, await self._reserve()):
+                for subscriber in tuple(self.subscribers):
+                    subscriber.put(items)
+
+                await sleep(0)
+
+        except Exception as exception:
+            self.exception = exception
+
+        finally:
+            self._finish()
+
+    async def _reserve(self) -> int:
+        """Return the number of items to pull, waiting for room if ``overflow='block'``.
+
+        Notes
+        -----
+        * Otherwise, at least one item is pulled, even if a subscriber is full. Pulling more than
+          the room of every subscriber would overflow it only because the items come in batches.
+        """
+        if self.overflow != "block":
+            return min(max(self._free(), 1), BATCH_SIZE)
+
+        while (free := self._free()) <= 0:
+            self.space.clear()
+            await self.space.wait()
+
+        return min(free, BATCH_SIZE)
+
+    def _free(self) -> int:
+        """Return the smallest room among the subscribers."""
+        return min((sub.free for sub in self.subscribers), default=BATCH_SIZE)
+
+    def _finish(self) -> None:
+        """Wake up the subscribers, once the asynchronous iterator is done."""
+        self.finished = True
+        self._pump = None
+
+        for subscriber in tuple(self.subscribers):
+            subscriber.wake()
+
+
+@dataclass(repr=False, eq=False, slots=True, weakref_slot=True)
+class AshareIterator(AcloseableIterator[T]):
+    """An asynchronous iterator.
+
+    Notes
+    -----
+    * Subscribers are compared by identity, as they are kept in a :class:`weakref.WeakSet`.
+    """
+
+    hub: AshareHub[T]
+    _closed_flg: bool = field(init=False)
+    _disconnected_flg: bool = field(init=False)
+    _items: deque[T] = field(init=False)
+    _ready: Event = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._closed_flg = False
+        self._disconnected_flg = False
+        self._items = deque()
+        self._ready = Event()
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Return the next item."""
+        await self._wait()
+        return self._pop()
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        await self._wait()
+
+        count = min(max_n, len(self._items))
+        return [self._pop() for _ in range(count)]
+
+    def __del__(self) -> None:
+        """Call the destructor."""
+        self.close()
+
+    @property
+    def free(self) -> int:
+        """Return the number of items that can be queued."""
+        return self.hub.maxsize - len(self._items)
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the iterator."""
+        if self._closed_flg:
+            return
+
+        self._closed_flg = True
+        self._items.clear()
+        self.hub.unsubscribe(self)
+
+    def put(self, items: list[T], /) -> None:
+        """Queue the items, applying the overflow policy."""
+        maxsize = self.hub.maxsize
+        overflow = self.hub.overflow
+
+        if overflow == "disconnect" and (free := self.free) < len(items):
+            self._items.extend(items[:free])
+            self._disconnected_flg = True
+            self.hub.subscribers.discard(self)
+
+        else:
+            self._items.extend(items)
+
+            if overflow == "drop" and (excess := len(self._items) - maxsize) > 0:
+                for _ in range(excess):
+                    self._items.popleft()
+
+        self._ready.set()
+
+    def wake(self) -> None:
+        """Wake up the waiting consumers."""
+        self._ready.set()
+
+    async def _wait(self) -> None:
+        """Wait until an item is queued, raising if none will ever be."""
+        while not self._items:
+            if self._closed_flg:
+                raise StopAsyncIteration
+
+            if self._disconnected_flg:
+                self.close()
+                detail = "ashare(): the subscriber has been disconnected, its queue is full"
+                raise QueueFull(detail)
+
+            if self.hub.finished:
+                exception = self.hub.exception
+                self.close()
+
+                if exception is not None:
+                    raise exception
+
+                raise StopAsyncIteration
+
+            self._ready.clear()
+            await self._ready.wait()
+
+    def _pop(self) -> T:
+        """Return the oldest queued item, waking up the pump if it waits for room."""
+        if len(self._items) == self.hub.maxsize:
+            self.hub.space.set()
+
+        return self._items.popleft()
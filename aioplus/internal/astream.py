@@ -0,0 +1,588 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field, replace
+from typing import Any, Self, TypeVar, overload
+
+from aioplus.internal.utils.batching import BATCH_SIZE, anext_batch
+
+
+T = TypeVar("T")
+
+
+def astream(aiterable: AsyncIterable[T], /) -> "AsyncStream[T]":
+    """Start a fused pipeline over ``aiterable``.
+
+    Parameters
+    ----------
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    Returns
+    -------
+    AsyncStream[T]
+        The pipeline.
+
+    Examples
+    --------
+    >>> aiterable = arange(2003)
+    >>> [pair async for pair in astream(aiterable).window(2).enumerate().slice(4, 8)]
+    [(4, (4, 5)), (5, (5, 6)), (6, (6, 7)), (7, (7, 8))]
+
+    See Also
+    --------
+    :class:`aioplus.AsyncStream`
+    """
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    return AsyncStream((aiterable,))
+
+
+@dataclass(frozen=True, repr=False)
+class AsyncStream(AsyncIterable[T]):
+    """A pipeline of stages over asynchronous iterables.
+
+    Each method returns a new pipeline. Iterating a pipeline runs all of its stages in a single
+    iterator: the sources are pulled by batches, and the stages transform batches synchronously,
+    so there is no ``await`` per stage per item.
+
+    Examples
+    --------
+    >>> aiterable = arange(2003)
+    >>> [pair async for pair in astream(aiterable).window(2).enumerate().slice(4, 8)]
+    [(4, (4, 5)), (5, (5, 6)), (6, (6, 7)), (7, (7, 8))]
+
+    Notes
+    -----
+    * Slices are merged together and moved towards the sources where it does not change the result
+      (for example, below ``enumerate()``, ``window()`` and ``batched()`` if ``step == 1``). A slice
+      at the sources limits the number of items pulled;
+    * The sources are consumed by the first iteration, so a pipeline should be iterated once.
+
+    See Also
+    --------
+    :func:`aioplus.astream`
+    """
+
+    aiterables: tuple[AsyncIterable[Any], ...]
+    stages: tuple["Stage", ...] = ()
+
+    def __aiter__(self) -> "AsyncStreamIterator[T]":
+        """Return an asynchronous iterator."""
+        aiterators = [aiter(aiterable) for aiterable in self.aiterables]
+        stages = [replace(stage) for stage in self.stages]
+        return AsyncStreamIterator(aiterators, stages)
+
+    def batched(self, n: int) -> "AsyncStream[tuple[T, ...]]":
+        """Group items by batches of length ``n``.
+
+        Parameters
+        ----------
+        n : int
+            The batch size.
+
+        Returns
+        -------
+        AsyncStream[tuple[T, ...]]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.abatched`
+        """
+        if not isinstance(n, int):
+            detail = "'n' must be 'int'"
+            raise TypeError(detail)
+
+        if n <= 0:
+            detail = "'n' must be positive"
+            raise ValueError(detail)
+
+        return AsyncStream(self.aiterables, (*self.stages, BatchedStage(n)))
+
+    def chain(self, *aiterables: AsyncIterable[T]) -> "AsyncStream[T]":
+        """Append ``*aiterables`` after the items of the pipeline.
+
+        Parameters
+        ----------
+        *aiterables : AsyncIterable[T]
+            The asynchronous iterables.
+
+        Returns
+        -------
+        AsyncStream[T]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.achain`
+        """
+        for aiterable in aiterables:
+            if not isinstance(aiterable, AsyncIterable):
+                detail = "'*aiterables' must be 'AsyncIterable'"
+                raise TypeError(detail)
+
+        if not self.stages:
+            return AsyncStream((*self.aiterables, *aiterables))
+
+        return AsyncStream((self, *aiterables))
+
+    def enumerate(self, start: int = 0) -> "AsyncStream[tuple[int, T]]":
+        """Pair items with their indices.
+
+        Parameters
+        ----------
+        start : int, default 0
+            The starting index.
+
+        Returns
+        -------
+        AsyncStream[tuple[int, T]]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.aenumerate`
+        """
+        if not isinstance(start, int):
+            detail = "'start' must be 'int'"
+            raise TypeError(detail)
+
+        return AsyncStream(self.aiterables, (*self.stages, EnumerateStage(start)))
+
+    def head(self, n: int) -> "AsyncStream[T]":
+        """Keep the first ``n`` items.
+
+        Parameters
+        ----------
+        n : int
+            The number of items.
+
+        Returns
+        -------
+        AsyncStream[T]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.ahead`
+        """
+        if not isinstance(n, int):
+            detail = "'n' must be 'int'"
+            raise TypeError(detail)
+
+        if n < 0:
+            detail = "'n' must be non-negative"
+            raise ValueError(detail)
+
+        return AsyncStream(self.aiterables, push_slice(self.stages, SliceStage(0, n, 1)))
+
+    def pairwise(self) -> "AsyncStream[tuple[T, T]]":
+        """Return successive overlapping pairs of items.
+
+        Returns
+        -------
+        AsyncStream[tuple[T, T]]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.apairwise`
+        """
+        return AsyncStream(self.aiterables, (*self.stages, WindowStage(2)))
+
+    @overload
+    def slice(self, stop: int, /) -> "AsyncStream[T]": ...
+
+    @overload
+    def slice(self, start: int, stop: int, /) -> "AsyncStream[T]": ...
+
+    @overload
+    def slice(self, start: int, stop: int, step: int, /) -> "AsyncStream[T]": ...
+
+    def slice(
+        self,
+        start: int,
+        stop: int | None = None,
+        step: int | None = None,
+        /,
+    ) -> "AsyncStream[T]":
+        """Keep the selected items.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first item to include. If ``stop`` is :obj:`None`, treated as the end
+            index, and slicing starts from ``0``.
+
+        stop : int, optional
+            The index at which to stop (exclusive).
+
+        step : int, optional
+            The step between consecutives. Defaults to ``1``.
+
+        Returns
+        -------
+        AsyncStream[T]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.aislice`
+        """
+        if not isinstance(start, int):
+            detail = "'start' must be 'int'"
+            raise TypeError(detail)
+
+        if stop is not None and not isinstance(stop, int):
+            detail = "'stop' must be 'int'"
+            raise TypeError(detail)
+
+        if step is not None and not isinstance(step, int):
+            detail = "'step' must be 'int'"
+            raise TypeError(detail)
+
+        if stop is None and step is not None:
+            detail = "'step' is not specified but 'stop' is"
+            raise ValueError(detail)
+
+        if stop is None:
+            stop = start
+            start = 0
+
+        if step is None:
+            step = 1
+
+        if start < 0:
+            detail = "'start' must be non-negative"
+            raise ValueError(detail)
+
+        if stop < 0:
+            detail = "'stop' must be non-negative"
+            raise ValueError(detail)
+
+        if step <= 0:
+            detail = "'step' must be positive"
+            raise ValueError(detail)
+
+        return AsyncStream(self.aiterables, push_slice(self.stages, SliceStage(start, stop, step)))
+
+    def triplewise(self) -> "AsyncStream[tuple[T, T, T]]":
+        """Return successive overlapping triplets of items.
+
+        Returns
+        -------
+        AsyncStream[tuple[T, T, T]]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.atriplewise`
+        """
+        return AsyncStream(self.aiterables, (*self.stages, WindowStage(3)))
+
+    def window(self, n: int) -> "AsyncStream[tuple[T, ...]]":
+        """Return a sliding window of width ``n``.
+
+        Parameters
+        ----------
+        n : int
+            The width of the window.
+
+        Returns
+        -------
+        AsyncStream[tuple[T, ...]]
+            The pipeline.
+
+        See Also
+        --------
+        :func:`aioplus.awindowed`
+        """
+        if not isinstance(n, int):
+            detail = "'n' must be 'int'"
+            raise TypeError(detail)
+
+        if n <= 0:
+            detail = "'n' must be positive"
+            raise ValueError(detail)
+
+        return AsyncStream(self.aiterables, (*self.stages, WindowStage(n)))
+
+
+@dataclass(repr=False, slots=True)
+class AsyncStreamIterator(AsyncIterator[T]):
+    """An asynchronous iterator."""
+
+    aiterators: list[AsyncIterator[Any]]
+    stages: list["Stage"]
+    _finished_flg: bool = field(init=False)
+    _stack: list[AsyncIterator[Any]] = field(init=False)
+    _items: list[T] = field(init=False)
+    _index: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._finished_flg = False
+        self._stack = list(reversed(self.aiterators))
+        self._items = []
+        self._index = 0
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Return the next item."""
+        while self._index >= len(self._items):
+            await self._refill()
+
+        item = self._items[self._index]
+        self._index += 1
+
+        return item
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        while self._index >= len(self._items):
+            await self._refill()
+
+        items = self._items[self._index : self._index + max_n]
+        self._index += len(items)
+
+        return items
+
+    async def _refill(self) -> None:
+        """Run the next batch of the sources through the stages."""
+        if self._finished_flg:
+            raise StopAsyncIteration
+
+        self._items = []
+        self._index = 0
+
+        if any(stage.done for stage in self.stages):
+            self._finished_flg = True
+            self._items = self._finish()
+            return
+
+        max_n = BATCH_SIZE
+        if self.stages and isinstance(first := self.stages[0], SliceStage):
+            max_n = min(max_n, first.remaining)
+
+        try:
+            items = await self._pull(max_n)
+
+        except BaseException:
+            self._finished_flg = True
+            self._stack.clear()
+            raise
+
+        if not items:
+            self._finished_flg = True
+            self._items = self._finish()
+            return
+
+        for stage in self.stages:
+            items = stage.process(items)
+
+        self._items = items
+
+    async def _pull(self, max_n: int, /) -> list[Any]:
+        """Pull up to ``max_n`` items from the sources."""
+        while self._stack:
+            items = await anext_batch(self._stack[-1], max_n)
+            if items:
+                return items
+            self._stack.pop()
+
+        return []
+
+    def _finish(self) -> list[T]:
+        """Flush the stages that follow the last completed one."""
+        start = 0
+        for index, stage in enumerate(self.stages):
+            if stage.done:
+                start = index + 1
+
+        items: list[Any] = []
+        for stage in self.stages[start:]:
+            items = [*stage.process(items), *stage.finish()]
+
+        return items
+
+
+@dataclass(repr=False, slots=True)
+class Stage(ABC):
+    """A synchronous stage of a pipeline."""
+
+    done: bool = field(default=False, init=False)
+
+    @abstractmethod
+    def process(self, items: list[Any], /) -> list[Any]:
+        """Transform a batch of items."""
+
+    def finish(self) -> list[Any]:
+        """Return the items that are left once the input is exhausted."""
+        return []
+
+    def pushdown(
+        self,
+        stage: "SliceStage",  # noqa: ARG002
+        /,
+    ) -> tuple["SliceStage", "Stage"] | None:
+        """Return the equivalent slice before this stage and the stage after it, if possible."""
+        return None
+
+
+@dataclass(repr=False, slots=True)
+class BatchedStage(Stage):
+    """A stage that groups items by batches."""
+
+    n: int
+    _rest: list[Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._rest = []
+
+    def process(self, items: list[Any], /) -> list[Any]:
+        """Transform a batch of items."""
+        buffer = [*self._rest, *items] if self._rest else items
+        count = len(buffer) - len(buffer) % self.n
+        self._rest = buffer[count:]
+        return [tuple(buffer[index : index + self.n]) for index in range(0, count, self.n)]
+
+    def finish(self) -> list[Any]:
+        """Return the items that are left once the input is exhausted."""
+        rest, self._rest = self._rest, []
+        return [tuple(rest)] if rest else []
+
+    def pushdown(self, stage: "SliceStage", /) -> tuple["SliceStage", "Stage"] | None:
+        """Return the equivalent slice before this stage and the stage after it, if possible."""
+        if stage.step != 1:
+            return None
+
+        return SliceStage(stage.start * self.n, stage.stop * self.n, 1), self
+
+
+@dataclass(repr=False, slots=True)
+class EnumerateStage(Stage):
+    """A stage that pairs items with their indices."""
+
+    start: int
+    _next_index: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._next_index = self.start
+
+    def process(self, items: list[Any], /) -> list[Any]:
+        """Transform a batch of items."""
+        index = self._next_index
+        self._next_index += len(items)
+        return list(enumerate(items, index))
+
+    def pushdown(self, stage: "SliceStage", /) -> tuple["SliceStage", "Stage"] | None:
+        """Return the equivalent slice before this stage and the stage after it, if possible."""
+        if stage.step != 1:
+            return None
+
+        return stage, EnumerateStage(self.start + stage.start)
+
+
+@dataclass(repr=False, slots=True)
+class SliceStage(Stage):
+    """A stage that keeps the selected items."""
+
+    start: int
+    stop: int
+    step: int
+    _position: int = field(init=False)
+    _yield_index: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._position = 0
+        self._yield_index = self.start
+        self.done = self.start >= self.stop
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of items the stage may still take."""
+        return self.stop - self._position
+
+    def process(self, items: list[Any], /) -> list[Any]:
+        """Transform a batch of items."""
+        begin = self._position
+        end = self._position = begin + len(items)
+
+        if end >= self.stop:
+            self.done = True
+
+        if self._yield_index >= min(end, self.stop):
+            return []
+
+        picked = items[self._yield_index - begin : min(end, self.stop) - begin : self.step]
+        self._yield_index += len(picked) * self.step
+
+        return picked
+
+
+@dataclass(repr=False, slots=True)
+class WindowStage(Stage):
+    """A stage that returns a sliding window over items."""
+
+    n: int
+    _tail: list[Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._tail = []
+
+    def process(self, items: list[Any], /) -> list[Any]:
+        """Transform a batch of items."""
+        buffer = [*self._tail, *items] if self._tail else items
+        count = len(buffer) - self.n + 1
+        self._tail = buffer[max(count, 0) :]
+        return [tuple(buffer[index : index + self.n]) for index in range(count)]
+
+    def pushdown(self, stage: "SliceStage", /) -> tuple["SliceStage", "Stage"] | None:
+        """Return the equivalent slice before this stage and the stage after it, if possible."""
+        if stage.step != 1:
+            return None
+
+        return SliceStage(stage.start, stage.stop + self.n - 1, 1), self
+
+
+def push_slice(stages: tuple[Stage, ...], stage: SliceStage, /) -> tuple[Stage, ...]:
+    """Append the slice to the stages, moving it towards the sources where possible.
+
+    Parameters
+    ----------
+    stages : tuple[Stage, ...]
+        The stages.
+
+    stage : SliceStage
+        The slice.
+
+    Returns
+    -------
+    tuple[Stage, ...]
+        The new stages.
+    """
+    if not stages:
+        return (stage,)
+
+    *rest, last = stages
+
+    if isinstance(last, SliceStage):
+        start = last.start + stage.start * last.step
+        stop = min(last.stop, last.start + stage.stop * last.step)
+        step = last.step * stage.step
+        return push_slice(tuple(rest), SliceStage(start, max(start, stop), step))
+
+    if (pushed := last.pushdown(stage)) is None:
+        return (*stages, stage)
+
+    source_stage, last = pushed
+    return (*push_slice(tuple(rest), source_stage), last)
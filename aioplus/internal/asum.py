@@ -1,6 +1,11 @@
 from collections.abc import AsyncIterable
+from functools import reduce
+from operator import iadd
 from typing import Any, Literal, Protocol, TypeVar, overload
 
+from aioplus.internal.utils.arrays import ChunkReducer, sum_of
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
+from aioplus.internal.utils.summation import SUMMATORS
 from aioplus.internal.utils.typing import SupportsAdd, SupportsRAdd
 
 
@@ -16,13 +21,34 @@ SupportsSumNoDefaultT = TypeVar("SupportsSumNoDefaultT", bound=SupportsSumWithNo
 
 
 @overload
-async def asum(aiterable: AsyncIterable[bool | int], /, *, start: int = 0) -> int: ...
+async def asum(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    start: Any = 0,
+    flatten: bool = False,
+    mode: Literal["fsum"],
+) -> float: ...
+
+
+@overload
+async def asum(
+    aiterable: AsyncIterable[bool | int],
+    /,
+    *,
+    start: int = 0,
+    flatten: bool = False,
+    mode: Literal["plain", "kahan", "pairwise"] = "plain",
+) -> int: ...
 
 
 @overload
 async def asum(
     aiterable: AsyncIterable[SupportsSumNoDefaultT],
     /,
+    *,
+    flatten: bool = False,
+    mode: Literal["plain", "kahan", "pairwise"] = "plain",
 ) -> SupportsSumNoDefaultT | Literal[0]: ...
 
 
@@ -32,10 +58,19 @@ async def asum(
     /,
     *,
     start: AddableT2,
+    flatten: bool = False,
+    mode: Literal["plain", "kahan", "pairwise"] = "plain",
 ) -> AddableT1 | AddableT2: ...
 
 
-async def asum(aiterable: AsyncIterable[Any], /, *, start: Any = 0) -> Any:
+async def asum(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    start: Any = 0,
+    flatten: bool = False,
+    mode: Literal["plain", "fsum", "kahan", "pairwise"] = "plain",
+) -> Any:
     """Sum items of ``aiterable`` from left to right.
 
     Parameters
@@ -46,6 +81,16 @@ async def asum(aiterable: AsyncIterable[Any], /, *, start: Any = 0) -> Any:
     start : T
         The initial value.
 
+    flatten : bool, default False
+        If :obj:`True`, items implementing ``__array__()`` or the buffer protocol are treated as
+        chunks of elements, each reduced by a single vectorized call.
+
+    mode : {'plain', 'fsum', 'kahan', 'pairwise'}, default 'plain'
+        The summation algorithm. If ``'plain'``, items are added from left to right. If
+        ``'fsum'``, the sum is correctly rounded, as by :func:`math.fsum`. If ``'kahan'``, the
+        sum is compensated by the Kahan-Babuska-Neumaier algorithm. If ``'pairwise'``, items are
+        summed pairwise by blocks.
+
     Returns
     -------
     T
@@ -57,16 +102,48 @@ async def asum(aiterable: AsyncIterable[Any], /, *, start: Any = 0) -> Any:
     >>> await asum(aiterable)
     253
 
+    Notes
+    -----
+    * All modes consume the iterable in ``O(1)`` memory, except ``'pairwise'``, which keeps
+      ``O(log(n))`` block sums;
+    * If ``flatten=True``, chunks are summed without being copied into a list.
+
     See Also
     --------
     :func:`sum`
+    :func:`math.fsum`
     """
     if not isinstance(aiterable, AsyncIterable):
         detail = "'aiterable' must be 'AsyncIterable'"
         raise TypeError(detail)
 
+    if not isinstance(flatten, bool):
+        detail = "'flatten' must be 'bool'"
+        raise TypeError(detail)
+
+    if mode not in {"plain", "fsum", "kahan", "pairwise"}:
+        detail = "'mode' must be 'plain', 'fsum', 'kahan' or 'pairwise'"
+        raise ValueError(detail)
+
+    aiterator = aiter(aiterable)
+
+    if mode != "plain":
+        summator = SUMMATORS[mode](start)
+        await summator.aextend(aiterator, flatten=flatten)
+        return summator.result()
+
+    if flatten:
+        aiterator = ChunkReducer(aiterator, sum_of)
+
     total = start
-    async for item in aiterable:
+
+    if supports_anext_batch(aiterator):
+        while items := await anext_batch(aiterator):
+            # Not `sum()`: it is compensated for floats on Python 3.12+, unlike the loop below
+            total = reduce(iadd, items, total)
+        return total
+
+    async for item in aiterator:
         total += item
 
     return total
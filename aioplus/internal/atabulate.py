@@ -1,12 +1,15 @@
 from asyncio import iscoroutinefunction
 from collections.abc import AsyncIterator, Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 R = TypeVar("R")
 
 
+@instrumented("atabulate")
 def atabulate(afunc: Callable[[int], Awaitable[R]], /, *, start: int = 0) -> AsyncIterator[R]:
     """Return ``await afunc(0)``, ``await afunc(1)``, ``await afunc(2)``, etc.
 
@@ -41,16 +44,17 @@ def atabulate(afunc: Callable[[int], Awaitable[R]], /, *, start: int = 0) -> Asy
     return AtabulateIterator(afunc, start)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AtabulateIterator(AsyncIterator[R]):
     """An asynchronous iterator."""
 
     afunc: Callable[[int], Awaitable[R]]
     next: int
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._finished_flg: bool = False
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
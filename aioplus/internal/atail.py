@@ -2,14 +2,26 @@ import asyncio
 
 from collections import deque
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Self, TypeVar
 
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
+from aioplus.internal.utils.instrumentation import instrumented
+from aioplus.internal.utils.yielding import Yielder
+from aioplus.internal.yield_policy import YieldPolicy
+
 
 T = TypeVar("T")
 
 
-def atail(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[T]:
+@instrumented("atail")
+def atail(
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    n: int,
+    yield_policy: YieldPolicy | None = None,
+) -> AsyncIterator[T]:
     """Return the last ``n`` items of the ``aiterable``.
 
     Parameters
@@ -20,6 +32,10 @@ def atail(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[T]:
     n : int
         The number of items.
 
+    yield_policy : YieldPolicy, optional
+        The policy of yielding control to the event loop. If :obj:`None`, the default policy set by
+        :func:`aioplus.yield_policy` is used.
+
     Returns
     -------
     AsyncIterator[T]
@@ -43,22 +59,31 @@ def atail(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[T]:
         detail = "'n' must be non-negative"
         raise ValueError(detail)
 
+    if yield_policy is not None and not isinstance(yield_policy, YieldPolicy):
+        detail = "'yield_policy' must be 'YieldPolicy' or 'None'"
+        raise TypeError(detail)
+
     aiterator = aiter(aiterable)
-    return AtailIterator(aiterator, n)
+    yielder = Yielder.from_policy(yield_policy)
+    return AtailIterator(aiterator, n, yielder)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AtailIterator(AsyncIterator[T]):
     """An asynchronous iterator."""
 
-    aiterator: AsyncIterable[T]
+    aiterator: AsyncIterator[T]
     n: int
+    yielder: Yielder
+    _started_flg: bool = field(init=False)
+    _finished_flg: bool = field(init=False)
+    _deque: deque[T] = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._started_flg: bool = False
-        self._finished_flg: bool = False
-        self._deque: deque[T] = deque(maxlen=self.n)
+        self._started_flg = False
+        self._finished_flg = False
+        self._deque = deque(maxlen=self.n)
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -66,27 +91,58 @@ class AtailIterator(AsyncIterator[T]):
 
     async def __anext__(self) -> T:
         """Return the next item."""
+        await self._start()
+
+        if not self._deque:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        item = self._deque.popleft()
+
+        # Move to the next coroutine!
+        if self.yielder.due():
+            await asyncio.sleep(0.0)
+
+        return item
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        await self._start()
+
+        if not self._deque:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        count = min(max_n, len(self._deque))
+        items = [self._deque.popleft() for _ in range(count)]
+
+        # Move to the next coroutine!
+        if self.yielder.due(len(items)):
+            await asyncio.sleep(0.0)
+
+        return items
+
+    async def _start(self) -> None:
+        """Consume ``aiterator`` on the first call."""
         if self._finished_flg:
             raise StopAsyncIteration
 
         try:
             if not self._started_flg:
                 self._started_flg = True
-                async for item in self.aiterator:
-                    self._deque.append(item)
+                await self._consume()
 
         except BaseException:
             self._finished_flg = True
             self._deque.clear()
             raise
 
-        if not self._deque:
-            self._finished_flg = True
-            raise StopAsyncIteration
-
-        item = self._deque.popleft()
-
-        # Move to the next coroutine!
-        await asyncio.sleep(0.0)
+    async def _consume(self) -> None:
+        """Consume ``aiterator``, by batches if supported."""
+        if supports_anext_batch(self.aiterator):
+            while items := await anext_batch(self.aiterator):
+                self._deque.extend(items)
+            return
 
-        return item
+        async for item in self.aiterator:
+            self._deque.append(item)
@@ -0,0 +1,281 @@
+from asyncio import Event, Task, shield, wait
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Generic, Literal, Self, TypeVar
+
+from aioplus.internal.utils.batching import BATCH_SIZE, anext_batch
+from aioplus.internal.utils.tasks import spawn
+from aioplus.internal.utils.typing import AcloseableIterator
+
+
+T = TypeVar("T")
+
+
+def atee(
+    aiterable: AsyncIterable[T],
+    /,
+    *,
+    n: int = 2,
+    maxsize: int | None = None,
+    overflow: Literal["block", "drop"] = "block",
+) -> tuple[AcloseableIterator[T], ...]:
+    """Return ``n`` independent asynchronous iterators from a single ``aiterable``.
+
+    Parameters
+    ----------
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    n : int, default 2
+        The number of iterators.
+
+    maxsize : int, optional
+        The maximum number of items buffered between the fastest and the slowest iterator. If
+        :obj:`None`, the buffer is unbounded.
+
+    overflow : {'block', 'drop'}, default 'block'
+        If ``'block'``, the fastest iterators wait for the slowest one once the buffer is full. If
+        ``'drop'``, the oldest items are dropped instead, so the slowest iterators skip them. Only
+        used if ``maxsize`` is not :obj:`None`.
+
+    Returns
+    -------
+    tuple[AcloseableIterator[T], ...]
+        The asynchronous iterators.
+
+    Examples
+    --------
+    >>> aiterator1, aiterator2 = atee(arange(4))
+    >>> [num async for num in aiterator1]
+    [0, 1, 2, 3]
+    >>> [num async for num in aiterator2]
+    [0, 1, 2, 3]
+
+    Notes
+    -----
+    * The iterators share a single buffer, and each item is pulled from ``aiterable`` exactly once,
+      whichever iterator asks for it first. Items are released once every iterator has returned
+      them;
+    * Pulls run in a task, so cancelling one iterator does not cancel the pull the others are
+      waiting for. Concurrent calls of ``__anext__()``, even on the same iterator, are safe;
+    * If ``aiterable`` raises an exception, each iterator raises it once it reaches that position;
+    * If ``overflow='block'``, the iterators must be consumed concurrently. Consuming them one by
+      one, or leaving one of them unconsumed, blocks the others forever once ``maxsize`` items are
+      buffered. Closing an iterator releases its position;
+    * Closing the last iterator cancels the pending pull, but does not close ``aiterable``.
+
+    See Also
+    --------
+    :func:`itertools.tee`
+    """
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    if not isinstance(n, int):
+        detail = "'n' must be 'int'"
+        raise TypeError(detail)
+
+    if n < 0:
+        detail = "'n' must be non-negative"
+        raise ValueError(detail)
+
+    if maxsize is not None and not isinstance(maxsize, int):
+        detail = "'maxsize' must be 'int' or 'None'"
+        raise TypeError(detail)
+
+    if maxsize is not None and maxsize <= 0:
+        detail = "'maxsize' must be positive"
+        raise ValueError(detail)
+
+    if overflow not in {"block", "drop"}:
+        detail = "'overflow' must be 'block' or 'drop'"
+        raise ValueError(detail)
+
+    aiterator = aiter(aiterable)
+    buffer = AteeBuffer(aiterator, n, maxsize, overflow)
+    return tuple(AteeIterator(buffer, index) for index in range(n))
+
+
+@dataclass(repr=False, slots=True)
+class AteeIterator(AcloseableIterator[T]):
+    """An asynchronous iterator."""
+
+    buffer: "AteeBuffer[T]"
+    index: int
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Return the next item."""
+        items = await self.buffer.get(self.index, 1)
+        return items[0]
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        return await self.buffer.get(self.index, max_n)
+
+    def __del__(self) -> None:
+        """Call the destructor."""
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        self.buffer.release(self.index)
+        await self.buffer.wait_closed()
+
+    def close(self) -> None:
+        """Close the iterator."""
+        self.buffer.release(self.index)
+
+
+@dataclass(repr=False, slots=True)
+class AteeBuffer(Generic[T]):
+    """The buffer shared by the iterators of :func:`atee`.
+
+    Notes
+    -----
+    * Positions are absolute: ``_items[0]`` is the item at position ``_start``. Each iterator holds
+      the position of its next item in ``_cursors``, or :obj:`None` once it is closed.
+    """
+
+    aiterator: AsyncIterator[T]
+    n: int
+    maxsize: int | None
+    overflow: str
+    _finished_flg: bool = field(init=False)
+    _exception: Exception | None = field(init=False)
+    _items: deque[T] = field(init=False)
+    _start: int = field(init=False)
+    _cursors: list[int | None] = field(init=False)
+    _pull: Task[None] | None = field(init=False)
+    _space: Event = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._finished_flg = False
+        self._exception = None
+        self._items = deque()
+        self._start = 0
+        self._cursors = [0] * self.n
+        self._pull = None
+        self._space = Event()
+
+    async def get(self, index: int, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items of the iterator ``index``."""
+        while True:
+            if (cursor := self._cursors[index]) is None:
+                raise StopAsyncIteration
+
+            cursor = max(cursor, self._start)
+            offset = cursor - self._start
+
+            if (available := len(self._items) - offset) > 0:
+                count = min(max_n, available)
+                items = (
+                    [self._items[offset]]
+                    if count == 1
+                    else list(islice(self._items, offset, offset + count))
+                )
+                self._advance(index, cursor + count)
+                return items
+
+            if self._finished_flg:
+                self.release(index)
+
+                if self._exception is not None:
+                    raise self._exception
+
+                raise StopAsyncIteration
+
+            await self._fill()
+
+    def release(self, index: int, /) -> None:
+        """Release the position of the iterator ``index``."""
+        if self._cursors[index] is None:
+            return
+
+        self._cursors[index] = None
+        self._trim()
+
+        if self._pull is not None and all(cursor is None for cursor in self._cursors):
+            self._pull.cancel()
+
+    async def wait_closed(self) -> None:
+        """Wait until the pending pull is cancelled, if every iterator is closed."""
+        if self._pull is not None and all(cursor is None for cursor in self._cursors):
+            await wait((self._pull,))
+
+    async def _fill(self) -> None:
+        """Wait until the next item is pulled, pulling it if nobody does."""
+        if self._pull is None:
+            if self.overflow == "block" and self._full():
+                self._space.clear()
+                await self._space.wait()
+                return
+
+            self._pull = spawn(self._fetch())
+
+        await shield(self._pull)
+
+    async def _fetch(self) -> None:
+        """Pull the next items into the buffer."""
+        max_n = BATCH_SIZE if self.maxsize is None else max(self.maxsize - len(self._items), 1)
+
+        try:
+            items = await anext_batch(self.aiterator, max_n)
+
+        except Exception as exception:
+            self._finished_flg = True
+            self._exception = exception
+            return
+        except BaseException:
+            self._finished_flg = True
+            raise
+
+        finally:
+            self._pull = None
+
+        if not items:
+            self._finished_flg = True
+            return
+
+        self._items.extend(items)
+
+        if self.maxsize is not None and (excess := len(self._items) - self.maxsize) > 0:
+            for _ in range(excess):
+                self._items.popleft()
+            self._start += excess
+
+    def _full(self) -> bool:
+        """Return :obj:`True` if no more items can be buffered."""
+        return self.maxsize is not None and len(self._items) >= self.maxsize
+
+    def _advance(self, index: int, cursor: int, /) -> None:
+        """Move the iterator ``index`` to ``cursor``, releasing the items returned by all."""
+        previous = self._cursors[index]
+        self._cursors[index] = cursor
+
+        if previous is not None and previous <= self._start:
+            self._trim()
+
+    def _trim(self) -> None:
+        """Release the items returned by every iterator."""
+        cursors = [cursor for cursor in self._cursors if cursor is not None]
+        stop = min(cursors) if cursors else self._start + len(self._items)
+
+        if (count := stop - self._start) <= 0:
+            return
+
+        if count >= len(self._items):
+            self._items.clear()
+        else:
+            for _ in range(count):
+                self._items.popleft()
+
+        self._start = stop
+        self._space.set()
@@ -0,0 +1,108 @@
+from collections.abc import AsyncIterable
+from typing import Any, TypeVar, overload
+
+from aioplus.internal.utils.moments import Moments
+
+
+D = TypeVar("D")
+
+
+@overload
+async def avar(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    ddof: int = 0,
+    flatten: bool = False,
+) -> float: ...
+
+
+@overload
+async def avar(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    ddof: int = 0,
+    flatten: bool = False,
+    default: D,
+) -> float | D: ...
+
+
+async def avar(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    ddof: int = 0,
+    flatten: bool = False,
+    default: Any = ...,
+) -> Any:
+    """Return the variance of ``aiterable``.
+
+    Parameters
+    ----------
+    aiterable : AsyncIterable[T]
+        The asynchronous iterable.
+
+    ddof : int, default 0
+        The delta degrees of freedom. The sum of squared deviations is divided by ``len - ddof``,
+        so ``ddof=0`` is the population variance and ``ddof=1`` is the sample variance.
+
+    flatten : bool, default False
+        If :obj:`True`, items implementing ``__array__()`` or the buffer protocol are treated as
+        chunks of elements, each reduced by a single vectorized call.
+
+    default : D, unset
+        A default value to return if the iterable is empty.
+
+    Returns
+    -------
+    float | D
+        The variance.
+
+    Examples
+    --------
+    >>> aiterable = arange(23)
+    >>> await avar(aiterable)
+    44.0
+
+    Notes
+    -----
+    * Items are added by Welford's algorithm and chunks are merged by Chan's algorithm, so the
+      iterable is consumed in ``O(1)`` memory without losing precision for large means.
+
+    See Also
+    --------
+    :func:`statistics.pvariance`
+    :func:`statistics.variance`
+    """
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    if not isinstance(ddof, int):
+        detail = "'ddof' must be 'int'"
+        raise TypeError(detail)
+
+    if ddof < 0:
+        detail = "'ddof' must be non-negative"
+        raise ValueError(detail)
+
+    if not isinstance(flatten, bool):
+        detail = "'flatten' must be 'bool'"
+        raise TypeError(detail)
+
+    aiterator = aiter(aiterable)
+    moments = await Moments.from_aiterator(aiterator, flatten=flatten)
+
+    if moments.count > ddof:
+        return float(moments.m2 / (moments.count - ddof))
+
+    if moments.count:
+        detail = "avar(): not enough items"
+        raise ValueError(detail)
+
+    if default is not ...:
+        return default
+
+    detail = "avar(): empty iterable"
+    raise ValueError(detail)
@@ -1,9 +1,11 @@
-from asyncio import get_running_loop
+from asyncio import AbstractEventLoop, Future, Handle, TimerHandle, get_running_loop
 from collections.abc import Awaitable, Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextvars import copy_context
+from dataclasses import dataclass, field
 from functools import partial, wraps
-from typing import ParamSpec, TypeVar
+from typing import Any, Generic, ParamSpec, TypeVar
+from weakref import WeakKeyDictionary
 
 
 P = ParamSpec("P")
@@ -14,7 +16,9 @@ def awaitify(
     func: Callable[P, R],
     /,
     *,
-    executor: ThreadPoolExecutor | None = None,
+    executor: ThreadPoolExecutor | ProcessPoolExecutor | None = None,
+    batch_size: int = 1,
+    max_wait: float = 0.0,
 ) -> Callable[P, Awaitable[R]]:
     """Make ``func`` asynchronous.
 
@@ -23,9 +27,17 @@ def awaitify(
     func : Callable[P, R]
         The synchronous callable.
 
-    executor : ThreadPoolExecutor, optional
-        An optional :class:`concurrent.futures.ThreadPoolExecutor` to run the function in. If
-        :obj:`None`, the default executor is used.
+    executor : ThreadPoolExecutor | ProcessPoolExecutor, optional
+        An optional :class:`concurrent.futures.ThreadPoolExecutor` or
+        :class:`concurrent.futures.ProcessPoolExecutor` to run the function in. If :obj:`None`,
+        the default executor is used.
+
+    batch_size : int, default 1
+        The maximum number of calls coalesced into one executor call.
+
+    max_wait : float, default 0.0
+        The maximum number of seconds a call may wait for its batch to fill up. If ``0.0``, calls
+        made within the same event loop iteration are coalesced.
 
     Returns
     -------
@@ -38,6 +50,13 @@ def awaitify(
     >>> await aprint("4 -> 23")
     4 -> 23
 
+    Notes
+    -----
+    * If ``executor`` is a :class:`concurrent.futures.ProcessPoolExecutor`, ``func`` and its
+      arguments must be picklable, and context variables are not propagated;
+    * A batch is run as a loop inside one executor call, and the results are scattered back to
+      the individual awaiters. It is pickled once, so ``func`` is only serialized once per batch.
+
     See Also
     --------
     :meth:`asyncio.loop.run_in_executor`
@@ -46,16 +65,163 @@ def awaitify(
         detail = "'func' must be 'Callable'"
         raise TypeError(detail)
 
-    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
-        detail = "'executor' must be 'ThreadPoolExecutor' or 'None'"
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor | ProcessPoolExecutor):
+        detail = "'executor' must be 'ThreadPoolExecutor', 'ProcessPoolExecutor' or 'None'"
+        raise TypeError(detail)
+
+    if not isinstance(batch_size, int):
+        detail = "'batch_size' must be 'int'"
+        raise TypeError(detail)
+
+    if batch_size <= 0:
+        detail = "'batch_size' must be positive"
+        raise ValueError(detail)
+
+    if not isinstance(max_wait, float):
+        detail = "'max_wait' must be 'float'"
         raise TypeError(detail)
 
+    if max_wait < 0.0:
+        detail = "'max_wait' must be non-negative"
+        raise ValueError(detail)
+
+    isolated_flg = isinstance(executor, ProcessPoolExecutor)
+
+    if batch_size > 1:
+        batcher = AwaitifyBatcher(func, executor, batch_size, max_wait, isolated_flg)
+
+        @wraps(func)
+        async def abatch(*args: P.args, **kwargs: P.kwargs) -> R:
+            """Run the function asynchronously."""
+            return await batcher.submit(*args, **kwargs)
+
+        return abatch
+
     @wraps(func)
     async def afunc(*args: P.args, **kwargs: P.kwargs) -> R:
         """Run the function asynchronously."""
         loop = get_running_loop()
-        context = copy_context()
-        execute = partial(context.run, func, *args, **kwargs)
+
+        if isolated_flg:
+            execute = partial(func, *args, **kwargs)
+        else:
+            context = copy_context()
+            execute = partial(context.run, func, *args, **kwargs)
+
         return await loop.run_in_executor(executor, execute)
 
     return afunc
+
+
+@dataclass(repr=False, slots=True)
+class AwaitifyBatch(Generic[R]):
+    """A batch of calls waiting to be submitted."""
+
+    calls: list[tuple[Callable[..., R], tuple[Any, ...], dict[str, Any]]]
+    futures: list[Future[R]]
+    handle: Handle | TimerHandle | None = None
+
+
+@dataclass(repr=False, slots=True)
+class AwaitifyBatcher(Generic[R]):
+    """A batcher of calls."""
+
+    func: Callable[..., R]
+    executor: ThreadPoolExecutor | ProcessPoolExecutor | None
+    batch_size: int
+    max_wait: float
+    isolated_flg: bool
+    _batches: WeakKeyDictionary[AbstractEventLoop, AwaitifyBatch[R]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._batches = WeakKeyDictionary()
+
+    async def submit(self, *args: Any, **kwargs: Any) -> R:
+        """Add the call to the current batch and wait for its result."""
+        loop = get_running_loop()
+
+        if (batch := self._batches.get(loop)) is None:
+            batch = self._batches[loop] = AwaitifyBatch([], [])
+
+            if self.max_wait:
+                batch.handle = loop.call_later(self.max_wait, self._flush, loop)
+            else:
+                batch.handle = loop.call_soon(self._flush, loop)
+
+        if self.isolated_flg:
+            batch.calls.append((self.func, args, kwargs))
+        else:
+            context = copy_context()
+            batch.calls.append((context.run, (self.func, *args), kwargs))
+
+        future: Future[R] = loop.create_future()
+        batch.futures.append(future)
+
+        if len(batch.futures) >= self.batch_size:
+            self._flush(loop)
+
+        return await future
+
+    def _flush(self, loop: AbstractEventLoop, /) -> None:
+        """Submit the batch of the event loop."""
+        if (batch := self._batches.pop(loop, None)) is None:
+            return
+
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        execute = partial(run_batch, batch.calls)
+        executor_future = loop.run_in_executor(self.executor, execute)
+        executor_future.add_done_callback(partial(self._scatter, batch.futures))
+
+    @staticmethod
+    def _scatter(futures: list[Future[R]], executor_future: Future[list[tuple[bool, Any]]]) -> None:
+        """Scatter the results of the batch to the awaiters."""
+        if executor_future.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+
+        if (exception := executor_future.exception()) is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        for future, (ok, value) in zip(futures, executor_future.result(), strict=True):
+            if future.done():
+                continue
+
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+def run_batch(
+    calls: list[tuple[Callable[..., R], tuple[Any, ...], dict[str, Any]]],
+) -> list[tuple[bool, Any]]:
+    """Run the batch of calls.
+
+    Parameters
+    ----------
+    calls : list[tuple[Callable[..., R], tuple[Any, ...], dict[str, Any]]]
+        The callables with their positional and keyword arguments.
+
+    Returns
+    -------
+    list[tuple[bool, Any]]
+        For each call, :obj:`True` and the result, or :obj:`False` and the exception raised.
+    """
+    outcomes: list[tuple[bool, Any]] = []
+
+    for func, args, kwargs in calls:
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exception:
+            outcomes.append((False, exception))
+        else:
+            outcomes.append((True, result))
+
+    return outcomes
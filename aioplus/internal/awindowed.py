@@ -1,8 +1,10 @@
 from collections import deque
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, Self, TypeVar, overload
 
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 
@@ -24,6 +26,7 @@ def awindowed(
 def awindowed(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[tuple[T, ...]]: ...
 
 
+@instrumented("awindowed")
 def awindowed(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[tuple[T, ...]]:
     """Return a sliding window of width ``n`` over ``aiterable``.
 
@@ -62,17 +65,19 @@ def awindowed(aiterable: AsyncIterable[T], /, *, n: int) -> AsyncIterator[tuple[
     return AwindowedIterator(aiterator, n)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AwindowedIterator(AsyncIterator[tuple[T, ...]]):
     """An asynchronous iterator."""
 
     aiterator: AsyncIterator[T]
     n: int
+    _finished_flg: bool = field(init=False)
+    _window: deque[T] = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._finished_flg: bool = False
-        self._window: deque[T] = deque(maxlen=self.n)
+        self._finished_flg = False
+        self._window = deque(maxlen=self.n)
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
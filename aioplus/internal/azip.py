@@ -1,10 +1,10 @@
-import asyncio
-
-from asyncio import create_task
 from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Self, TypeVar, overload
 
+from aioplus.internal.utils.inline import anext_all
+from aioplus.internal.utils.instrumentation import instrumented
+
 
 T = TypeVar("T")
 
@@ -84,6 +84,7 @@ def azip(
 def azip(*aiterables: AsyncIterable[T], strict: bool = False) -> AsyncIterator[tuple[T, ...]]: ...
 
 
+@instrumented("azip")
 def azip(*aiterables: AsyncIterable[Any], strict: bool = False) -> AsyncIterator[tuple[Any, ...]]:
     """Iterate ``*aiterables`` in parallel.
 
@@ -106,6 +107,12 @@ def azip(*aiterables: AsyncIterable[Any], strict: bool = False) -> AsyncIterator
     >>> ys = arange(4, 23)
     >>> [(x, y) async for x, y in azip(xs, ys)]
     [(0, 4), (1, 5), (2, 6), ..., (18, 22)]
+
+    Notes
+    -----
+    * Each asynchronous iterable is pulled in its own task, so that they are pulled concurrently.
+      On Python 3.12+, the tasks start eagerly, so items that are ready are returned without a
+      round trip through the event loop.
     """
     if not aiterables:
         detail = "'*aiterables' must be non-empty"
@@ -124,16 +131,17 @@ def azip(*aiterables: AsyncIterable[Any], strict: bool = False) -> AsyncIterator
     return AzipIterator(aiterators, strict)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class AzipIterator(AsyncIterator[tuple[T, ...]]):
     """An asynchronous iterator."""
 
     aiterators: list[AsyncIterator[T]]
     strict: bool
+    _finished_flg: bool = field(init=False)
 
     def __post_init__(self) -> None:
         """Initialize the object."""
-        self._finished_flg: bool = False
+        self._finished_flg = False
 
     def __aiter__(self) -> Self:
         """Return an asynchronous iterator."""
@@ -144,33 +152,22 @@ class AzipIterator(AsyncIterator[tuple[T, ...]]):
         if self._finished_flg:
             raise StopAsyncIteration
 
-        coroutines = [anext(aiterator, ...) for aiterator in self.aiterators]
-        tasks = [create_task(coroutine) for coroutine in coroutines]
-
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-        results: list[T] = []
+        count = len(self.aiterators)
+        results: list[Any] = [...] * count
 
         exceptions: list[Exception] = []
         base_exceptions: list[BaseException] = []
 
-        for task in tasks:
-            try:
-                maybe_result = task.result()
+        for exception in await anext_all(self.aiterators, range(count), results):
+            if isinstance(exception, ExceptionGroup):
+                exceptions.extend(exception.exceptions)
+            elif isinstance(exception, BaseExceptionGroup):
+                base_exceptions.extend(exception.exceptions)
 
-            except ExceptionGroup as group:
-                exceptions.extend(group.exceptions)
-            except BaseExceptionGroup as group:
-                base_exceptions.extend(group.exceptions)
-
-            except Exception as exception:
+            elif isinstance(exception, Exception):
                 exceptions.append(exception)
-            except BaseException as exception:
-                base_exceptions.append(exception)
-
             else:
-                if maybe_result is not ...:
-                    results.append(maybe_result)
+                base_exceptions.append(exception)
 
         if base_exceptions:
             self._finished_flg = True
@@ -182,16 +179,16 @@ class AzipIterator(AsyncIterator[tuple[T, ...]]):
             detail = "azip(): exception(-s) occurred"
             raise ExceptionGroup(detail, exceptions)
 
-        if not results:
+        if all(result is ... for result in results):
             self._finished_flg = True
             raise StopAsyncIteration
 
-        if self.strict and len(results) < len(self.aiterators):
+        if self.strict and any(result is ... for result in results):
             self._finished_flg = True
             detail = "azip(): len(*aiterables) differ"
             raise ValueError(detail)
 
-        if len(results) < len(self.aiterators):
+        if any(result is ... for result in results):
             self._finished_flg = True
             raise StopAsyncIteration
 
@@ -0,0 +1,199 @@
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Self, TypeVar, overload
+
+from aioplus.internal.utils.inline import anext_all
+from aioplus.internal.utils.instrumentation import instrumented
+
+
+T = TypeVar("T")
+F = TypeVar("F")
+
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+T3 = TypeVar("T3")
+
+
+@overload
+def azip_longest(aiterable: AsyncIterable[T], /) -> AsyncIterator[tuple[T]]: ...
+
+
+@overload
+def azip_longest(aiterable: AsyncIterable[T], /, *, fillvalue: F) -> AsyncIterator[tuple[T]]: ...
+
+
+@overload
+def azip_longest(
+    aiterable1: AsyncIterable[T1],
+    aiterable2: AsyncIterable[T2],
+    /,
+) -> AsyncIterator[tuple[T1 | None, T2 | None]]: ...
+
+
+@overload
+def azip_longest(
+    aiterable1: AsyncIterable[T1],
+    aiterable2: AsyncIterable[T2],
+    /,
+    *,
+    fillvalue: F,
+) -> AsyncIterator[tuple[T1 | F, T2 | F]]: ...
+
+
+@overload
+def azip_longest(
+    aiterable1: AsyncIterable[T1],
+    aiterable2: AsyncIterable[T2],
+    aiterable3: AsyncIterable[T3],
+    /,
+) -> AsyncIterator[tuple[T1 | None, T2 | None, T3 | None]]: ...
+
+
+@overload
+def azip_longest(
+    aiterable1: AsyncIterable[T1],
+    aiterable2: AsyncIterable[T2],
+    aiterable3: AsyncIterable[T3],
+    /,
+    *,
+    fillvalue: F,
+) -> AsyncIterator[tuple[T1 | F, T2 | F, T3 | F]]: ...
+
+
+@overload
+def azip_longest(
+    *aiterables: AsyncIterable[Any],
+    fillvalue: Any = None,
+    fillvalues: Sequence[Any] | None = None,
+) -> AsyncIterator[tuple[Any, ...]]: ...
+
+
+@instrumented("azip_longest")
+def azip_longest(
+    *aiterables: AsyncIterable[Any],
+    fillvalue: Any = None,
+    fillvalues: Sequence[Any] | None = None,
+) -> AsyncIterator[tuple[Any, ...]]:
+    """Iterate ``*aiterables`` in parallel until all of them are exhausted.
+
+    Parameters
+    ----------
+    *aiterables : AsyncIterable[T]
+        The asynchronous iterables.
+
+    fillvalue : F, default None
+        The value to substitute for items of exhausted asynchronous iterables.
+
+    fillvalues : Sequence[F], optional
+        The values to substitute for items of exhausted asynchronous iterables, one per iterable.
+        If provided, ``fillvalue`` is ignored.
+
+    Returns
+    -------
+    AsyncIterator[tuple[T | F, ...]]
+        The asynchronous iterator.
+
+    Examples
+    --------
+    >>> xs = arange(2)
+    >>> ys = arange(4, 8)
+    >>> [(x, y) async for x, y in azip_longest(xs, ys, fillvalue=23)]
+    [(0, 4), (1, 5), (23, 6), (23, 7)]
+
+    Notes
+    -----
+    * Exhausted asynchronous iterables are never pulled again;
+    * Each asynchronous iterable is pulled in its own task, so that they are pulled concurrently.
+      On Python 3.12+, the tasks start eagerly, so items that are ready are returned without a
+      round trip through the event loop.
+
+    See Also
+    --------
+    :func:`itertools.zip_longest`
+    """
+    if not aiterables:
+        detail = "'*aiterables' must be non-empty"
+        raise ValueError(detail)
+
+    for aiterable in aiterables:
+        if not isinstance(aiterable, AsyncIterable):
+            detail = "'*aiterables' must be 'AsyncIterable'"
+            raise TypeError(detail)
+
+    if fillvalues is not None and not isinstance(fillvalues, Sequence):
+        detail = "'fillvalues' must be 'Sequence' or 'None'"
+        raise TypeError(detail)
+
+    if fillvalues is not None and len(fillvalues) != len(aiterables):
+        detail = "'len(fillvalues)' must be equal to 'len(*aiterables)'"
+        raise ValueError(detail)
+
+    if fillvalues is None:
+        fillvalues = [fillvalue] * len(aiterables)
+
+    aiterators = [aiter(aiterable) for aiterable in aiterables]
+    return AzipLongestIterator(aiterators, list(fillvalues))
+
+
+@dataclass(repr=False, slots=True)
+class AzipLongestIterator(AsyncIterator[tuple[T, ...]]):
+    """An asynchronous iterator."""
+
+    aiterators: list[AsyncIterator[T]]
+    fillvalues: list[Any]
+    _finished_flg: bool = field(init=False)
+    _alive: list[int] = field(init=False)
+    _row: list[Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._finished_flg = False
+        self._alive = list(range(len(self.aiterators)))
+        self._row = [...] * len(self.aiterators)
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> tuple[T, ...]:
+        """Return the next value."""
+        if self._finished_flg:
+            raise StopAsyncIteration
+
+        exceptions: list[Exception] = []
+        base_exceptions: list[BaseException] = []
+
+        for exception in await anext_all(self.aiterators, self._alive, self._row):
+            if isinstance(exception, ExceptionGroup):
+                exceptions.extend(exception.exceptions)
+            elif isinstance(exception, BaseExceptionGroup):
+                base_exceptions.extend(exception.exceptions)
+
+            elif isinstance(exception, Exception):
+                exceptions.append(exception)
+            else:
+                base_exceptions.append(exception)
+
+        if base_exceptions:
+            self._finished_flg = True
+            detail = "azip_longest(): base exception(-s) occurred"
+            raise BaseExceptionGroup(detail, [*base_exceptions, *exceptions])
+
+        if exceptions:
+            self._finished_flg = True
+            detail = "azip_longest(): exception(-s) occurred"
+            raise ExceptionGroup(detail, exceptions)
+
+        alive = [index for index in self._alive if self._row[index] is not ...]
+
+        if not alive:
+            self._finished_flg = True
+            raise StopAsyncIteration
+
+        if len(alive) < len(self._alive):
+            for index in self._alive:
+                if self._row[index] is ...:
+                    self._row[index] = self.fillvalues[index]
+            self._alive = alive
+
+        return tuple(self._row)
@@ -2,7 +2,8 @@ import time
 
 from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import Future, ThreadPoolExecutor
-from threading import Lock
+from dataclasses import dataclass
+from threading import Condition, Lock
 from types import TracebackType
 from typing import Any, Literal, ParamSpec, Self, TypeVar
 
@@ -11,6 +12,31 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+@dataclass(frozen=True)
+class CallerThreadExecutorStats:
+    """A snapshot of the executor counters.
+
+    Attributes
+    ----------
+    submitted : int
+        The number of submitted callables.
+
+    completed : int
+        The number of callables that returned a result.
+
+    failed : int
+        The number of callables that raised an exception.
+
+    busy_time : float
+        The cumulative number of seconds spent running callables.
+    """
+
+    submitted: int
+    completed: int
+    failed: int
+    busy_time: float
+
+
 class CallerThreadExecutor(ThreadPoolExecutor):
     """An executor that uses the caller thread.
 
@@ -25,7 +51,17 @@ class CallerThreadExecutor(ThreadPoolExecutor):
     :class:`concurrent.futures.ThreadPoolExecutor`
     """
 
-    __slots__ = ("_futures_count", "_futures_lock", "_shutdown", "_shutdown_lock")
+    __slots__ = (
+        "_busy_time",
+        "_completed_count",
+        "_failed_count",
+        "_futures_condition",
+        "_futures_count",
+        "_futures_lock",
+        "_shutdown",
+        "_shutdown_lock",
+        "_submitted_count",
+    )
 
     def __init__(
         self,
@@ -77,9 +113,15 @@ class CallerThreadExecutor(ThreadPoolExecutor):
 
         self._futures_count: int = 0
         self._futures_lock = Lock()
+        self._futures_condition = Condition(self._futures_lock)
         self._shutdown: bool = False
         self._shutdown_lock = Lock()
 
+        self._submitted_count: int = 0
+        self._completed_count: int = 0
+        self._failed_count: int = 0
+        self._busy_time: float = 0.0
+
     def submit(self, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> Future[R]:
         """Schedules the callable, ``fn``, to be executed.
 
@@ -114,8 +156,11 @@ class CallerThreadExecutor(ThreadPoolExecutor):
 
             with self._futures_lock:
                 self._futures_count += 1
+                self._submitted_count += 1
 
         future: Future[R] = Future()
+        started_at = time.perf_counter()
+
         try:
             result = fn(*args, **kwargs)
         except BaseException as exception:
@@ -123,8 +168,19 @@ class CallerThreadExecutor(ThreadPoolExecutor):
         else:
             future.set_result(result)
 
-        with self._futures_lock:
+        elapsed = time.perf_counter() - started_at
+
+        with self._futures_condition:
             self._futures_count -= 1
+            self._busy_time += elapsed
+
+            if future.exception() is None:
+                self._completed_count += 1
+            else:
+                self._failed_count += 1
+
+            if not self._futures_count:
+                self._futures_condition.notify_all()
 
         return future
 
@@ -244,8 +300,26 @@ class CallerThreadExecutor(ThreadPoolExecutor):
             self._shutdown = True
 
         if wait:
-            while self._futures_count > 0:
-                pass  # Just a spin-wait
+            with self._futures_condition:
+                self._futures_condition.wait_for(lambda: not self._futures_count)
+
+    @property
+    def stats(self) -> CallerThreadExecutorStats:
+        """Return a snapshot of the executor counters.
+
+        Returns
+        -------
+        CallerThreadExecutorStats
+            The number of submitted, completed and failed callables, and the cumulative number of
+            seconds spent running them.
+        """
+        with self._futures_lock:
+            return CallerThreadExecutorStats(
+                submitted=self._submitted_count,
+                completed=self._completed_count,
+                failed=self._failed_count,
+                busy_time=self._busy_time,
+            )
 
     def __enter__(self) -> Self:
         """Enter the context.
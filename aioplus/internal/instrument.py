@@ -0,0 +1,192 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from random import random
+from time import time_ns
+
+
+LATENCY_BOUNDS: tuple[float, ...] = (
+    0.000001,
+    0.0000025,
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(slots=True)
+class IteratorStats:
+    """The counters of an instrumented iterator.
+
+    Attributes
+    ----------
+    name : str
+        The name of the function that created the iterator.
+
+    items : int
+        The number of items returned.
+
+    exceptions : int
+        The number of exceptions raised, except :exc:`StopAsyncIteration`.
+
+    tasks_created : int
+        The number of tasks created.
+
+    tasks_cancelled : int
+        The number of tasks cancelled.
+
+    wait_time : float
+        The number of seconds the consumer spent awaiting the next items.
+
+    upstream_time : float
+        The number of seconds spent awaiting the next items of the asynchronous iterables the
+        iterator was created from. Concurrent pulls are summed, so it may exceed ``wait_time``.
+
+    busy_time : float
+        The number of seconds spent running the code of the iterator itself, excluding the code
+        of the asynchronous iterables it was created from.
+
+    idle_time : float
+        The number of seconds between returning an item and being asked for the next one, that is,
+        the time spent by the consumer.
+
+    latencies : list[int]
+        The number of pulls per latency bucket. The bucket ``i`` counts the pulls that took more
+        than ``LATENCY_BOUNDS[i - 1]`` and at most ``LATENCY_BOUNDS[i]`` seconds.
+
+    sources : list[IteratorStats]
+        The counters of the asynchronous iterables the iterator was created from. Iterables that
+        are not instrumented iterators are counted by name, from the side of the iterator.
+
+    consumer : IteratorStats, optional
+        The counters of the instrumented iterator created from this one, if any.
+
+    start_time_ns : int
+        The time the iterator was created at, in nanoseconds since the epoch.
+
+    end_time_ns : int, optional
+        The time the iterator was reported at, in nanoseconds since the epoch.
+
+    Examples
+    --------
+    >>> stats = IteratorStats("arange")
+    >>> stats.items
+    0
+    """
+
+    name: str
+    items: int = 0
+    exceptions: int = 0
+    tasks_created: int = 0
+    tasks_cancelled: int = 0
+    wait_time: float = 0.0
+    upstream_time: float = 0.0
+    busy_time: float = 0.0
+    idle_time: float = 0.0
+    latencies: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BOUNDS) + 1),
+        repr=False,
+        compare=False,
+    )
+    sources: list["IteratorStats"] = field(default_factory=list, repr=False, compare=False)
+    consumer: "IteratorStats | None" = field(default=None, repr=False, compare=False)
+    start_time_ns: int = field(default_factory=time_ns, repr=False, compare=False)
+    end_time_ns: int | None = field(default=None, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Instrumentation:
+    """The instrumentation of the iterators created within a block."""
+
+    callback: Callable[[IteratorStats], object]
+    sample_rate: float
+
+    def sample(self) -> bool:
+        """Return :obj:`True` if the next iterator must be instrumented."""
+        return self.sample_rate >= 1.0 or random() < self.sample_rate  # noqa: S311
+
+
+INSTRUMENTATION: ContextVar[Instrumentation | None] = ContextVar(
+    "aioplus.instrument",
+    default=None,
+)
+
+
+@contextmanager
+def instrument(
+    callback: Callable[[IteratorStats], object],
+    /,
+    *,
+    sample_rate: float = 1.0,
+) -> Iterator[None]:
+    """Instrument iterators created within the block.
+
+    Parameters
+    ----------
+    callback : Callable[[IteratorStats], object]
+        The callable. It is called once per instrumented iterator, when the iterator is exhausted,
+        raises an exception, is closed or is garbage collected.
+
+    sample_rate : float, default 1.0
+        The probability of an iterator being instrumented.
+
+    Returns
+    -------
+    Iterator[None]
+        The context manager.
+
+    Examples
+    --------
+    >>> stats = []
+    >>> with instrument(stats.append):
+    ...     aiterable = abatched(arange(23), n=5)
+    >>> [batch async for batch in aiterable]
+    [(0, 1, 2, 3, 4), (5, 6, 7, 8, 9), ..., (20, 21, 22)]
+    >>> stats
+    [IteratorStats(name='abatched', items=5, exceptions=0, ...)]
+
+    Notes
+    -----
+    * The instrumentation is read once, when an iterator is created. Iterating it outside the block
+      is still instrumented;
+    * The instrumentation is stored in a :class:`contextvars.ContextVar`, so it is local to the
+      current task;
+    * Iterators created outside the block, or not sampled, are not wrapped, so they run without any
+      overhead. Instrumented iterators read the clock around each step of each ``__anext__()`` and
+      of each upstream pull, so ``sample_rate`` should be lowered for always-on instrumentation.
+    """
+    if not callable(callback):
+        detail = "'callback' must be 'Callable'"
+        raise TypeError(detail)
+
+    if not isinstance(sample_rate, float):
+        detail = "'sample_rate' must be 'float'"
+        raise TypeError(detail)
+
+    if not 0.0 < sample_rate <= 1.0:
+        detail = "'sample_rate' must be in range (0, 1]"
+        raise ValueError(detail)
+
+    token = INSTRUMENTATION.set(Instrumentation(callback, sample_rate))
+    try:
+        yield
+    finally:
+        INSTRUMENTATION.reset(token)
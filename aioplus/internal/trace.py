@@ -0,0 +1,353 @@
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from random import getrandbits
+from typing import Any, Protocol, runtime_checkable
+
+from aioplus.internal.instrument import LATENCY_BOUNDS, IteratorStats, instrument
+
+
+THROUGHPUT_BOUNDS: tuple[float, ...] = (
+    1.0,
+    10.0,
+    100.0,
+    1000.0,
+    10000.0,
+    100000.0,
+    1000000.0,
+    10000000.0,
+)
+
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_ERROR = 2
+AGGREGATION_TEMPORALITY_DELTA = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SpanData:
+    """A finished span, shaped as an OpenTelemetry span.
+
+    Attributes
+    ----------
+    name : str
+        The name of the iterator, or of the asynchronous iterable it was created from.
+
+    trace_id : int
+        The 128-bit identifier of the pipeline.
+
+    span_id : int
+        The 64-bit identifier of the span.
+
+    parent_span_id : int, optional
+        The identifier of the span of the consumer. If :obj:`None`, the span is the root.
+
+    start_time_unix_nano : int
+        The time the iterator was created at, in nanoseconds since the epoch.
+
+    end_time_unix_nano : int
+        The time the iterator was reported at, in nanoseconds since the epoch.
+
+    attributes : dict[str, int | float | str]
+        The counters of the iterator, prefixed with ``aioplus.``.
+
+    error : bool
+        If :obj:`True`, the iterator has raised an exception.
+
+    Examples
+    --------
+    >>> span = SpanData("arange", 1, 1, None, 0, 23, {"aioplus.items": 23})
+    >>> span.to_otlp()["spanId"]
+    '0000000000000001'
+    """
+
+    name: str
+    trace_id: int
+    span_id: int
+    parent_span_id: int | None
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    attributes: dict[str, int | float | str] = field(default_factory=dict)
+    error: bool = False
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Return the span in the OTLP/JSON encoding."""
+        span: dict[str, Any] = {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "name": self.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": encode(self.attributes),
+        }
+
+        if self.parent_span_id is not None:
+            span["parentSpanId"] = f"{self.parent_span_id:016x}"
+
+        if self.error:
+            span["status"] = {"code": STATUS_CODE_ERROR}
+
+        return span
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramData:
+    """A histogram data point, shaped as an OpenTelemetry metric.
+
+    Attributes
+    ----------
+    name : str
+        The name of the metric.
+
+    unit : str
+        The unit of the metric, in UCUM.
+
+    attributes : dict[str, int | float | str]
+        The attributes of the data point.
+
+    start_time_unix_nano : int
+        The start of the aggregation window, in nanoseconds since the epoch.
+
+    time_unix_nano : int
+        The end of the aggregation window, in nanoseconds since the epoch.
+
+    explicit_bounds : tuple[float, ...]
+        The upper bounds of the buckets, except the last one.
+
+    bucket_counts : tuple[int, ...]
+        The number of observations per bucket.
+
+    sum : float
+        The sum of the observations.
+
+    Examples
+    --------
+    >>> histogram = HistogramData("aioplus.iterator.latency", "s", {}, 0, 23, (1.0,), (4, 0), 0.5)
+    >>> histogram.count
+    4
+    """
+
+    name: str
+    unit: str
+    attributes: dict[str, int | float | str]
+    start_time_unix_nano: int
+    time_unix_nano: int
+    explicit_bounds: tuple[float, ...]
+    bucket_counts: tuple[int, ...]
+    sum: float
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+        return sum(self.bucket_counts)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Return the metric in the OTLP/JSON encoding."""
+        point = {
+            "attributes": encode(self.attributes),
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "timeUnixNano": str(self.time_unix_nano),
+            "count": str(self.count),
+            "sum": self.sum,
+            "bucketCounts": [str(count) for count in self.bucket_counts],
+            "explicitBounds": list(self.explicit_bounds),
+        }
+
+        return {
+            "name": self.name,
+            "unit": self.unit,
+            "histogram": {
+                "aggregationTemporality": AGGREGATION_TEMPORALITY_DELTA,
+                "dataPoints": [point],
+            },
+        }
+
+
+@runtime_checkable
+class Exporter(Protocol):
+    """An ABC with one abstract method `export`."""
+
+    __slots__ = ()
+
+    def export(self, spans: Sequence[SpanData], histograms: Sequence[HistogramData], /) -> object:
+        """Export the spans and the histograms of a pipeline."""
+
+
+@dataclass(repr=False, slots=True)
+class InMemoryExporter:
+    """An exporter that keeps the spans and the histograms in memory.
+
+    Attributes
+    ----------
+    spans : list[SpanData]
+        The exported spans.
+
+    histograms : list[HistogramData]
+        The exported histograms.
+
+    Examples
+    --------
+    >>> exporter = InMemoryExporter()
+    >>> with trace(exporter):
+    ...     aiterable = aenumerate(arange(23))
+    >>> _ = [item async for item in aiterable]
+    >>> [span.name for span in exporter.spans]
+    ['aenumerate', 'arange']
+    """
+
+    spans: list[SpanData] = field(default_factory=list)
+    histograms: list[HistogramData] = field(default_factory=list)
+
+    def export(self, spans: Sequence[SpanData], histograms: Sequence[HistogramData], /) -> None:
+        """Export the spans and the histograms of a pipeline."""
+        self.spans.extend(spans)
+        self.histograms.extend(histograms)
+
+    def clear(self) -> None:
+        """Forget the exported spans and histograms."""
+        self.spans.clear()
+        self.histograms.clear()
+
+
+@contextmanager
+def trace(exporter: Exporter, /, *, sample_rate: float = 1.0) -> Iterator[Exporter]:
+    """Export the iterators created within the block as spans and histograms.
+
+    Parameters
+    ----------
+    exporter : Exporter
+        The exporter. It is called once per pipeline, when the root iterator is reported.
+
+    sample_rate : float, default 1.0
+        The probability of an iterator being instrumented.
+
+    Returns
+    -------
+    Iterator[Exporter]
+        The context manager.
+
+    Examples
+    --------
+    >>> exporter = InMemoryExporter()
+    >>> with trace(exporter):
+    ...     aiterable = arace(arange(2), arange(2))
+    >>> _ = [num async for num in aiterable]
+    >>> [(span.name, span.parent_span_id is None) for span in exporter.spans]
+    [('arace', True), ('arange', False), ('arange', False)]
+
+    Notes
+    -----
+    * Iterators are instrumented by :func:`instrument`. Each pipeline is a span tree: the iterator
+      that is not consumed by another instrumented iterator is the root, and the asynchronous
+      iterables it was created from are its children;
+    * Each span comes with two histograms: ``aioplus.iterator.latency``, the latencies of its pulls,
+      and ``aioplus.iterator.throughput``, its items per second;
+    * Spans and histograms can be converted to the OTLP/JSON encoding by ``to_otlp()``, so the
+      OpenTelemetry SDK is never imported.
+    """
+    if not isinstance(exporter, Exporter):
+        detail = "'exporter' must be 'Exporter'"
+        raise TypeError(detail)
+
+    with instrument(partial(export, exporter), sample_rate=sample_rate):
+        yield exporter
+
+
+def export(exporter: Exporter, stats: IteratorStats, /) -> None:
+    """Export the pipeline, if ``stats`` is its root."""
+    if stats.consumer is not None:
+        return
+
+    spans: list[SpanData] = []
+    histograms: list[HistogramData] = []
+    end_time_ns = stats.end_time_ns or stats.start_time_ns
+
+    collect(stats, getrandbits(128), None, end_time_ns, spans, histograms)
+    exporter.export(spans, histograms)
+
+
+def collect(
+    stats: IteratorStats,
+    trace_id: int,
+    parent_span_id: int | None,
+    end_time_ns: int,
+    spans: list[SpanData],
+    histograms: list[HistogramData],
+    /,
+) -> None:
+    """Add the spans and the histograms of ``stats`` and of its sources, depth-first."""
+    span_id = getrandbits(64) or 1
+    end_time_ns = stats.end_time_ns or end_time_ns
+    attributes: dict[str, int | float | str] = {"aioplus.iterator": stats.name}
+
+    span = SpanData(
+        name=stats.name,
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_span_id=parent_span_id,
+        start_time_unix_nano=stats.start_time_ns,
+        end_time_unix_nano=end_time_ns,
+        attributes={
+            "aioplus.items": stats.items,
+            "aioplus.exceptions": stats.exceptions,
+            "aioplus.tasks_created": stats.tasks_created,
+            "aioplus.tasks_cancelled": stats.tasks_cancelled,
+            "aioplus.wait_time": stats.wait_time,
+            "aioplus.upstream_time": stats.upstream_time,
+            "aioplus.busy_time": stats.busy_time,
+            "aioplus.idle_time": stats.idle_time,
+        },
+        error=stats.exceptions > 0,
+    )
+    spans.append(span)
+
+    latency = HistogramData(
+        name="aioplus.iterator.latency",
+        unit="s",
+        attributes=attributes,
+        start_time_unix_nano=stats.start_time_ns,
+        time_unix_nano=end_time_ns,
+        explicit_bounds=LATENCY_BOUNDS,
+        bucket_counts=tuple(stats.latencies),
+        sum=stats.wait_time,
+    )
+    histograms.append(latency)
+
+    if (duration := end_time_ns - stats.start_time_ns) > 0:
+        throughput = stats.items / duration * 1e9
+        counts = [0] * (len(THROUGHPUT_BOUNDS) + 1)
+        counts[bisect_left(THROUGHPUT_BOUNDS, throughput)] = 1
+
+        histogram = HistogramData(
+            name="aioplus.iterator.throughput",
+            unit="{item}/s",
+            attributes=attributes,
+            start_time_unix_nano=stats.start_time_ns,
+            time_unix_nano=end_time_ns,
+            explicit_bounds=THROUGHPUT_BOUNDS,
+            bucket_counts=tuple(counts),
+            sum=throughput,
+        )
+        histograms.append(histogram)
+
+    for source in stats.sources:
+        collect(source, trace_id, span_id, end_time_ns, spans, histograms)
+
+
+def encode(attributes: dict[str, int | float | str], /) -> list[dict[str, Any]]:
+    """Return the attributes in the OTLP/JSON encoding."""
+    encoded: list[dict[str, Any]] = []
+
+    for key, value in attributes.items():
+        if isinstance(value, str):
+            typed: dict[str, Any] = {"stringValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        else:
+            typed = {"doubleValue": value}
+
+        encoded.append({"key": key, "value": typed})
+
+    return encoded
@@ -0,0 +1,193 @@
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from functools import cache
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Self
+
+from aioplus.internal.utils.batching import anext_batch
+
+
+ARRAY_TYPES: dict[type, bool] = {}
+
+
+def is_array(obj: Any, /) -> bool:
+    """Return :obj:`True` if ``obj`` implements ``__array__()`` or the buffer protocol.
+
+    Notes
+    -----
+    * The result is cached per type, so that scalars cost a single dictionary lookup.
+    """
+    cls = type(obj)
+    flag = ARRAY_TYPES.get(cls)
+
+    if flag is None:
+        flag = ARRAY_TYPES[cls] = hasattr(cls, "__array__") or supports_buffer(obj)
+
+    return flag
+
+
+def supports_buffer(obj: Any, /) -> bool:
+    """Return :obj:`True` if ``obj`` implements the buffer protocol."""
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+    return True
+
+
+@cache
+def numpy() -> ModuleType | None:
+    """Return the :mod:`numpy` module, or :obj:`None` if it is not installed.
+
+    Notes
+    -----
+    * :mod:`numpy` is imported lazily, on the first array-like item.
+    """
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
+
+
+def as_vector(obj: Any, /) -> Any:
+    """Return a flat view of the array-like object.
+
+    Notes
+    -----
+    * Objects implementing ``__array__()`` are converted by :mod:`numpy` if it is installed.
+      Otherwise, and for plain buffers, a one-dimensional :class:`memoryview` is returned.
+    """
+    module = numpy()
+
+    if module is not None and hasattr(type(obj), "__array__"):
+        return module.ravel(module.asarray(obj))
+
+    view = memoryview(obj)
+    return view if view.ndim == 1 else view.cast("B").cast(view.format)  # type: ignore[call-overload]
+
+
+def size_of(obj: Any, /) -> int:
+    """Return the number of elements of the array-like object, or ``1`` for a scalar."""
+    if not is_array(obj):
+        return 1
+
+    vector = as_vector(obj)
+    return len(vector) if isinstance(vector, memoryview) else int(vector.size)
+
+
+def sum_of(obj: Any, /) -> list[Any]:
+    """Return the sum of the array-like object, or the scalar itself."""
+    if not is_array(obj):
+        return [obj]
+
+    vector = as_vector(obj)
+    return [sum(vector)] if isinstance(vector, memoryview) else [vector.sum()]
+
+
+def min_of(obj: Any, /) -> list[Any]:
+    """Return the smallest element of the array-like object, or the scalar itself."""
+    if not is_array(obj):
+        return [obj]
+
+    vector = as_vector(obj)
+
+    if not len(vector):
+        return []
+
+    return [min(vector)] if isinstance(vector, memoryview) else [vector.min()]
+
+
+def max_of(obj: Any, /) -> list[Any]:
+    """Return the largest element of the array-like object, or the scalar itself."""
+    if not is_array(obj):
+        return [obj]
+
+    vector = as_vector(obj)
+
+    if not len(vector):
+        return []
+
+    return [max(vector)] if isinstance(vector, memoryview) else [vector.max()]
+
+
+def minmax_of(obj: Any, /) -> list[Any]:
+    """Return the smallest and the largest elements of the array-like object, or the scalar."""
+    if not is_array(obj):
+        return [obj]
+
+    vector = as_vector(obj)
+
+    if not len(vector):
+        return []
+
+    if isinstance(vector, memoryview):
+        return [min(vector), max(vector)]
+
+    return [vector.min(), vector.max()]
+
+
+def moments_of(obj: Any, /) -> tuple[int, Any, Any]:
+    """Return the count, the mean and the sum of squared deviations of the array-like object."""
+    if not is_array(obj):
+        return (1, obj, 0)
+
+    vector = as_vector(obj)
+    count = len(vector)
+
+    if not count:
+        return (0, 0, 0)
+
+    if isinstance(vector, memoryview):
+        mean = sum(vector) / count
+        return (count, mean, sum((item - mean) ** 2 for item in vector))
+
+    mean = vector.mean()
+    return (count, mean, ((vector - mean) ** 2).sum())
+
+
+@dataclass(repr=False, slots=True)
+class ChunkReducer(AsyncIterator[Any]):
+    """An asynchronous iterator over the per-chunk reductions of ``aiterator``.
+
+    Notes
+    -----
+    * Each item of ``aiterator`` is replaced by the items returned by ``reduce``, so that the
+      reducer may run on the reductions instead of the elements;
+    * Items are pulled by batches if ``aiterator`` implements ``__anext_batch__()``.
+    """
+
+    aiterator: AsyncIterator[Any]
+    reduce: Callable[[Any], list[Any]]
+    _buffer: deque[Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._buffer = deque()
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> Any:
+        """Return the next item."""
+        while not self._buffer:
+            item = await anext(self.aiterator)
+            self._buffer.extend(self.reduce(item))
+
+        return self._buffer.popleft()
+
+    async def __anext_batch__(self, max_n: int, /) -> list[Any]:
+        """Return up to ``max_n`` next items."""
+        while not self._buffer:
+            items = await anext_batch(self.aiterator, max_n)
+
+            if not items:
+                raise StopAsyncIteration
+
+            for item in items:
+                self._buffer.extend(self.reduce(item))
+
+        count = min(max_n, len(self._buffer))
+        return [self._buffer.popleft() for _ in range(count)]
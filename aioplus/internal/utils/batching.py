@@ -0,0 +1,52 @@
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+
+if TYPE_CHECKING:
+    from aioplus.internal.utils.typing import SupportsAnextBatch
+
+
+T = TypeVar("T")
+
+BATCH_SIZE = 1024
+
+
+def supports_anext_batch(obj: Any, /) -> bool:
+    """Return :obj:`True` if ``obj`` implements ``__anext_batch__()``.
+
+    Notes
+    -----
+    * Unlike :func:`isinstance` with :class:`SupportsAnextBatch`, only the type is inspected, which
+      is cheap enough to be called per batch.
+    """
+    return hasattr(type(obj), "__anext_batch__")
+
+
+async def anext_batch(aiterator: AsyncIterator[T], max_n: int = BATCH_SIZE, /) -> list[T]:
+    """Return up to ``max_n`` next items of ``aiterator``.
+
+    Parameters
+    ----------
+    aiterator : AsyncIterator[T]
+        The asynchronous iterator.
+
+    max_n : int, default 1024
+        The maximum number of items.
+
+    Returns
+    -------
+    list[T]
+        The items. If empty, ``aiterator`` is exhausted.
+
+    Notes
+    -----
+    * If ``aiterator`` does not implement ``__anext_batch__()``, a single item is returned.
+    """
+    try:
+        if supports_anext_batch(aiterator):
+            return await cast("SupportsAnextBatch[T]", aiterator).__anext_batch__(max_n)
+
+        return [await anext(aiterator)]
+
+    except StopAsyncIteration:
+        return []
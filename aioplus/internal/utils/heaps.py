@@ -0,0 +1,144 @@
+from collections.abc import AsyncIterable, Callable, Iterable
+from dataclasses import dataclass, field
+from heapq import heappush, heapreplace
+from typing import Any, Generic, Self, TypeVar
+
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
+
+
+T = TypeVar("T")
+
+
+async def aselect(
+    aiterable: AsyncIterable[Any],
+    /,
+    *,
+    n: int,
+    key: Callable[[Any], Any] | None,
+    default: Any,
+    largest: bool,
+) -> Any:
+    """Return the ``n`` largest (or smallest) items in ``aiterable``.
+
+    Notes
+    -----
+    * Implements both :func:`aioplus.anlargest` and :func:`aioplus.ansmallest`, including the
+      validation of the arguments.
+    """
+    if not isinstance(aiterable, AsyncIterable):
+        detail = "'aiterable' must be 'AsyncIterable'"
+        raise TypeError(detail)
+
+    if not isinstance(n, int):
+        detail = "'n' must be 'int'"
+        raise TypeError(detail)
+
+    if n < 0:
+        detail = "'n' must be non-negative"
+        raise ValueError(detail)
+
+    if key is not None and not callable(key):
+        detail = "'key' must be 'Callable' or 'None'"
+        raise TypeError(detail)
+
+    if n == 0:
+        return []
+
+    aiterator = aiter(aiterable)
+    selector = HeapSelector(n, key, largest)
+
+    if supports_anext_batch(aiterator):
+        while items := await anext_batch(aiterator):
+            selector.extend(items)
+
+    else:
+        async for item in aiterator:
+            selector.extend((item,))
+
+    if selected := selector.result():
+        return selected
+
+    if default is not ...:
+        return default
+
+    name = "anlargest" if largest else "ansmallest"
+    detail = f"{name}(): empty iterable"
+    raise ValueError(detail)
+
+
+@dataclass(repr=False, eq=False, slots=True)
+class Reversed:
+    """An object that compares in the reverse order of ``value``."""
+
+    value: Any
+
+    def __lt__(self, other: Self, /) -> bool:
+        """Return ``self < other``."""
+        return other.value < self.value
+
+
+@dataclass(repr=False, slots=True)
+class HeapSelector(Generic[T]):
+    """A bounded heap that keeps the ``n`` largest (or smallest) items seen so far.
+
+    Notes
+    -----
+    * The heap is ordered by ``(key, order)``, where ``order`` makes earlier items win ties, just
+      like :func:`heapq.nlargest` and :func:`heapq.nsmallest`;
+    * An item is compared against the root only, so it costs ``O(log n)`` only if it is kept.
+    """
+
+    n: int
+    key: Callable[[T], Any] | None
+    largest: bool
+    _heap: list[tuple[Any, T]] = field(init=False)
+    _order: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._heap = []
+        self._order = 0
+
+    def extend(self, items: Iterable[T], /) -> None:
+        """Offer the items to the heap."""
+        if self.largest:
+            self._extend_largest(items)
+        else:
+            self._extend_smallest(items)
+
+    def result(self) -> list[T]:
+        """Return the kept items, best first."""
+        entries = sorted(self._heap, key=lambda entry: entry[0], reverse=True)
+        return [item for _, item in entries]
+
+    def _extend_largest(self, items: Iterable[T], /) -> None:
+        """Offer the items to the min-heap of the largest items."""
+        heap, key, n, order = self._heap, self.key, self.n, self._order
+
+        for item in items:
+            value = item if key is None else key(item)
+
+            if len(heap) < n:
+                heappush(heap, ((value, order), item))
+            elif heap[0][0][0] < value:
+                heapreplace(heap, ((value, order), item))
+
+            order -= 1
+
+        self._order = order
+
+    def _extend_smallest(self, items: Iterable[T], /) -> None:
+        """Offer the items to the max-heap of the smallest items."""
+        heap, key, n, order = self._heap, self.key, self.n, self._order
+
+        for item in items:
+            value = item if key is None else key(item)
+
+            if len(heap) < n:
+                heappush(heap, (Reversed((value, order)), item))
+            elif value < heap[0][0].value[0]:
+                heapreplace(heap, (Reversed((value, order)), item))
+
+            order += 1
+
+        self._order = order
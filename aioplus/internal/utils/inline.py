@@ -0,0 +1,97 @@
+from asyncio import CancelledError, Task, current_task, gather, wait
+from collections.abc import AsyncIterator, Iterable, Sequence
+from types import EllipsisType
+from typing import Any, TypeVar
+
+from aioplus.internal.utils.tasks import spawn
+
+
+T = TypeVar("T")
+
+
+async def anext_or_ellipsis(aiterator: AsyncIterator[T], /) -> T | EllipsisType:
+    """Return the next item of ``aiterator``, or :obj:`Ellipsis` if it is exhausted."""
+    try:
+        return await aiterator.__anext__()
+    except StopAsyncIteration:
+        return ...
+
+
+def cancelling() -> bool:
+    """Return :obj:`True` if the current task is being cancelled."""
+    task = current_task()
+    return task is not None and task.cancelling() > 0
+
+
+async def anext_all(
+    aiterators: Sequence[AsyncIterator[T]],
+    indices: Iterable[int],
+    results: list[Any],
+    /,
+) -> list[BaseException]:
+    """Pull the next item of each asynchronous iterator concurrently.
+
+    Parameters
+    ----------
+    aiterators : Sequence[AsyncIterator[T]]
+        The asynchronous iterators.
+
+    indices : Iterable[int]
+        The indices of the asynchronous iterators to pull.
+
+    results : list[Any]
+        The buffer to store the items in. Exhausted asynchronous iterators are marked with
+        :obj:`Ellipsis`.
+
+    Returns
+    -------
+    list[BaseException]
+        The exceptions raised by the asynchronous iterators.
+
+    Notes
+    -----
+    * Each ``__anext__()`` runs in a single task from start to end, so sources may rely on
+      :func:`asyncio.current_task` (for example, :func:`asyncio.timeout` or task groups);
+    * The last asynchronous iterator is awaited in the current task, the others in new tasks.
+      On Python 3.12+, new tasks start eagerly, so items that are ready are returned without
+      scheduling the tasks on the event loop. On Python 3.11, every pull but the last one takes
+      a round trip through the event loop;
+    * Exceptions of the last asynchronous iterator are collected like the others, except the
+      cancellation of the current task, which is propagated once the tasks are cancelled.
+    """
+    if not (pending := list(indices)):
+        return []
+
+    *others, last = pending
+    tasks: list[tuple[int, Task[Any]]] = [
+        (index, spawn(anext_or_ellipsis(aiterators[index]), eager=True)) for index in others
+    ]
+    exceptions: dict[int, BaseException] = {}
+
+    try:
+        try:
+            results[last] = await anext_or_ellipsis(aiterators[last])
+        except CancelledError as exception:
+            if cancelling():
+                raise
+            exceptions[last] = exception
+        except BaseException as exception:
+            exceptions[last] = exception
+
+        if any(not task.done() for _, task in tasks):
+            await gather(*(task for _, task in tasks), return_exceptions=True)
+
+    except BaseException:
+        for _, task in tasks:
+            task.cancel()
+        if tasks:
+            await wait([task for _, task in tasks])
+        raise
+
+    for index, task in tasks:
+        try:
+            results[index] = task.result()
+        except BaseException as exception:
+            exceptions[index] = exception
+
+    return [exceptions[index] for index in sorted(exceptions)]
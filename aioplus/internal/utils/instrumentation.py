@@ -0,0 +1,389 @@
+from asyncio import Task
+from bisect import bisect_left
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Generator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial, wraps
+from threading import local
+from time import perf_counter, time_ns
+from types import coroutine
+from typing import Any, ParamSpec, Self, TypeVar, cast
+
+from aioplus.internal.instrument import INSTRUMENTATION, LATENCY_BOUNDS, IteratorStats
+from aioplus.internal.utils.batching import supports_anext_batch
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+STATS: ContextVar[IteratorStats | None] = ContextVar("aioplus.stats", default=None)
+
+
+class Frames(local):
+    """The per-thread stack of the steps being timed, holding the time of their nested steps."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.stack: list[float] = []
+
+
+FRAMES = Frames()
+
+
+def instrumented(
+    name: str,
+    /,
+    *,
+    upstream: slice = slice(None),
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Instrument the iterators returned by the decorated function.
+
+    Parameters
+    ----------
+    name : str
+        The name reported in :class:`IteratorStats`.
+
+    upstream : slice, default slice(None)
+        The positional arguments to time as upstream, if they are asynchronous iterables.
+
+    Notes
+    -----
+    * If the iterator is not instrumented, the function is called as is. The only overhead is the
+      call of the wrapper and a single :class:`contextvars.ContextVar` lookup per iterator, see the
+      ``arange-calls`` benchmarks;
+    * Tasks created while the function runs, and later while the iterator runs, are counted by
+      :func:`track`.
+    """
+
+    def decorator(func: Callable[P, R], /) -> Callable[P, R]:
+        """Decorate the function."""
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            """Call the function."""
+            instrumentation = INSTRUMENTATION.get()
+
+            if instrumentation is None or not instrumentation.sample():
+                return func(*args, **kwargs)
+
+            stats = IteratorStats(name)
+            positional: list[Any] = list(args)
+
+            for index in range(len(positional))[upstream]:
+                if isinstance(arg := positional[index], AsyncIterable):
+                    positional[index] = Probe.wrap(aiter(arg), stats, link(arg, stats))
+
+            token = STATS.set(stats)
+            try:
+                aiterator = cast("Any", func)(*positional, **kwargs)
+            finally:
+                STATS.reset(token)
+
+            return cast("R", InstrumentedIterator.wrap(aiterator, stats, instrumentation.callback))
+
+        return wrapper
+
+    return decorator
+
+
+def link(aiterable: AsyncIterable[Any], consumer: IteratorStats, /) -> IteratorStats | None:
+    """Add the counters of ``aiterable`` to the sources of ``consumer``.
+
+    Returns
+    -------
+    IteratorStats, optional
+        The counters to update from the side of ``consumer``, if ``aiterable`` is not an
+        instrumented iterator.
+    """
+    if isinstance(aiterable, InstrumentedIterator):
+        aiterable.stats.consumer = consumer
+        consumer.sources.append(aiterable.stats)
+        return None
+
+    name = getattr(aiterable, "__qualname__", None) or type(aiterable).__qualname__
+    source = IteratorStats(name, consumer=consumer)
+    consumer.sources.append(source)
+    return source
+
+
+def observe(stats: IteratorStats, latency: float, /) -> None:
+    """Add the latency of a pull to ``wait_time`` and to the histogram."""
+    stats.wait_time += latency
+    stats.latencies[bisect_left(LATENCY_BOUNDS, latency)] += 1
+
+
+def track(task: Task[Any], stats: IteratorStats, /) -> None:
+    """Count the task, and count it again if it gets cancelled."""
+    stats.tasks_created += 1
+    task.add_done_callback(partial(on_task_done, stats))
+
+
+def on_task_done(stats: IteratorStats, task: Task[Any], /) -> None:
+    """Count the task if it has been cancelled."""
+    if task.cancelled():
+        stats.tasks_cancelled += 1
+
+
+@coroutine
+def measure(awaitable: Awaitable[T], stats: IteratorStats | None, /) -> Generator[Any, Any, T]:
+    """Await ``awaitable``, timing each step it runs without suspending.
+
+    Parameters
+    ----------
+    awaitable : Awaitable[T]
+        The awaitable.
+
+    stats : IteratorStats, optional
+        The counters to add the time of the steps to, excluding the time of the nested steps. If
+        :obj:`None`, the steps are only excluded from the enclosing ones.
+
+    Returns
+    -------
+    T
+        The result of ``awaitable``.
+    """
+    awaiter = awaitable.__await__()
+    stack = FRAMES.stack
+    value: Any = None
+    error: BaseException | None = None
+
+    while True:
+        stack.append(0.0)
+        token = STATS.set(stats)
+        start = perf_counter()
+
+        try:
+            yielded = awaiter.send(value) if error is None else awaiter.throw(error)
+        except StopIteration as stop:
+            result: T = stop.value
+            return result
+
+        finally:
+            elapsed = perf_counter() - start
+            STATS.reset(token)
+            nested = stack.pop()
+
+            if stack:
+                stack[-1] += elapsed
+            if stats is not None:
+                stats.busy_time += elapsed - nested
+
+        try:
+            value, error = (yield yielded), None
+
+        except GeneratorExit:
+            awaiter.close()
+            raise
+        except BaseException as exception:
+            value, error = None, exception
+
+
+@dataclass(repr=False, slots=True)
+class InstrumentedIterator(AsyncIterator[T]):
+    """An asynchronous iterator that counts the items and the time of ``aiterator``."""
+
+    aiterator: AsyncIterator[T]
+    stats: IteratorStats
+    callback: Callable[[IteratorStats], object]
+    _returned_at: float | None = field(init=False)
+    _reported_flg: bool = field(init=False)
+
+    @classmethod
+    def wrap(
+        cls,
+        aiterator: AsyncIterator[T],
+        stats: IteratorStats,
+        callback: Callable[[IteratorStats], object],
+        /,
+    ) -> "InstrumentedIterator[T]":
+        """Wrap ``aiterator``, keeping its support of ``__anext_batch__()``."""
+        if supports_anext_batch(aiterator):
+            return InstrumentedBatchIterator(aiterator, stats, callback)
+
+        return cls(aiterator, stats, callback)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._returned_at = None
+        self._reported_flg = False
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Return the next item."""
+        item: T = await self._pull(self.aiterator.__anext__(), batch=False)
+        return item
+
+    def __del__(self) -> None:
+        """Call the destructor."""
+        self._report()
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        aclose = getattr(self.aiterator, "aclose", None)
+
+        try:
+            if aclose is not None:
+                await aclose()
+        finally:
+            self._report()
+
+    def close(self) -> None:
+        """Close the iterator."""
+        close = getattr(self.aiterator, "close", None)
+
+        try:
+            if close is not None:
+                close()
+        finally:
+            self._report()
+
+    @coroutine
+    def _pull(self, awaitable: Awaitable[Any], /, *, batch: bool) -> Generator[Any, Any, Any]:
+        """Await ``awaitable``, updating the counters."""
+        stats = self.stats
+        start = perf_counter()
+
+        if self._returned_at is not None:
+            stats.idle_time += start - self._returned_at
+
+        try:
+            result = yield from measure(awaitable, stats)
+
+        except StopAsyncIteration:
+            self._returned(start)
+            self._report()
+            raise
+        except Exception:
+            stats.exceptions += 1
+            self._returned(start)
+            self._report()
+            raise
+        except BaseException:
+            self._returned(start)
+            raise
+
+        self._returned(start)
+        stats.items += len(result) if batch else 1
+        return result
+
+    def _returned(self, start: float, /) -> None:
+        """Add the time since ``start`` to the counters."""
+        self._returned_at = perf_counter()
+        observe(self.stats, self._returned_at - start)
+
+    def _report(self) -> None:
+        """Pass the counters to the callback, once."""
+        if not self._reported_flg:
+            self._reported_flg = True
+            self.stats.end_time_ns = time_ns()
+            self.callback(self.stats)
+
+
+@dataclass(repr=False, slots=True)
+class InstrumentedBatchIterator(InstrumentedIterator[T]):
+    """An asynchronous iterator that counts the items and the time of ``aiterator``."""
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        aiterator: Any = self.aiterator
+        items: list[T] = await self._pull(aiterator.__anext_batch__(max_n), batch=True)
+        return items
+
+
+@dataclass(repr=False, slots=True)
+class Probe(AsyncIterator[T]):
+    """An asynchronous iterator that times the pulls of an upstream ``aiterator``.
+
+    Notes
+    -----
+    * The time is added to ``upstream_time`` of ``stats``. If ``source`` is given, the pulls are
+      also counted in it.
+    """
+
+    aiterator: AsyncIterator[T]
+    stats: IteratorStats
+    source: IteratorStats | None
+
+    @classmethod
+    def wrap(
+        cls,
+        aiterator: AsyncIterator[T],
+        stats: IteratorStats,
+        source: IteratorStats | None,
+        /,
+    ) -> "Probe[T]":
+        """Wrap ``aiterator``, keeping its support of ``__anext_batch__()``."""
+        if supports_anext_batch(aiterator):
+            return BatchProbe(aiterator, stats, source)
+
+        return cls(aiterator, stats, source)
+
+    def __aiter__(self) -> Self:
+        """Return an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Return the next item."""
+        item: T = await self._pull(self.aiterator.__anext__(), batch=False)
+        return item
+
+    async def aclose(self) -> None:
+        """Close the iterator."""
+        aclose = getattr(self.aiterator, "aclose", None)
+
+        if aclose is not None:
+            await aclose()
+
+    @coroutine
+    def _pull(self, awaitable: Awaitable[Any], /, *, batch: bool) -> Generator[Any, Any, Any]:
+        """Await ``awaitable``, updating the counters."""
+        source = self.source
+        start = perf_counter()
+
+        try:
+            result = yield from measure(awaitable, None)
+
+        except StopAsyncIteration:
+            self._pulled(start, end=True)
+            raise
+        except Exception:
+            if source is not None:
+                source.exceptions += 1
+            self._pulled(start, end=True)
+            raise
+        except BaseException:
+            self._pulled(start, end=False)
+            raise
+
+        self._pulled(start, end=False)
+
+        if source is not None:
+            source.items += len(result) if batch else 1
+
+        return result
+
+    def _pulled(self, start: float, /, *, end: bool) -> None:
+        """Add the time since ``start`` to the counters."""
+        elapsed = perf_counter() - start
+        self.stats.upstream_time += elapsed
+
+        if self.source is not None:
+            observe(self.source, elapsed)
+
+            if end:
+                self.source.end_time_ns = time_ns()
+
+
+@dataclass(repr=False, slots=True)
+class BatchProbe(Probe[T]):
+    """An asynchronous iterator that times the pulls of an upstream ``aiterator``."""
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return up to ``max_n`` next items."""
+        aiterator: Any = self.aiterator
+        items: list[T] = await self._pull(aiterator.__anext_batch__(max_n), batch=True)
+        return items
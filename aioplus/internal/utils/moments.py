@@ -0,0 +1,68 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, Self
+
+from aioplus.internal.utils.arrays import moments_of
+from aioplus.internal.utils.batching import anext_batch, supports_anext_batch
+
+
+@dataclass(repr=False, slots=True)
+class Moments:
+    """The count, the mean and the sum of squared deviations of the items seen so far.
+
+    Notes
+    -----
+    * Items are added by Welford's algorithm, chunks are merged by Chan's algorithm. Neither
+      subtracts large sums, so the variance stays accurate for large means.
+    """
+
+    count: int = 0
+    mean: Any = 0.0
+    m2: Any = 0.0
+
+    @classmethod
+    async def from_aiterator(cls, aiterator: AsyncIterator[Any], /, *, flatten: bool) -> Self:
+        """Consume the iterator.
+
+        Notes
+        -----
+        * If ``flatten=True``, array-like items are merged as chunks.
+        """
+        moments = cls()
+
+        if supports_anext_batch(aiterator):
+            while items := await anext_batch(aiterator):
+                for item in items:
+                    moments.push(item, flatten=flatten)
+
+        else:
+            async for item in aiterator:
+                moments.push(item, flatten=flatten)
+
+        return moments
+
+    def push(self, item: Any, /, *, flatten: bool) -> None:
+        """Add the item, or merge it as a chunk if ``flatten=True``."""
+        if flatten:
+            self.merge(*moments_of(item))
+        else:
+            self.add(item)
+
+    def add(self, item: Any, /) -> None:
+        """Add the item."""
+        self.count += 1
+        delta = item - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (item - self.mean)
+
+    def merge(self, count: int, mean: Any, m2: Any, /) -> None:
+        """Merge the moments of a chunk."""
+        if not count:
+            return
+
+        total = self.count + count
+        delta = mean - self.mean
+
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
@@ -0,0 +1,254 @@
+import math
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any
+
+from aioplus.internal.utils.arrays import as_vector, is_array
+from aioplus.internal.utils.batching import BATCH_SIZE, anext_batch, supports_anext_batch
+
+
+BLOCK_SIZE = 128
+
+
+def exact_partials(*iterables: Iterable[Any]) -> list[float]:
+    """Return non-overlapping floats whose exact sum is the exact sum of ``iterables``.
+
+    Notes
+    -----
+    * Each partial is the correctly rounded sum of the residual, computed by :func:`math.fsum`.
+      Every step removes at least ``53`` bits, so only a few partials are ever returned;
+    * The iterables are iterated once per partial, so they must be re-iterable. They are never
+      copied;
+    * If the sum is not finite, it is returned as the only partial.
+    """
+    partials: list[float] = []
+    negated: list[float] = []
+
+    while total := math.fsum(chain(*iterables, negated)):
+        if not math.isfinite(total):
+            return [total]
+
+        partials.append(total)
+        negated.append(-total)
+
+    return partials
+
+
+@dataclass(repr=False, slots=True)
+class Summator(ABC):
+    """A streaming sum.
+
+    Notes
+    -----
+    * Chunks are array-like items, reduced without being copied into a list.
+    """
+
+    start: Any
+
+    @abstractmethod
+    def extend(self, items: Sequence[Any], /) -> None:
+        """Add the scalar items."""
+
+    @abstractmethod
+    def extend_chunk(self, vector: Any, /) -> None:
+        """Add the elements of the flat chunk."""
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Return the sum."""
+
+    async def aextend(self, aiterator: AsyncIterator[Any], /, *, flatten: bool) -> None:
+        """Add the items of ``aiterator``.
+
+        Notes
+        -----
+        * Items are pulled by batches if ``aiterator`` implements ``__anext_batch__()``.
+          Otherwise, they are buffered into batches, so that the per-batch work is amortized.
+        """
+        extend = self.extend_flat if flatten else self.extend
+
+        if supports_anext_batch(aiterator):
+            while items := await anext_batch(aiterator):
+                extend(items)
+            return
+
+        buffer: list[Any] = []
+
+        async for item in aiterator:
+            buffer.append(item)
+
+            if len(buffer) >= BATCH_SIZE:
+                extend(buffer)
+                buffer.clear()
+
+        extend(buffer)
+
+    def extend_flat(self, items: Sequence[Any], /) -> None:
+        """Add the items, treating array-like ones as chunks."""
+        scalars: list[Any] = []
+
+        for item in items:
+            if not is_array(item):
+                scalars.append(item)
+                continue
+
+            if scalars:
+                self.extend(scalars)
+                scalars = []
+
+            self.extend_chunk(as_vector(item))
+
+        if scalars:
+            self.extend(scalars)
+
+
+@dataclass(repr=False, slots=True)
+class FsumSummator(Summator):
+    """A correctly rounded sum, as returned by :func:`math.fsum`.
+
+    Notes
+    -----
+    * The exact sum seen so far is kept as a few non-overlapping floats. Each batch costs a few
+      :func:`math.fsum` calls over it.
+    """
+
+    _partials: list[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._partials = exact_partials([self.start])
+
+    def extend(self, items: Sequence[Any], /) -> None:
+        """Add the scalar items."""
+        self._partials = exact_partials(self._partials, items)
+
+    def extend_chunk(self, vector: Any, /) -> None:
+        """Add the elements of the flat chunk."""
+        self._partials = exact_partials(self._partials, vector)
+
+    def result(self) -> float:
+        """Return the sum."""
+        return math.fsum(self._partials)
+
+
+@dataclass(repr=False, slots=True)
+class KahanSummator(Summator):
+    """A compensated sum, by the Kahan-Babuska-Neumaier algorithm.
+
+    Notes
+    -----
+    * The error does not grow with the number of items;
+    * Chunks are reduced by :func:`math.fsum`, then added as a single item.
+    """
+
+    _total: Any = field(init=False)
+    _compensation: Any = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._total = self.start
+        self._compensation = 0
+
+    def extend(self, items: Sequence[Any], /) -> None:
+        """Add the scalar items."""
+        total, compensation = self._total, self._compensation
+
+        for item in items:
+            value = total + item
+
+            if abs(total) >= abs(item):
+                compensation += (total - value) + item
+            else:
+                compensation += (item - value) + total
+
+            total = value
+
+        self._total, self._compensation = total, compensation
+
+    def extend_chunk(self, vector: Any, /) -> None:
+        """Add the elements of the flat chunk."""
+        self.extend([math.fsum(vector)])
+
+    def result(self) -> Any:
+        """Return the sum."""
+        return self._total + self._compensation
+
+
+@dataclass(repr=False, slots=True)
+class PairwiseSummator(Summator):
+    """A pairwise sum.
+
+    Notes
+    -----
+    * Items are summed by blocks of ``128``. Block sums are merged like a binary counter, so only
+      ``O(log(n))`` of them are kept;
+    * Chunks are summed by blocks as well. Chunks that are not :class:`memoryview` are summed by
+      their own ``sum()``, which is pairwise for :mod:`numpy`.
+    """
+
+    _block: list[Any] = field(init=False)
+    _stack: list[tuple[int, Any]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._block = []
+        self._stack = []
+
+    def extend(self, items: Sequence[Any], /) -> None:
+        """Add the scalar items."""
+        block = self._block
+
+        if block:
+            missing = BLOCK_SIZE - len(block)
+            block.extend(items[:missing])
+            items = items[missing:]
+
+            if len(block) < BLOCK_SIZE:
+                return
+
+            self._push(sum(block))
+            block.clear()
+
+        length = len(items) - len(items) % BLOCK_SIZE
+
+        for index in range(0, length, BLOCK_SIZE):
+            self._push(sum(items[index : index + BLOCK_SIZE]))
+
+        block.extend(items[length:])
+
+    def extend_chunk(self, vector: Any, /) -> None:
+        """Add the elements of the flat chunk."""
+        if isinstance(vector, memoryview):
+            self.extend(vector)
+        elif len(vector):
+            self._push(vector.sum())
+
+    def result(self) -> Any:
+        """Return the sum."""
+        total: Any = sum(self._block)
+
+        for _, value in reversed(self._stack):
+            total = value + total
+
+        return self.start + total
+
+    def _push(self, value: Any, /) -> None:
+        """Push the block sum, merging the block sums of the same level."""
+        level = 0
+
+        while self._stack and self._stack[-1][0] == level:
+            _, other = self._stack.pop()
+            value = other + value
+            level += 1
+
+        self._stack.append((level, value))
+
+
+SUMMATORS: dict[str, type[Summator]] = {
+    "fsum": FsumSummator,
+    "kahan": KahanSummator,
+    "pairwise": PairwiseSummator,
+}
@@ -0,0 +1,168 @@
+import sys
+
+from asyncio import Future, Task, create_task, get_running_loop
+from collections import deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+from warnings import warn
+
+from aioplus.internal.utils.instrumentation import STATS, track
+
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+def spawn(coroutine: Coroutine[Any, Any, R], /, *, eager: bool = False) -> Task[R]:
+    """Wrap the coroutine into a task.
+
+    Parameters
+    ----------
+    coroutine : Coroutine[Any, Any, R]
+        The coroutine.
+
+    eager : bool, default False
+        If :obj:`True`, the task runs until it first suspends before being returned. Only used on
+        Python 3.12+.
+
+    Notes
+    -----
+    * If the task is created by an instrumented iterator, it is counted.
+    """
+    if sys.version_info >= (3, 12) and eager:
+        task = Task(coroutine, loop=get_running_loop(), eager_start=True)
+    else:
+        task = create_task(coroutine)
+
+    if (stats := STATS.get()) is not None:
+        track(task, stats)
+
+    return task
+
+
+@dataclass(repr=False, slots=True)
+class TaskQueue(Generic[K, R]):
+    """A queue of tasks, ordered by completion.
+
+    Notes
+    -----
+    * Tasks are moved to the queue by their done-callbacks, so waiting for the next completed task
+      does not depend on the number of pending tasks.
+    """
+
+    name: str
+    on_done: Callable[[Task[R], K], None] | None = None
+    _stopped_flg: bool = field(init=False)
+    _pending: dict[Task[R], K] = field(init=False)
+    _done: deque[tuple[Task[R], K]] = field(init=False)
+    _waiter: Future[None] | None = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._stopped_flg = False
+        self._pending = {}
+        self._done = deque()
+        self._waiter = None
+
+    def __len__(self) -> int:
+        """Return the number of pending and completed tasks."""
+        return len(self._pending) + len(self._done)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of pending tasks."""
+        return len(self._pending)
+
+    @property
+    def done(self) -> int:
+        """Return the number of completed tasks."""
+        return len(self._done)
+
+    @property
+    def stopped(self) -> bool:
+        """Return :obj:`True` if the queue has been cancelled or closed."""
+        return self._stopped_flg
+
+    def schedule(self, coroutine: Coroutine[Any, Any, R], key: K, /) -> None:
+        """Wrap the coroutine into a task."""
+        task = spawn(coroutine)
+        self._pending[task] = key
+        task.add_done_callback(self._on_done)
+
+    def popleft(self) -> tuple[Task[R], K]:
+        """Remove and return the earliest completed task."""
+        return self._done.popleft()
+
+    def cancel_all(self) -> None:
+        """Cancel all pending tasks."""
+        self._stopped_flg = True
+        for task in self._pending:
+            if not task.done():
+                task.cancel()
+
+    async def wait_all(self) -> None:
+        """Wait until all tasks are done."""
+        while self._pending:
+            await self._wait()
+
+    async def wait_once(self) -> None:
+        """Wait until at least one task is done."""
+        while self._pending and not self._done:
+            await self._wait()
+
+    def close(self) -> None:
+        """Close the queue, warning about tasks that will never be awaited."""
+        self._stopped_flg = True
+
+        for task in list(self._pending):
+            if task.done():
+                key = self._pending.pop(task)
+                self._done.append((task, key))
+
+        if tasks := list(self._pending):
+            detail = f"{self.name}.close(): task(-s) will never be awaited: {tasks!r}"
+            warn(detail, RuntimeWarning, stacklevel=3)
+
+        base_exceptions: list[BaseException] = []
+
+        while self._done:
+            task, _ = self._done.popleft()
+            try:
+                if not task.cancelled():
+                    task.result()
+
+            except BaseExceptionGroup as group:
+                base_exceptions.extend(group.exceptions)
+            except BaseException as exception:
+                base_exceptions.append(exception)
+
+        if base_exceptions:
+            detail = f"{self.name}.close(): base exception(-s) occurred: {base_exceptions!r}"
+            warn(detail, RuntimeWarning, stacklevel=3)
+
+        self._pending.clear()
+        self._done.clear()
+
+    def _on_done(self, task: Task[R], /) -> None:
+        """Move the task to the completed ones and wake up the consumer."""
+        if task not in self._pending:
+            return
+
+        key = self._pending.pop(task)
+        self._done.append((task, key))
+
+        if self.on_done is not None:
+            self.on_done(task, key)
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _wait(self) -> None:
+        """Wait until any pending task is done."""
+        loop = get_running_loop()
+        self._waiter = loop.create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
@@ -1,6 +1,7 @@
 from typing import Protocol, Self, TypeVar, runtime_checkable
 
 
+T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
 T_contra = TypeVar("T_contra", contravariant=True)
 
@@ -9,6 +10,8 @@ T_contra = TypeVar("T_contra", contravariant=True)
 class SupportsAdd(Protocol[T_contra, T_co]):
     """An ABC with one abstract method `__add__`."""
 
+    __slots__ = ()
+
     def __add__(self, x: T_contra, /) -> T_co:
         """Perform addition operation."""
 
@@ -17,6 +20,8 @@ class SupportsAdd(Protocol[T_contra, T_co]):
 class SupportsBool(Protocol):
     """An ABC with one abstract method `__bool__`."""
 
+    __slots__ = ()
+
     def __bool__(self) -> bool:
         """Perform boolean conversion."""
 
@@ -25,6 +30,8 @@ class SupportsBool(Protocol):
 class SupportsRAdd(Protocol[T_contra, T_co]):
     """An ABC with one abstract method `__radd__`."""
 
+    __slots__ = ()
+
     def __radd__(self, x: T_contra, /) -> T_co:
         """Perform reverse addition operation."""
 
@@ -33,6 +40,8 @@ class SupportsRAdd(Protocol[T_contra, T_co]):
 class SupportsDunderLT(Protocol[T_contra]):
     """An ABC with one abstract method `__lt__`."""
 
+    __slots__ = ()
+
     def __lt__(self, other: T_contra, /) -> bool:
         """Perform less-than comparison."""
 
@@ -41,6 +50,8 @@ class SupportsDunderLT(Protocol[T_contra]):
 class SupportsDunderGT(Protocol[T_contra]):
     """An ABC with one abstract method `__gt__`."""
 
+    __slots__ = ()
+
     def __gt__(self, other: T_contra, /) -> bool:
         """Perform greater-than comparison."""
 
@@ -49,6 +60,8 @@ class SupportsDunderGT(Protocol[T_contra]):
 class SupportsAclose(Protocol):
     """An ABC with one abstract method `aclose`."""
 
+    __slots__ = ()
+
     async def aclose(self) -> object:
         """Close the object."""
 
@@ -57,6 +70,8 @@ class SupportsAclose(Protocol):
 class AcloseableIterator(Protocol[T_co]):
     """An ABC that implements three abstract methods: `__aiter__`, `__anext__` and `aclose`."""
 
+    __slots__ = ()
+
     def __aiter__(self) -> Self:
         """Return self."""
 
@@ -65,3 +80,13 @@ class AcloseableIterator(Protocol[T_co]):
 
     async def aclose(self) -> object:
         """Close the object."""
+
+
+@runtime_checkable
+class SupportsAnextBatch(Protocol[T]):
+    """An ABC with one abstract method `__anext_batch__`."""
+
+    __slots__ = ()
+
+    async def __anext_batch__(self, max_n: int, /) -> list[T]:
+        """Return a non-empty list of up to ``max_n`` next items."""
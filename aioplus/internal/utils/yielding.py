@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from time import monotonic
+
+from aioplus.internal.yield_policy import YIELD_POLICY, YieldPolicy
+
+
+@dataclass(repr=False, slots=True)
+class Yielder:
+    """A tracker that decides when to yield control to the event loop."""
+
+    every: int | None
+    interval: float | None
+    _countdown: int = field(init=False)
+    _deadline: float = field(init=False)
+
+    @classmethod
+    def from_policy(cls, policy: YieldPolicy | None, /) -> "Yielder":
+        """Create a tracker from ``policy`` or, if :obj:`None`, from the current default policy."""
+        if policy is None:
+            policy = YIELD_POLICY.get()
+
+        return cls(policy.every, policy.interval)
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._countdown = self.every or 0
+        self._deadline = 0.0 if self.interval is None else monotonic() + self.interval
+
+    def due(self, count: int = 1, /) -> bool:
+        """Return :obj:`True` if control must be yielded after ``count`` more items."""
+        if self.every == 1:
+            return True
+
+        if self.every is not None:
+            self._countdown -= count
+            if self._countdown <= 0:
+                self._countdown = self.every
+                self._reset()
+                return True
+
+        if self.interval is not None and (now := monotonic()) >= self._deadline:
+            self._deadline = now + self.interval
+            return True
+
+        return False
+
+    def _reset(self) -> None:
+        """Restart the interval."""
+        if self.interval is not None:
+            self._deadline = monotonic() + self.interval
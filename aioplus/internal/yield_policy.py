@@ -0,0 +1,98 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class YieldPolicy:
+    """A policy of yielding control to the event loop.
+
+    Attributes
+    ----------
+    every : int, optional
+        Yield control every ``every`` items. If :obj:`None`, items are not counted.
+
+    interval : float, optional
+        Yield control if ``interval`` seconds have passed since the last yield. If :obj:`None`,
+        time is not tracked.
+
+    Examples
+    --------
+    >>> policy = YieldPolicy(every=1024)
+    >>> [num async for num in arange(23, yield_policy=policy)]
+    [0, 1, 2, 3, 4, ..., 19, 20, 21, 22]
+
+    Notes
+    -----
+    * If both ``every`` and ``interval`` are :obj:`None`, control is never yielded. Iterating an
+      infinite iterator with such a policy blocks the event loop;
+    * The default policy, ``YieldPolicy()``, yields control on every item.
+    """
+
+    every: int | None = 1
+    interval: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the object."""
+        if self.every is not None and not isinstance(self.every, int):
+            detail = "'every' must be 'int' or 'None'"
+            raise TypeError(detail)
+
+        if self.every is not None and self.every <= 0:
+            detail = "'every' must be positive"
+            raise ValueError(detail)
+
+        if self.interval is not None and not isinstance(self.interval, float):
+            detail = "'interval' must be 'float' or 'None'"
+            raise TypeError(detail)
+
+        if self.interval is not None and self.interval <= 0.0:
+            detail = "'interval' must be positive"
+            raise ValueError(detail)
+
+
+DEFAULT_YIELD_POLICY = YieldPolicy()
+
+YIELD_POLICY: ContextVar[YieldPolicy] = ContextVar(
+    "aioplus.yield_policy",
+    default=DEFAULT_YIELD_POLICY,
+)
+
+
+@contextmanager
+def yield_policy(policy: YieldPolicy, /) -> Iterator[YieldPolicy]:
+    """Set the default yield policy of iterators created within the block.
+
+    Parameters
+    ----------
+    policy : YieldPolicy
+        The yield policy.
+
+    Returns
+    -------
+    Iterator[YieldPolicy]
+        The context manager.
+
+    Examples
+    --------
+    >>> with yield_policy(YieldPolicy(interval=0.001)):
+    ...     aiterable = arange(23)
+    >>> [num async for num in aiterable]
+    [0, 1, 2, 3, 4, ..., 19, 20, 21, 22]
+
+    Notes
+    -----
+    * The policy is read once, when an iterator is created. Iterating it outside the block does not
+      change its policy;
+    * The policy is stored in a :class:`contextvars.ContextVar`, so it is local to the current task.
+    """
+    if not isinstance(policy, YieldPolicy):
+        detail = "'policy' must be 'YieldPolicy'"
+        raise TypeError(detail)
+
+    token = YIELD_POLICY.set(policy)
+    try:
+        yield policy
+    finally:
+        YIELD_POLICY.reset(token)
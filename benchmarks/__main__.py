@@ -0,0 +1,111 @@
+"""Benchmarks of the public iterators and reducers.
+
+Examples
+--------
+Compare against the stored baseline::
+
+    python -m benchmarks
+
+Only run the cases of ``arace`` and ``azip`` on ``100000`` items::
+
+    python -m benchmarks -k arace -k azip --sizes 100000
+
+Store a new baseline::
+
+    python -m benchmarks --save benchmarks/baseline.json
+
+Notes
+-----
+* Only the standard library is required, so the suite runs offline;
+* The baseline is only meaningful on the machine it was measured on.
+"""
+
+import sys
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from benchmarks.runner import Result, header, load, measure, regressions, row, save
+from benchmarks.workloads import cases
+
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def parse_args() -> Namespace:
+    """Parse the command-line arguments."""
+    parser = ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        help="run the cases whose identifier contains the substring (repeatable)",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="10000",
+        help="comma-separated item counts (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="timed runs per case, the fastest is reported (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE,
+        help="results to compare against (default: %(default)s)",
+    )
+    parser.add_argument("--save", type=Path, help="save the results to the path")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed throughput drop, as a fraction of the baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with a non-zero status if any case regressed",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmarks."""
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    baseline = load(args.baseline) if args.baseline.exists() else {}
+
+    selected = [
+        case
+        for case in cases(sizes)
+        if not args.filter or any(pattern in case.id for pattern in args.filter)
+    ]
+
+    results: dict[str, Result] = {}
+
+    for line in header():
+        sys.stdout.write(f"{line}\n")
+
+    for case in selected:
+        results[case.id] = measure(case, repeat=args.repeat)
+        sys.stdout.write(f"{row(case.id, results[case.id], baseline)}\n")
+        sys.stdout.flush()
+
+    if args.save is not None:
+        save(args.save, results)
+
+    regressed = regressions(results, baseline, tolerance=args.tolerance)
+
+    for key in regressed:
+        sys.stdout.write(f"regression: {key}\n")
+
+    return 1 if args.check and regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import asyncio
+import gc
+import json
+import platform
+import tracemalloc
+
+from collections.abc import AsyncIterable, Coroutine
+from dataclasses import asdict, dataclass
+from itertools import pairwise
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter_ns
+from typing import Any
+
+from aioplus import CallerThreadExecutor
+from benchmarks.workloads import Case
+
+
+@dataclass(frozen=True)
+class Result:
+    """The measurements of a case.
+
+    Attributes
+    ----------
+    items_per_sec : float
+        The throughput of the fastest run.
+
+    p50_us, p90_us, p99_us : float, optional
+        The percentiles of the per-item latency, in microseconds. If :obj:`None`, the case does
+        not return items one by one.
+
+    peak_kib : float
+        The peak memory allocated during a run, in KiB.
+    """
+
+    items_per_sec: float
+    p50_us: float | None
+    p90_us: float | None
+    p99_us: float | None
+    peak_kib: float
+
+
+async def consume(case: Case, /, *, timestamps: list[int] | None = None) -> int:
+    """Run the case once and return the elapsed time, in nanoseconds.
+
+    Notes
+    -----
+    * If ``timestamps`` is given, the time of every returned item is appended to it.
+    """
+    if case.executor == "caller-thread":
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(CallerThreadExecutor())
+
+    start = perf_counter_ns()
+    target = case.workload.func(case)
+
+    if not isinstance(target, AsyncIterable):
+        await target
+
+    elif timestamps is None:
+        async for _ in target:
+            pass
+
+    else:
+        timestamps.append(start)
+
+        async for _ in target:
+            timestamps.append(perf_counter_ns())
+
+    return perf_counter_ns() - start
+
+
+async def trace(case: Case, /) -> int:
+    """Run the case once and return the peak memory allocated, in bytes."""
+    tracemalloc.start()
+
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await consume(case)
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return max(peak - current, 0)
+
+
+def measure(case: Case, /, *, repeat: int) -> Result:
+    """Measure the case.
+
+    Notes
+    -----
+    * Every run uses a new event loop and starts after a full garbage collection. The first run is
+      a warm-up and is discarded;
+    * The throughput is taken from the fastest of ``repeat`` runs. Latencies and memory are
+      measured by separate runs, so that neither instrumentation skews the throughput.
+    """
+    run(consume(case))
+    elapsed = min(run(consume(case)) for _ in range(repeat))
+
+    timestamps: list[int] = []
+    run(consume(case, timestamps=timestamps))
+    latencies = [end - start for start, end in pairwise(timestamps)]
+
+    p50_us = p90_us = p99_us = None
+
+    if len(latencies) > 1:
+        percentiles = quantiles(latencies, n=100)
+        p50_us, p90_us, p99_us = (percentiles[index] / 1e3 for index in (49, 89, 98))
+
+    peak = run(trace(case))
+
+    return Result(
+        items_per_sec=case.n / max(elapsed, 1) * 1e9,
+        p50_us=p50_us,
+        p90_us=p90_us,
+        p99_us=p99_us,
+        peak_kib=peak / 1024,
+    )
+
+
+def run(coroutine: Coroutine[Any, Any, int], /) -> int:
+    """Run the coroutine in a new event loop, after a full garbage collection."""
+    gc.collect()
+    return asyncio.run(coroutine)
+
+
+def load(path: Path, /) -> dict[str, Result]:
+    """Load the results saved by :func:`save`."""
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return {key: Result(**value) for key, value in document["results"].items()}
+
+
+def save(path: Path, results: dict[str, Result], /) -> None:
+    """Save the results, along with the interpreter and the machine they were measured on."""
+    document: dict[str, Any] = {
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "results": {key: asdict(value) for key, value in results.items()},
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def regressions(
+    results: dict[str, Result],
+    baseline: dict[str, Result],
+    /,
+    *,
+    tolerance: float,
+) -> list[str]:
+    """Return the cases whose throughput dropped by more than ``tolerance`` of the baseline."""
+    return [
+        key
+        for key, result in results.items()
+        if key in baseline and result.items_per_sec < baseline[key].items_per_sec * (1 - tolerance)
+    ]
+
+
+def header() -> list[str]:
+    """Return the header lines of the report."""
+    line = f"{'case':<60} {'items/s':>12} {'p50 us':>8} {'p99 us':>8} {'peak KiB':>9} {'delta':>8}"
+    return [line, "-" * len(line)]
+
+
+def row(key: str, result: Result, baseline: dict[str, Result], /) -> str:
+    """Return the report line of the case."""
+    delta = ""
+
+    if key in baseline:
+        ratio = result.items_per_sec / baseline[key].items_per_sec
+        delta = f"{ratio - 1:+.1%}"
+
+    return (
+        f"{key:<60} {result.items_per_sec:>12,.0f} {fmt(result.p50_us):>8} "
+        f"{fmt(result.p99_us):>8} {result.peak_kib:>9,.1f} {delta:>8}"
+    )
+
+
+def fmt(value: float | None, /) -> str:
+    """Format the optional latency."""
+    return "-" if value is None else f"{value:.2f}"
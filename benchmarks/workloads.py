@@ -0,0 +1,294 @@
+from asyncio import gather, sleep
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from inspect import unwrap
+from itertools import repeat
+from typing import Any
+
+from aioplus import (
+    YieldPolicy,
+    aall,
+    aany,
+    abatched,
+    achain,
+    acount,
+    acycle,
+    aempty,
+    aenumerate,
+    afirst,
+    ahead,
+    aislice,
+    alast,
+    alen,
+    amap,
+    amax,
+    amean,
+    amin,
+    aminmax,
+    anextify,
+    anlargest,
+    ansmallest,
+    anth,
+    apairwise,
+    apostpend,
+    aprepend,
+    arace,
+    arange,
+    arepeat,
+    areversed,
+    ashare,
+    astream,
+    asum,
+    atabulate,
+    atail,
+    atee,
+    atriplewise,
+    avar,
+    awaitify,
+    awindowed,
+    azip,
+    azip_longest,
+)
+
+
+KINDS = ("arange", "sync", "suspending")
+EXECUTORS = ("default", "caller-thread")
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A benchmarked call.
+
+    Attributes
+    ----------
+    name : str
+        The name of the workload.
+
+    func : Callable[[Case], AsyncIterable[Any] | Awaitable[Any]]
+        The callable. Iterables are exhausted, awaitables are awaited.
+
+    sources : tuple[int, ...]
+        The numbers of sources to run the workload with. If empty, the workload has no sources.
+
+    executor : bool
+        If :obj:`True`, the workload is run with both the default executor of the event loop and
+        :class:`aioplus.CallerThreadExecutor`.
+    """
+
+    name: str
+    func: Callable[["Case"], AsyncIterable[Any] | Awaitable[Any]]
+    sources: tuple[int, ...] = (1,)
+    executor: bool = False
+
+
+@dataclass(frozen=True)
+class Case:
+    """A workload with its parameters.
+
+    Attributes
+    ----------
+    workload : Workload
+        The workload.
+
+    n : int
+        The total number of items.
+
+    sources : int
+        The number of sources, or ``0`` if the workload has no sources.
+
+    kind : str, optional
+        The kind of sources: ``"arange"``, ``"sync"`` or ``"suspending"``.
+
+    executor : str, optional
+        The default executor of the event loop: ``"default"`` or ``"caller-thread"``.
+    """
+
+    workload: Workload
+    n: int
+    sources: int = 0
+    kind: str | None = None
+    executor: str | None = None
+
+    @property
+    def id(self) -> str:
+        """Return the identifier of the case."""
+        params = [f"n={self.n}"]
+
+        if self.sources:
+            params.append(f"sources={self.sources}")
+
+        if self.kind is not None:
+            params.append(f"kind={self.kind}")
+
+        if self.executor is not None:
+            params.append(f"executor={self.executor}")
+
+        return f"{self.workload.name}[{','.join(params)}]"
+
+    def source(self, count: int, /, *, value: int | None = None) -> AsyncIterable[int]:
+        """Return a source of ``count`` items.
+
+        Notes
+        -----
+        * Items are ``1, 2, ..., count``, or ``value`` repeated ``count`` times;
+        * ``"arange"`` sources are :func:`aioplus.arange` and :func:`aioplus.arepeat`, which
+          support batching. ``"sync"`` sources never suspend, ``"suspending"`` sources suspend on
+          every item.
+        """
+        if self.kind == "arange":
+            return arange(1, count + 1) if value is None else arepeat(value, times=count)
+
+        values = range(1, count + 1) if value is None else repeat(value, count)
+        return suspending(values) if self.kind == "suspending" else synchronous(values)
+
+    def split(self) -> list[AsyncIterable[int]]:
+        """Return ``sources`` sources of ``n`` items in total."""
+        size, rest = divmod(self.n, self.sources)
+        return [self.source(size + (index < rest)) for index in range(self.sources)]
+
+
+async def synchronous(values: Iterable[int], /) -> AsyncIterator[int]:
+    """Iterate ``values`` without suspending."""
+    for value in values:
+        yield value
+
+
+async def suspending(values: Iterable[int], /) -> AsyncIterator[int]:
+    """Iterate ``values``, suspending on every item."""
+    for value in values:
+        await sleep(0)
+        yield value
+
+
+async def identity(value: int, /) -> int:
+    """Return ``value``."""
+    return value
+
+
+async def afirst_calls(case: Case, /) -> None:
+    """Call :func:`aioplus.afirst` on ``n`` sources of a single item."""
+    for _ in range(case.n):
+        await afirst(case.source(1))
+
+
+async def aempty_calls(case: Case, /) -> None:
+    """Call :func:`aioplus.aempty` on ``n`` sources of a single item."""
+    for _ in range(case.n):
+        await aempty(case.source(1))
+
+
+async def awaitify_calls(case: Case, /) -> None:
+    """Await ``n`` calls of an awaitified function."""
+    afunc = awaitify(abs)
+
+    for value in range(case.n):
+        await afunc(value)
+
+
+async def arange_calls(case: Case, /) -> None:
+    """Create ``n`` iterators with :func:`aioplus.arange`, outside of any instrumentation."""
+    for _ in range(case.n):
+        arange(1)
+
+
+async def arange_raw_calls(case: Case, /) -> None:
+    """Create ``n`` iterators with :func:`aioplus.arange`, bypassing its instrumentation."""
+    func = unwrap(arange)
+
+    for _ in range(case.n):
+        func(1)
+
+
+async def ashare_subscribers(case: Case, /) -> None:
+    """Exhaust sixteen :func:`aioplus.ashare` subscribers of a single source concurrently."""
+    share = ashare(case.source(case.n), maxsize=64)
+    aiterators = [share.subscribe() for _ in range(16)]
+    await gather(*(alen(aiterator) for aiterator in aiterators))
+
+
+async def atee_consumers(case: Case, /) -> None:
+    """Exhaust two :func:`aioplus.atee` iterators of a single source concurrently."""
+    aiterators = atee(case.source(case.n), maxsize=64)
+    await gather(*(alen(aiterator) for aiterator in aiterators))
+
+
+WORKLOADS: tuple[Workload, ...] = (
+    Workload("aall", lambda case: aall(case.source(case.n))),
+    Workload("aany", lambda case: aany(case.source(case.n, value=0))),
+    Workload("abatched", lambda case: abatched(case.source(case.n), n=64)),
+    Workload("achain", lambda case: achain(*case.split()), sources=(1, 4)),
+    Workload("acount", lambda case: aislice(acount(), case.n), sources=()),
+    Workload("acycle", lambda case: aislice(acycle(case.source(case.n // 8)), case.n)),
+    Workload("aempty", aempty_calls),
+    Workload("aenumerate", lambda case: aenumerate(case.source(case.n))),
+    Workload("afirst", afirst_calls),
+    Workload("ahead", lambda case: ahead(case.source(case.n), n=case.n)),
+    Workload("aislice", lambda case: aislice(case.source(case.n), 1, case.n, 2)),
+    Workload("alast", lambda case: alast(case.source(case.n))),
+    Workload("alen", lambda case: alen(case.source(case.n))),
+    Workload("amap", lambda case: amap(identity, case.source(case.n), concurrency=16)),
+    Workload("amax", lambda case: amax(case.source(case.n))),
+    Workload("amean", lambda case: amean(case.source(case.n))),
+    Workload("amin", lambda case: amin(case.source(case.n))),
+    Workload("aminmax", lambda case: aminmax(case.source(case.n))),
+    Workload("anextify", lambda case: anextify(range(case.n)), sources=(), executor=True),
+    Workload(
+        "anextify-chunked",
+        lambda case: anextify(range(case.n), chunksize=64),
+        sources=(),
+        executor=True,
+    ),
+    Workload("anextify-thread", lambda case: anextify(range(case.n), mode="thread"), sources=()),
+    Workload("anlargest", lambda case: anlargest(case.source(case.n), n=16)),
+    Workload("ansmallest", lambda case: ansmallest(case.source(case.n), n=16)),
+    Workload("anth", lambda case: anth(case.source(case.n), n=case.n - 1)),
+    Workload("apairwise", lambda case: apairwise(case.source(case.n))),
+    Workload("apostpend", lambda case: apostpend(case.source(case.n), 0)),
+    Workload("aprepend", lambda case: aprepend(0, case.source(case.n))),
+    Workload("arace", lambda case: arace(*case.split()), sources=(1, 2, 4, 100, 10_000)),
+    Workload("arange", lambda case: arange(case.n), sources=()),
+    Workload("arange-calls", arange_calls, sources=()),
+    Workload("arange-calls-raw", arange_raw_calls, sources=()),
+    Workload(
+        "arange-every-64",
+        lambda case: arange(case.n, yield_policy=YieldPolicy(every=64)),
+        sources=(),
+    ),
+    Workload("arepeat", lambda case: arepeat(0, times=case.n), sources=()),
+    Workload("areversed", lambda case: areversed(case.source(case.n))),
+    Workload("ashare", ashare_subscribers),
+    Workload("astream", lambda case: astream(case.source(case.n)).enumerate().batched(64)),
+    Workload("asum", lambda case: asum(case.source(case.n))),
+    Workload("asum-fsum", lambda case: asum(case.source(case.n), mode="fsum")),
+    Workload("atabulate", lambda case: aislice(atabulate(identity), case.n), sources=()),
+    Workload("atail", lambda case: atail(case.source(case.n), n=16)),
+    Workload("atee", atee_consumers),
+    Workload("atriplewise", lambda case: atriplewise(case.source(case.n))),
+    Workload("avar", lambda case: avar(case.source(case.n))),
+    Workload("awaitify", awaitify_calls, sources=(), executor=True),
+    Workload("awindowed", lambda case: awindowed(case.source(case.n), n=4)),
+    Workload("azip", lambda case: azip(*case.split()), sources=(1, 4)),
+    Workload("azip_longest", lambda case: azip_longest(*case.split()), sources=(1, 4)),
+)
+
+
+def cases(sizes: Iterable[int], /) -> list[Case]:
+    """Return the cases of every workload for every item count."""
+    result: list[Case] = []
+
+    for n in sizes:
+        for workload in WORKLOADS:
+            executors: tuple[str | None, ...] = EXECUTORS if workload.executor else (None,)
+
+            for executor in executors:
+                if not workload.sources:
+                    result.append(Case(workload, n, executor=executor))
+                    continue
+
+                result.extend(
+                    Case(workload, n, sources, kind, executor)
+                    for sources in workload.sources
+                    for kind in KINDS
+                )
+
+    return result
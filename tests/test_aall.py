@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 import pytest
 
 from aioplus import aall, acount, arange
@@ -46,3 +48,14 @@ class TestFunction:
         flg = await aall(aiterable)
 
         assert not flg
+
+    async def test__aall__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator(n: int) -> AsyncIterator[int]:
+            for num in range(n):
+                yield num
+
+        flg = await aall(agenerator(23))
+
+        assert not flg
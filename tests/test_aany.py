@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 import pytest
 
 from aioplus import aany, acount, arange
@@ -46,3 +48,14 @@ class TestFunction:
         flg = await aany(aiterable)
 
         assert flg
+
+    async def test__aany__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator(n: int) -> AsyncIterator[int]:
+            for num in range(n):
+                yield num
+
+        flg = await aany(agenerator(23))
+
+        assert flg
@@ -1,5 +1,9 @@
+import asyncio
 import re
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
 import pytest
 
 from aioplus import abatched, arange
@@ -33,6 +37,56 @@ class TestParameters:
         with pytest.raises(TypeError):
             abatched(arange(0), n=23, strict=None)
 
+    def test__timeout(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError):
+            abatched(arange(0), n=23, timeout="23")
+
+    def test__timeout__bool(self) -> None:
+        """Case: boolean."""
+        with pytest.raises(TypeError):
+            abatched(arange(0), n=23, timeout=True)
+
+    def test__timeout__zero(self) -> None:
+        """Case: `timeout == 0.0`."""
+        with pytest.raises(ValueError, match="'timeout' must be positive"):
+            abatched(arange(0), n=23, timeout=0.0)
+
+    def test__n__max_weight(self) -> None:
+        """Case: neither `n` nor `max_weight` provided."""
+        with pytest.raises(TypeError, match="'n' or 'max_weight' must be provided"):
+            abatched(arange(0))
+
+    def test__max_weight(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError):
+            abatched(arange(0), max_weight="23", weight=abs)
+
+    def test__max_weight__bool(self) -> None:
+        """Case: boolean."""
+        with pytest.raises(TypeError):
+            abatched(arange(0), max_weight=True, weight=abs)
+
+    def test__max_weight__zero(self) -> None:
+        """Case: `max_weight == 0`."""
+        with pytest.raises(ValueError, match="'max_weight' must be positive"):
+            abatched(arange(0), max_weight=0, weight=abs)
+
+    def test__weight(self) -> None:
+        """Case: non-callable."""
+        with pytest.raises(TypeError):
+            abatched(arange(0), max_weight=23, weight=23)
+
+    def test__weight__missing(self) -> None:
+        """Case: `max_weight` without `weight`."""
+        with pytest.raises(ValueError, match="must be provided together"):
+            abatched(arange(0), max_weight=23)
+
+    def test__timeout__strict(self) -> None:
+        """Case: `strict` and `timeout` provided."""
+        with pytest.raises(ValueError, match="'strict' is not supported"):
+            abatched(arange(0), n=23, strict=True, timeout=0.1)
+
 
 class TestFunction:
     """Function tests."""
@@ -59,3 +113,136 @@ class TestFunction:
 
         with pytest.raises(ValueError, match=re.escape("abatched(): incomplete batch")):
             [batch async for batch in abatched(aiterable, n=4, strict=True)]
+
+    async def test__abatched__timeout(self) -> None:
+        """Case: fast iterable, `timeout` provided."""
+        aiterable = arange(10)
+
+        async with aclosing(abatched(aiterable, n=3, timeout=1.0)) as aiterator:
+            batches = [batch async for batch in aiterator]
+
+        assert batches == [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9,)]
+
+    async def test__abatched__timeout__int(self) -> None:
+        """Case: fast iterable, integer `timeout` provided."""
+        aiterable = arange(10)
+
+        async with aclosing(abatched(aiterable, n=3, timeout=1)) as aiterator:
+            batches = [batch async for batch in aiterator]
+
+        assert batches == [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9,)]
+
+    async def test__abatched__timeout__slow(self) -> None:
+        """Case: slow iterable, `timeout` provided."""
+
+        async def aiterable() -> AsyncIterator[int]:
+            for num in range(5):
+                if num == 2:
+                    await asyncio.sleep(0.2)
+                yield num
+
+        async with aclosing(abatched(aiterable(), n=4, timeout=0.05)) as aiterator:
+            batches = [batch async for batch in aiterator]
+
+        assert batches == [(0, 1), (2, 3, 4)]
+
+    async def test__abatched__timeout__aclose(self) -> None:
+        """Case: closed while a pull is in flight."""
+        event = asyncio.Event()
+
+        async def aiterable() -> AsyncIterator[int]:
+            yield 0
+            await event.wait()
+            yield 1
+
+        aiterator = abatched(aiterable(), n=4, timeout=0.01)
+        assert await anext(aiterator) == (0,)
+
+        await aiterator.aclose()
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator)
+
+    async def test__abatched__timeout__source(self) -> None:
+        """Case: the asynchronous iterable relies on its task."""
+
+        async def aiterable() -> AsyncIterator[int | str]:
+            for num in range(3):
+                try:
+                    async with asyncio.timeout(0.01):
+                        await asyncio.sleep(1.0 if num == 1 else 0.0)
+                except TimeoutError:
+                    yield "timeout"
+                else:
+                    yield num
+
+        async with aclosing(abatched(aiterable(), n=10, timeout=0.5)) as aiterator:
+            batches = [batch async for batch in aiterator]
+
+        assert batches == [(0, "timeout", 2)]
+
+    async def test__abatched__max_weight(self) -> None:
+        """Case: `max_weight` provided."""
+        aiterable = arange(1, 8)
+
+        batches = [batch async for batch in abatched(aiterable, max_weight=6, weight=float)]
+
+        assert batches == [(1, 2, 3), (4,), (5,), (6,), (7,)]
+
+    async def test__abatched__max_weight__n(self) -> None:
+        """Case: `n` and `max_weight` provided."""
+        aiterable = arange(10)
+
+        batches = [batch async for batch in abatched(aiterable, n=3, max_weight=10, weight=float)]
+
+        assert batches == [(0, 1, 2), (3, 4), (5,), (6,), (7,), (8,), (9,)]
+
+    async def test__abatched__max_weight__timeout(self) -> None:
+        """Case: `max_weight` and `timeout` provided."""
+        aiterable = arange(1, 8)
+        aiterator = abatched(aiterable, max_weight=6, weight=float, timeout=1.0)
+
+        async with aclosing(aiterator):
+            batches = [batch async for batch in aiterator]
+
+        assert batches == [(1, 2, 3), (4,), (5,), (6,), (7,)]
+
+    async def test__abatched__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = abatched(arange(10), n=3)
+
+        batch1 = await aiterator.__anext_batch__(2)
+        batch2 = await aiterator.__anext_batch__(2)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(2)
+
+        assert batch1 == [(0, 1, 2), (3, 4, 5)]
+        assert batch2 == [(6, 7, 8), (9,)]
+
+    @pytest.mark.parametrize(("n", "pulled"), [(10, 1020), (2000, 2000)])
+    async def test__abatched__batch__bounded(self, n: int, pulled: int) -> None:
+        """Case: `__anext_batch__` used, the items pulled per call are bounded."""
+        count = 0
+
+        async def aiterable() -> AsyncIterator[int]:
+            nonlocal count
+            for num in range(100_000):
+                count += 1
+                yield num
+
+        aiterator = abatched(aiterable(), n=n)
+        await aiterator.__anext_batch__(1024)
+
+        assert count == pulled
+
+    async def test__abatched__batch__strict(self) -> None:
+        """Case: `__anext_batch__` used, `strict` provided."""
+        aiterator = abatched(arange(10), n=3, strict=True)
+
+        batch = await aiterator.__anext_batch__(4)
+
+        with pytest.raises(ValueError, match=re.escape("abatched(): incomplete batch")):
+            await aiterator.__anext_batch__(4)
+
+        assert batch == [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
@@ -47,3 +47,16 @@ class TestFunction:
         async with aclosing(gen1()) as nums1, aclosing(gen2()) as nums2:
             with pytest.raises(RuntimeError):
                 [num async for num in achain(nums1, nums2)]
+
+    async def test__achain__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = achain(arange(2), arange(0), arange(2, 5))
+
+        batch1 = await aiterator.__anext_batch__(3)
+        batch2 = await aiterator.__anext_batch__(3)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(3)
+
+        assert batch1 == [0, 1]
+        assert batch2 == [2, 3, 4]
@@ -16,6 +16,11 @@ class TestParameters:
         with pytest.raises(TypeError):
             acount(4, "23")
 
+    def test__yield_policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError):
+            acount(yield_policy=23)
+
 
 class TestFunction:
     """Function tests."""
@@ -11,6 +11,11 @@ class TestParameters:
         with pytest.raises(TypeError):
             acycle(None)
 
+    def test__yield_policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError):
+            acycle(arange(23), yield_policy=23)
+
 
 class TestFunction:
     """Function tests."""
@@ -30,3 +35,17 @@ class TestFunction:
         nums = [num async for num in acycle(aiterable)]
 
         assert not nums
+
+    async def test__acycle__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = acycle(arange(4))
+
+        batch1 = await aiterator.__anext_batch__(3)
+        batch2 = await aiterator.__anext_batch__(3)
+        batch3 = await aiterator.__anext_batch__(3)
+        num = await anext(aiterator)
+
+        assert batch1 == [0, 1, 2]
+        assert batch2 == [3]
+        assert batch3 == [0, 1, 2]
+        assert num == 3
@@ -43,3 +43,16 @@ class TestFunction:
         pairs = [pair async for pair in aenumerate(aiterable, start=-2)]
 
         assert pairs == [(-2, 0), (-1, 1), (0, 2), (1, 3), (2, 4), (3, 5)]
+
+    async def test__aenumerate__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = aenumerate(arange(5), start=10)
+
+        batch1 = await aiterator.__anext_batch__(3)
+        batch2 = await aiterator.__anext_batch__(3)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(3)
+
+        assert batch1 == [(10, 0), (11, 1), (12, 2)]
+        assert batch2 == [(13, 3), (14, 4)]
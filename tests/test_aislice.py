@@ -92,3 +92,18 @@ class TestFunction:
         nums = [num async for num in aislice(aiterable, 4, 23)]
 
         assert not nums
+
+    async def test__aislice__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = aislice(arange(100), 5, 23, 4)
+
+        batch1 = await aiterator.__anext_batch__(2)
+        num = await anext(aiterator)
+        batch2 = await aiterator.__anext_batch__(23)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(23)
+
+        assert batch1 == [5, 9]
+        assert num == 13
+        assert batch2 == [17, 21]
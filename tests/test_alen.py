@@ -1,6 +1,9 @@
+from array import array
+from collections.abc import AsyncIterator
+
 import pytest
 
-from aioplus import alen, arange
+from aioplus import alen, anextify, arange
 
 
 class TestParameters:
@@ -11,6 +14,11 @@ class TestParameters:
         with pytest.raises(TypeError):
             await alen(None)
 
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await alen(arange(23), flatten=None)
+
 
 class TestFunction:
     """Function tests."""
@@ -30,3 +38,33 @@ class TestFunction:
         length = await alen(aiterator)
 
         assert length == 0
+
+    async def test__alen__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator(n: int) -> AsyncIterator[int]:
+            for num in range(n):
+                yield num
+
+        length = await alen(agenerator(23))
+
+        assert length == 23
+
+    async def test__alen__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        aiterable = anextify([array("d", [1.5, 2.5]), 3.0, array("d"), b"abc"])
+
+        length = await alen(aiterable, flatten=True)
+
+        assert length == 6
+
+    async def test__alen__flatten__agenerator(self) -> None:
+        """Case: `flatten` provided, asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[memoryview]:
+            yield memoryview(bytes(6)).cast("B", (2, 3))
+            yield memoryview(bytes(4))
+
+        length = await alen(agenerator(), flatten=True)
+
+        assert length == 10
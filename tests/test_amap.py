@@ -0,0 +1,202 @@
+import asyncio
+import re
+
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from functools import partial
+
+import pytest
+
+from aioplus import amap, arange
+
+
+async def asquare(num: int) -> int:
+    """Return the square of the number."""
+    await asyncio.sleep(0.001 * (num % 3))
+    return num * num
+
+
+async def amultiply(num: int, factor: int) -> int:
+    """Return the product of the numbers."""
+    await asyncio.sleep(0)
+    return num * factor
+
+
+class Squarer:
+    """A callable object, returning a coroutine."""
+
+    async def __call__(self, num: int) -> int:
+        """Return the square of the number."""
+        return await asquare(num)
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__afunc(self) -> None:
+        """Case: non-callable."""
+        with pytest.raises(TypeError):
+            amap(None, arange(23))
+
+    def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            amap(asquare, None)
+
+    def test__concurrency(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            amap(asquare, arange(23), concurrency=None)
+
+    def test__concurrency__zero(self) -> None:
+        """Case: `concurrency == 0`."""
+        with pytest.raises(ValueError, match="'concurrency' must be positive"):
+            amap(asquare, arange(23), concurrency=0)
+
+    def test__ordered(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            amap(asquare, arange(23), ordered=None)
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__amap(self) -> None:
+        """Case: default usage."""
+        async with aclosing(amap(asquare, arange(23))) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert nums == [num * num for num in range(23)]
+
+    async def test__amap__ordered(self) -> None:
+        """Case: concurrent calls, ordered results."""
+        async with aclosing(amap(asquare, arange(23), concurrency=4)) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert nums == [num * num for num in range(23)]
+
+    async def test__amap__unordered(self) -> None:
+        """Case: concurrent calls, unordered results."""
+        aiterator = amap(asquare, arange(23), concurrency=4, ordered=False)
+
+        async with aclosing(aiterator):
+            nums = [num async for num in aiterator]
+
+        assert nums != [num * num for num in range(23)]
+        assert sorted(nums) == [num * num for num in range(23)]
+
+    async def test__amap__concurrency(self) -> None:
+        """Case: the number of calls in flight is bounded."""
+        running = 0
+        peak = 0
+
+        async def afunc(num: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return num
+
+        async with aclosing(amap(afunc, arange(100), concurrency=8)) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert nums == list(range(100))
+        assert peak == 8
+
+    async def test__amap__exception(self) -> None:
+        """Case: a call raises an exception."""
+
+        async def afunc(num: int) -> int:
+            if num == 5:
+                detail = "5"
+                raise RuntimeError(detail)
+            await asyncio.sleep(0.001)
+            return num
+
+        aiterator = amap(afunc, arange(23), concurrency=4)
+        nums = [await anext(aiterator) for _ in range(5)]
+
+        with pytest.raises(ExceptionGroup, match=re.escape("amap(): exception(-s) occurred")):
+            await anext(aiterator)
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator)
+
+        assert nums == [0, 1, 2, 3, 4]
+
+    async def test__amap__partial(self) -> None:
+        """Case: `functools.partial` of a coroutine function."""
+        async with aclosing(amap(partial(amultiply, factor=2), arange(23))) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert nums == [num * 2 for num in range(23)]
+
+    async def test__amap__callable(self) -> None:
+        """Case: an object with `async __call__`."""
+        async with aclosing(amap(Squarer(), arange(23), concurrency=4)) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert nums == [num * num for num in range(23)]
+
+    async def test__amap__cancelled(self) -> None:
+        """Case: a call is cancelled."""
+
+        async def afunc(num: int) -> int:
+            if num == 2:
+                task = asyncio.current_task()
+                assert task is not None
+                task.cancel()
+            await asyncio.sleep(0)
+            return num
+
+        aiterator = amap(afunc, arange(23), concurrency=4)
+        nums = [await anext(aiterator) for _ in range(2)]
+
+        with pytest.raises(BaseExceptionGroup) as exc_info:
+            await anext(aiterator)
+
+        assert nums == [0, 1]
+        assert exc_info.group_contains(asyncio.CancelledError)
+
+    async def test__amap__timeout(self) -> None:
+        """Case: the consumer is cancelled while pulling."""
+
+        async def aiterable() -> AsyncIterator[int]:
+            for num in range(23):
+                await asyncio.sleep(1.0)
+                yield num
+
+        async with aclosing(amap(asquare, aiterable())) as aiterator:
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    [num async for num in aiterator]
+
+    async def test__amap__aclose(self) -> None:
+        """Case: closed before exhaustion."""
+        aiterator = amap(asquare, arange(23), concurrency=4)
+        await anext(aiterator)
+        await aiterator.aclose()
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator)
+
+    async def test__amap__latency(self) -> None:
+        """Case: the results are not delayed by a slow source."""
+        delay = 1.0
+
+        async def aiterable() -> AsyncIterator[int]:
+            yield 1
+            await asyncio.sleep(delay)
+            yield 2
+
+        loop = asyncio.get_running_loop()
+
+        async with aclosing(amap(asquare, aiterable(), concurrency=4)) as aiterator:
+            started_at = loop.time()
+            num = await anext(aiterator)
+            elapsed = loop.time() - started_at
+
+        assert num == 1
+        assert elapsed < delay / 2
@@ -1,8 +1,11 @@
 import re
 
+from array import array
+from collections.abc import AsyncIterator
+
 import pytest
 
-from aioplus import amax, arange
+from aioplus import amax, anextify, arange
 
 
 class TestParameters:
@@ -18,6 +21,16 @@ class TestParameters:
         with pytest.raises(TypeError):
             await amax(arange(23), key="4")
 
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await amax(arange(23), flatten=None)
+
+    async def test__flatten__key(self) -> None:
+        """Case: `flatten` and `key` provided."""
+        with pytest.raises(ValueError, match="'key' is not supported"):
+            await amax(arange(23), key=abs, flatten=True)
+
 
 class TestFunction:
     """Function tests."""
@@ -60,3 +73,62 @@ class TestFunction:
         largest = await amax(aiterable, key=lambda x: -x)
 
         assert largest == 0
+
+    async def test__amax__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator(n: int) -> AsyncIterator[int]:
+            for num in range(n):
+                yield num
+
+        largest = await amax(agenerator(23))
+
+        assert largest == 22
+
+    async def test__amax__key__calls(self) -> None:
+        """Case: `key` is called once per item."""
+        calls: list[int] = []
+
+        def key(num: int) -> int:
+            calls.append(num)
+            return num % 7
+
+        largest = await amax(arange(23), key=key)
+
+        assert largest == 6
+        assert calls == list(range(23))
+
+    async def test__amax__key__ties(self) -> None:
+        """Case: equal keys, the first item wins."""
+        aiterable = arange(23)
+
+        largest = await amax(aiterable, key=lambda x: x % 2)
+
+        assert largest == 1
+
+    async def test__amax__agenerator__key(self) -> None:
+        """Case: asynchronous generator, `key` provided."""
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in [3, 1, 4, 1, 5, 9, 2, 6, 5]:
+                yield num
+
+        largest = await amax(agenerator(), key=lambda x: x % 3)
+
+        assert largest == 5
+
+    async def test__amax__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        aiterable = anextify([array("d", [1.5, -2.5]), 3.0, array("d"), array("i", [4, 5])])
+
+        largest = await amax(aiterable, flatten=True)
+
+        assert largest == 5
+
+    async def test__amax__flatten__empty(self) -> None:
+        """Case: `flatten` provided, empty chunks."""
+        aiterable = anextify([array("d"), array("d")])
+
+        largest = await amax(aiterable, flatten=True, default=None)
+
+        assert largest is None
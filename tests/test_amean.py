@@ -0,0 +1,77 @@
+import re
+
+from array import array
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import amean, anextify, arange
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    async def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            await amean(None)
+
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await amean(arange(23), flatten=None)
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__amean(self) -> None:
+        """Case: default usage."""
+        aiterable = arange(23)
+
+        mean = await amean(aiterable)
+
+        assert mean == 11
+
+    async def test__amean__empty(self) -> None:
+        """Case: `len(...) == 0`."""
+        aiterable = arange(0)
+
+        with pytest.raises(ValueError, match=re.escape("amean(): empty iterable")):
+            await amean(aiterable)
+
+    async def test__amean__default(self) -> None:
+        """Case: `default` provided."""
+        aiterable = arange(0)
+
+        mean = await amean(aiterable, default=None)
+
+        assert mean is None
+
+    async def test__amean__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[float]:
+            for num in [1.0, 2.0, 4.0, 5.0]:
+                yield num
+
+        mean = await amean(agenerator())
+
+        assert mean == 3
+
+    async def test__amean__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        aiterable = anextify([array("d", [1.0, 2.0]), 3.0, array("d"), array("i", [4, 5])])
+
+        mean = await amean(aiterable, flatten=True)
+
+        assert mean == 3
+
+    async def test__amean__flatten__numpy(self) -> None:
+        """Case: `flatten` provided, :mod:`numpy` arrays."""
+        numpy = pytest.importorskip("numpy")
+        aiterable = anextify([numpy.arange(10).reshape(2, 5), numpy.arange(10, 20)])
+
+        mean = await amean(aiterable, flatten=True)
+
+        assert mean == pytest.approx(9.5)
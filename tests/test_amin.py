@@ -1,8 +1,11 @@
 import re
 
+from array import array
+from collections.abc import AsyncIterator
+
 import pytest
 
-from aioplus import amin, arange
+from aioplus import amin, anextify, arange
 
 
 class TestParameters:
@@ -18,6 +21,16 @@ class TestParameters:
         with pytest.raises(TypeError):
             await amin(arange(23), key="4")
 
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await amin(arange(23), flatten=None)
+
+    async def test__flatten__key(self) -> None:
+        """Case: `flatten` and `key` provided."""
+        with pytest.raises(ValueError, match="'key' is not supported"):
+            await amin(arange(23), key=abs, flatten=True)
+
 
 class TestFunction:
     """Function tests."""
@@ -60,3 +73,51 @@ class TestFunction:
         smallest = await amin(aiterable, key=lambda x: -x)
 
         assert smallest == 4
+
+    async def test__amin__key__calls(self) -> None:
+        """Case: `key` is called once per item."""
+        calls: list[int] = []
+
+        def key(num: int) -> int:
+            calls.append(num)
+            return num % 7
+
+        smallest = await amin(arange(23), key=key)
+
+        assert smallest == 0
+        assert calls == list(range(23))
+
+    async def test__amin__key__ties(self) -> None:
+        """Case: equal keys, the first item wins."""
+        aiterable = arange(23)
+
+        smallest = await amin(aiterable, key=lambda x: x % 2)
+
+        assert smallest == 0
+
+    async def test__amin__agenerator__key(self) -> None:
+        """Case: asynchronous generator, `key` provided."""
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in [3, 1, 4, 1, 5, 9, 2, 6, 5]:
+                yield num
+
+        smallest = await amin(agenerator(), key=lambda x: x % 3)
+
+        assert smallest == 3
+
+    async def test__amin__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        aiterable = anextify([array("d", [1.5, -2.5]), 3.0, array("d"), array("i", [4, 5])])
+
+        smallest = await amin(aiterable, flatten=True)
+
+        assert smallest == pytest.approx(-2.5)
+
+    async def test__amin__flatten__empty(self) -> None:
+        """Case: `flatten` provided, empty chunks."""
+        aiterable = anextify([array("d"), array("d")])
+
+        smallest = await amin(aiterable, flatten=True, default=None)
+
+        assert smallest is None
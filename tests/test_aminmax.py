@@ -1,8 +1,11 @@
 import re
 
+from array import array
+from collections.abc import AsyncIterator
+
 import pytest
 
-from aioplus import aminmax, arange
+from aioplus import aminmax, anextify, arange
 
 
 class TestParameters:
@@ -23,6 +26,16 @@ class TestParameters:
         with pytest.raises(TypeError):
             await aminmax(arange(23), default=4)
 
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await aminmax(arange(23), flatten=None)
+
+    async def test__flatten__key(self) -> None:
+        """Case: `flatten` and `key` provided."""
+        with pytest.raises(ValueError, match="'key' is not supported"):
+            await aminmax(arange(23), key=abs, flatten=True)
+
 
 class TestFunction:
     """Function tests."""
@@ -65,3 +78,71 @@ class TestFunction:
         smallest, largest = await aminmax(aiterable, key=lambda x: -x)
 
         assert (smallest, largest) == (4, 0)
+
+    async def test__aminmax__key__calls(self) -> None:
+        """Case: `key` is called once per item."""
+        calls: list[int] = []
+
+        def key(num: int) -> int:
+            calls.append(num)
+            return num % 7
+
+        smallest, largest = await aminmax(arange(23), key=key)
+
+        assert (smallest, largest) == (0, 6)
+        assert calls == list(range(23))
+
+    async def test__aminmax__key__ties(self) -> None:
+        """Case: equal keys, the first item wins."""
+        aiterable = arange(23)
+
+        smallest, largest = await aminmax(aiterable, key=lambda x: x // 2 % 2)
+
+        assert (smallest, largest) == (0, 2)
+
+    async def test__aminmax__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in [3, 1, 4, 1, 5, 9, 2, 6, 5]:
+                yield num
+
+        smallest, largest = await aminmax(agenerator(), key=lambda x: x % 3)
+
+        assert (smallest, largest) == (3, 5)
+
+    async def test__aminmax__agenerator__key__calls(self) -> None:
+        """Case: asynchronous generator, `key` is called once per item."""
+        calls: list[int] = []
+
+        def key(num: int) -> int:
+            calls.append(num)
+            return -num
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in range(5):
+                yield num
+
+        smallest, largest = await aminmax(agenerator(), key=key)
+
+        assert (smallest, largest) == (4, 0)
+        assert calls == list(range(5))
+
+    async def test__aminmax__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        aiterable = anextify([array("d", [1.5, -2.5]), 3.0, array("d"), array("i", [4, 5])])
+
+        smallest, largest = await aminmax(aiterable, flatten=True)
+
+        assert (smallest, largest) == (-2.5, 5)
+
+    async def test__aminmax__flatten__agenerator(self) -> None:
+        """Case: `flatten` provided, asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[array]:
+            for num in range(3):
+                yield array("i", [num, -num])
+
+        smallest, largest = await aminmax(agenerator(), flatten=True)
+
+        assert (smallest, largest) == (-2, 2)
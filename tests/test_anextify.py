@@ -1,3 +1,8 @@
+import asyncio
+import gc
+import threading
+import time
+
 from collections.abc import Generator
 
 import pytest
@@ -18,6 +23,46 @@ class TestParameters:
         with pytest.raises(TypeError):
             anextify([4], executor=23)
 
+    def test__chunksize(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            anextify([4], chunksize=None)
+
+    def test__chunksize__zero(self) -> None:
+        """Case: `chunksize == 0`."""
+        with pytest.raises(ValueError, match="'chunksize' must be positive"):
+            anextify([4], chunksize=0)
+
+    def test__max_latency(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError):
+            anextify([4], max_latency="23")
+
+    def test__mode(self) -> None:
+        """Case: unknown mode."""
+        with pytest.raises(ValueError, match="'mode' must be 'executor' or 'thread'"):
+            anextify([4], mode="process")
+
+    def test__maxsize(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            anextify([4], mode="thread", maxsize=None)
+
+    def test__maxsize__zero(self) -> None:
+        """Case: `maxsize == 0`."""
+        with pytest.raises(ValueError, match="'maxsize' must be positive"):
+            anextify([4], mode="thread", maxsize=0)
+
+    def test__mode__thread__executor(self) -> None:
+        """Case: `executor` provided if `mode='thread'`."""
+        with pytest.raises(ValueError, match="not supported if mode='thread'"):
+            anextify([4], mode="thread", executor=CallerThreadExecutor())
+
+    def test__max_latency__negative(self) -> None:
+        """Case: `max_latency < 0`."""
+        with pytest.raises(ValueError, match="'max_latency' must be non-negative"):
+            anextify([4], max_latency=-1.0)
+
 
 class TestFunction:
     """Function tests."""
@@ -58,3 +103,140 @@ class TestFunction:
         nums = [num async for num in aiterable]
 
         assert nums == [1, 2, 3, 4, 5]
+
+    async def test__anextify__chunksize(self) -> None:
+        """Case: `chunksize` provided."""
+        pulled: list[int] = []
+
+        def generator() -> Generator[int]:
+            """Yield and record."""
+            for num in range(10):
+                pulled.append(num)
+                yield num
+
+        aiterator = anextify(generator(), chunksize=4)
+
+        assert await anext(aiterator) == 0
+        assert pulled == [0, 1, 2, 3]
+
+        nums = [num async for num in aiterator]
+
+        assert nums == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    async def test__anextify__chunksize__exception(self) -> None:
+        """Case: exception raised in the middle of a chunk."""
+        detail = "This is a mock exception!"
+
+        def generator() -> Generator[int]:
+            """Yield and raise an exception."""
+            yield from range(3)
+            raise ValueError(detail)
+
+        aiterator = anextify(generator(), chunksize=23)
+        nums = [await anext(aiterator) for _ in range(3)]
+
+        with pytest.raises(ValueError, match=detail):
+            await anext(aiterator)
+
+        assert nums == [0, 1, 2]
+
+    async def test__anextify__max_latency(self) -> None:
+        """Case: `max_latency` provided."""
+        pulled: list[int] = []
+
+        def generator() -> Generator[int]:
+            """Yield slowly and record."""
+            for num in range(10):
+                time.sleep(0.01)
+                pulled.append(num)
+                yield num
+
+        aiterator = anextify(generator(), chunksize=10, max_latency=0.0)
+
+        assert await anext(aiterator) == 0
+        assert pulled == [0]
+
+    async def test__anextify__thread(self) -> None:
+        """Case: `mode='thread'`."""
+        iterable = range(100)
+
+        nums = [num async for num in anextify(iterable, mode="thread", maxsize=8)]
+
+        assert nums == list(range(100))
+
+    async def test__anextify__thread__empty(self) -> None:
+        """Case: `mode='thread'` & `len(...) == 0`."""
+        iterable: list[int] = []
+
+        nums = [num async for num in anextify(iterable, mode="thread")]
+
+        assert not nums
+
+    async def test__anextify__thread__exception(self) -> None:
+        """Case: `mode='thread'` & exception raised."""
+        detail = "This is a mock exception!"
+
+        def generator() -> Generator[int]:
+            """Yield and raise an exception."""
+            yield from range(23)
+            raise ValueError(detail)
+
+        aiterator = anextify(generator(), mode="thread", maxsize=4)
+        nums = [await anext(aiterator) for _ in range(23)]
+
+        with pytest.raises(ValueError, match=detail):
+            await anext(aiterator)
+
+        assert nums == list(range(23))
+
+    async def test__anextify__thread__maxsize(self) -> None:
+        """Case: `mode='thread'` & slow consumer."""
+        pulled: list[int] = []
+
+        def generator() -> Generator[int]:
+            """Yield and record."""
+            for num in range(100):
+                pulled.append(num)
+                yield num
+
+        aiterator = anextify(generator(), mode="thread", maxsize=4)
+        await anext(aiterator)
+        await asyncio.sleep(0.05)
+
+        assert len(pulled) <= 6
+
+        await aiterator.aclose()
+
+    async def test__anextify__thread__abandoned(self) -> None:
+        """Case: `mode='thread'` & the iterator is abandoned."""
+
+        def threads() -> int:
+            """Return the number of alive threads of `anextify`."""
+            return sum(thread.name == "aioplus-anextify" for thread in threading.enumerate())
+
+        before = threads()
+
+        for _ in range(5):
+            async for _ in anextify(range(100), mode="thread"):
+                break
+
+        gc.collect()
+        for _ in range(100):
+            if threads() == before:
+                break
+            await asyncio.sleep(0.01)
+
+        assert threads() == before
+
+    async def test__anextify__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = anextify(range(5), chunksize=3)
+
+        batch1 = await aiterator.__anext_batch__(23)
+        batch2 = await aiterator.__anext_batch__(23)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(23)
+
+        assert batch1 == [0, 1, 2]
+        assert batch2 == [3, 4]
@@ -0,0 +1,93 @@
+import re
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import anlargest, arange
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    async def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            await anlargest(None, n=3)
+
+    async def test__n(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            await anlargest(arange(23), n=None)
+
+    async def test__n__negative(self) -> None:
+        """Case: negative `n`."""
+        with pytest.raises(ValueError, match="'n' must be non-negative"):
+            await anlargest(arange(23), n=-1)
+
+    async def test__key(self) -> None:
+        """Case: non-callable."""
+        with pytest.raises(TypeError):
+            await anlargest(arange(23), n=3, key="4")
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__anlargest(self) -> None:
+        """Case: default usage."""
+        aiterable = arange(23)
+
+        largest = await anlargest(aiterable, n=3)
+
+        assert largest == [22, 21, 20]
+
+    async def test__anlargest__empty(self) -> None:
+        """Case: `len(...) == 0`."""
+        aiterable = arange(0)
+
+        with pytest.raises(ValueError, match=re.escape("anlargest(): empty iterable")):
+            await anlargest(aiterable, n=3)
+
+    async def test__anlargest__default(self) -> None:
+        """Case: `default` provided."""
+        aiterable = arange(0)
+
+        largest = await anlargest(aiterable, n=3, default=None)
+
+        assert largest is None
+
+    async def test__anlargest__zero(self) -> None:
+        """Case: `n == 0`."""
+        aiterable = arange(0)
+
+        largest = await anlargest(aiterable, n=0)
+
+        assert largest == []
+
+    async def test__anlargest__short(self) -> None:
+        """Case: `len(...) < n`."""
+        aiterable = arange(3)
+
+        largest = await anlargest(aiterable, n=5)
+
+        assert largest == [2, 1, 0]
+
+    async def test__anlargest__key(self) -> None:
+        """Case: `key` provided."""
+        aiterable = arange(23)
+
+        largest = await anlargest(aiterable, n=3, key=lambda x: x % 5)
+
+        assert largest == [4, 9, 14]
+
+    async def test__anlargest__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in [5, 1, 8, 3, 9, 2, 8]:
+                yield num
+
+        largest = await anlargest(agenerator(), n=3)
+
+        assert largest == [9, 8, 8]
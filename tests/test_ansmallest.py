@@ -0,0 +1,54 @@
+import re
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import ansmallest, arange
+
+
+# The validation, `n == 0` and `default` are shared with `anlargest()`, see `test_anlargest.py`
+class TestFunction:
+    """Function tests."""
+
+    async def test__ansmallest(self) -> None:
+        """Case: default usage."""
+        aiterable = arange(23)
+
+        smallest = await ansmallest(aiterable, n=3)
+
+        assert smallest == [0, 1, 2]
+
+    async def test__ansmallest__empty(self) -> None:
+        """Case: `len(...) == 0`."""
+        aiterable = arange(0)
+
+        with pytest.raises(ValueError, match=re.escape("ansmallest(): empty iterable")):
+            await ansmallest(aiterable, n=3)
+
+    async def test__ansmallest__short(self) -> None:
+        """Case: `len(...) < n`."""
+        aiterable = arange(3, 0, -1)
+
+        smallest = await ansmallest(aiterable, n=5)
+
+        assert smallest == [1, 2, 3]
+
+    async def test__ansmallest__key(self) -> None:
+        """Case: `key` provided."""
+        aiterable = arange(23)
+
+        smallest = await ansmallest(aiterable, n=3, key=lambda x: x % 5)
+
+        assert smallest == [0, 5, 10]
+
+    async def test__ansmallest__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in [5, 1, 8, 3, 9, 1, 8]:
+                yield num
+
+        smallest = await ansmallest(agenerator(), n=3)
+
+        assert smallest == [1, 1, 3]
@@ -1,3 +1,4 @@
+import asyncio
 import re
 
 from collections.abc import AsyncGenerator
@@ -21,6 +22,16 @@ class TestParameters:
         with pytest.raises(TypeError):
             arace(None, strict=23)
 
+    def test__prefetch(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            arace(arange(23), prefetch=None)
+
+    def test__prefetch__zero(self) -> None:
+        """Case: `prefetch == 0`."""
+        with pytest.raises(ValueError, match="'prefetch' must be positive"):
+            arace(arange(23), prefetch=0)
+
     async def test__arace__empty(self) -> None:
         """Case: empty call."""
         with pytest.raises(ValueError, match=re.escape("'*aiterables' must be non-empty")):
@@ -39,6 +50,57 @@ class TestFunction:
 
         assert sorted(nums) == [0, 1, 2, 3, 4, 5, 6, 7, 8]
 
+    async def test__arace__many(self) -> None:
+        """Case: many asynchronous iterables."""
+        aiterables = [arange(index, index + 3000, 1000) for index in range(1000)]
+
+        async with aclosing(arace(*aiterables)) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert sorted(nums) == list(range(3000))
+
+    async def test__arace__order(self) -> None:
+        """Case: items of each iterable are returned in order."""
+        aiterables = [arange(0, 100), arange(100, 200)]
+
+        async with aclosing(arace(*aiterables)) as aiterator:
+            nums = [num async for num in aiterator]
+
+        assert [num for num in nums if num < 100] == list(range(100))
+        assert [num for num in nums if num >= 100] == list(range(100, 200))
+
+    async def test__arace__aclose(self) -> None:
+        """Case: closed before exhaustion."""
+        aiterables = [arange(23), arange(23)]
+
+        aiterator = arace(*aiterables)
+        await anext(aiterator)
+        await aiterator.aclose()
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator)
+
+    async def test__arace__prefetch(self) -> None:
+        """Case: `prefetch` provided."""
+        pulled: list[int] = []
+
+        async def gen() -> AsyncGenerator[int]:
+            for num in range(23):
+                pulled.append(num)
+                yield num
+
+        async with aclosing(gen()) as nums, aclosing(arace(nums, prefetch=4)) as aiterator:
+            first = await anext(aiterator)
+            for _ in range(23):
+                await asyncio.sleep(0.0)
+
+            assert first == 0
+            assert pulled == [0, 1, 2, 3, 4]
+
+            rest = [num async for num in aiterator]
+
+        assert rest == list(range(1, 23))
+
     async def test__arace__one_exception(self) -> None:
         """Case: one exception."""
 
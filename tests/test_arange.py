@@ -36,6 +36,11 @@ class TestParameters:
         with pytest.raises(ValueError, match="'step' is not specified but 'stop' is"):
             arange(4, None, 23)
 
+    def test__yield_policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError):
+            arange(23, yield_policy=23)
+
 
 class TestFunction:
     """Function tests."""
@@ -79,3 +84,18 @@ class TestFunction:
         nums = [num async for num in aiterable]
 
         assert not nums
+
+    async def test__arange__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = arange(1, 23, 3)
+
+        batch1 = await aiterator.__anext_batch__(3)
+        num = await anext(aiterator)
+        batch2 = await aiterator.__anext_batch__(23)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(23)
+
+        assert batch1 == [1, 4, 7]
+        assert num == 10
+        assert batch2 == [13, 16, 19, 22]
@@ -16,6 +16,11 @@ class TestParameters:
         with pytest.raises(ValueError, match="'times' must be non-negative"):
             arepeat(23, times=-4)
 
+    def test__yield_policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError):
+            arepeat(23, yield_policy=23)
+
 
 class TestFunction:
     """Function tests."""
@@ -37,3 +42,16 @@ class TestFunction:
         nums = [num async for num in ahead(arepeat(23), n=4)]
 
         assert nums == [23, 23, 23, 23]
+
+    async def test__arepeat__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = arepeat(23, times=5)
+
+        batch1 = await aiterator.__anext_batch__(3)
+        batch2 = await aiterator.__anext_batch__(3)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(3)
+
+        assert batch1 == [23, 23, 23]
+        assert batch2 == [23, 23]
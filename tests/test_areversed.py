@@ -11,6 +11,11 @@ class TestParameters:
         with pytest.raises(TypeError):
             areversed(None)
 
+    def test__yield_policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError):
+            areversed(arange(23), yield_policy=23)
+
 
 class TestFunction:
     """Function tests."""
@@ -30,3 +35,16 @@ class TestFunction:
         nums = [num async for num in areversed(aiterable)]
 
         assert not nums
+
+    async def test__areversed__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = areversed(arange(5))
+
+        batch1 = await aiterator.__anext_batch__(3)
+        batch2 = await aiterator.__anext_batch__(3)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(3)
+
+        assert batch1 == [4, 3, 2]
+        assert batch2 == [1, 0]
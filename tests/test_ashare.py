@@ -0,0 +1,262 @@
+import asyncio
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import acount, arange, ashare
+
+
+class Source:
+    """An asynchronous iterable that counts its pulls."""
+
+    def __init__(self, n: int) -> None:
+        """Initialize the object."""
+        self.n = n
+        self.pulls = 0
+
+    async def __aiter__(self) -> AsyncIterator[int]:
+        """Yield ``0, 1, ..., n - 1``, suspending before each item."""
+        for num in range(self.n):
+            self.pulls += 1
+            await asyncio.sleep(0)
+            yield num
+
+
+async def alist(aiterator: AsyncIterator[int]) -> list[int]:
+    """Return the items of the asynchronous iterator."""
+    return [num async for num in aiterator]
+
+
+async def failing() -> AsyncIterator[int]:
+    """Yield a single item, then raise."""
+    yield 0
+    detail = "failing(): failed"
+    raise RuntimeError(detail)
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            ashare(None)
+
+    def test__maxsize(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            ashare(arange(23), maxsize=None)
+
+    def test__maxsize__zero(self) -> None:
+        """Case: `maxsize == 0`."""
+        with pytest.raises(ValueError, match="'maxsize' must be positive"):
+            ashare(arange(23), maxsize=0)
+
+    def test__overflow(self) -> None:
+        """Case: unknown policy."""
+        with pytest.raises(ValueError, match="'overflow' must be 'block', 'drop' or 'disconnect'"):
+            ashare(arange(23), overflow="spill")
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__ashare(self) -> None:
+        """Case: default usage."""
+        share = ashare(arange(23))
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        nums1 = [num async for num in aiterator1]
+        nums2 = [num async for num in aiterator2]
+
+        assert nums1 == list(range(23))
+        assert nums2 == list(range(23))
+
+    async def test__ashare__context(self) -> None:
+        """Case: iterated within the context manager."""
+        async with ashare(arange(23)) as share:
+            nums = [num async for num in share]
+
+        assert nums == list(range(23))
+
+    async def test__ashare__pulls(self) -> None:
+        """Case: each item is pulled once for all subscribers."""
+        source = Source(23)
+        share = ashare(source, maxsize=2)
+
+        aiterators = [share.subscribe() for _ in range(100)]
+        results = await asyncio.gather(*(alist(aiterator) for aiterator in aiterators))
+
+        assert results == [list(range(23))] * 100
+        assert source.pulls == 23
+
+    async def test__ashare__late(self) -> None:
+        """Case: a subscriber sees the items pulled after it has subscribed."""
+        share = ashare(Source(23))
+
+        aiterator1 = share.subscribe()
+        assert [await anext(aiterator1), await anext(aiterator1)] == [0, 1]
+
+        aiterator2 = share.subscribe()
+        nums1 = [num async for num in aiterator1]
+        nums2 = [num async for num in aiterator2]
+
+        assert nums1 == list(range(2, 23))
+        assert nums2
+        assert nums2 == list(range(nums2[0], 23))
+
+    async def test__ashare__block(self) -> None:
+        """Case: the source waits for the slowest subscriber."""
+        source = Source(23)
+        share = ashare(source, maxsize=2)
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        assert [await anext(aiterator1), await anext(aiterator1)] == [0, 1]
+
+        task = asyncio.create_task(anext(aiterator1))
+        for _ in range(8):
+            await asyncio.sleep(0)
+
+        assert not task.done()
+        assert source.pulls == 2
+
+        assert await anext(aiterator2) == 0
+        assert await task == 2
+
+        await aiterator2.aclose()
+
+        assert [num async for num in aiterator1] == list(range(3, 23))
+
+    async def test__ashare__drop(self) -> None:
+        """Case: the oldest items of a slow subscriber are dropped."""
+        share = ashare(Source(23), maxsize=2, overflow="drop")
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        nums1 = [num async for num in aiterator1]
+        nums2 = [num async for num in aiterator2]
+
+        assert nums1 == list(range(23))
+        assert nums2 == [21, 22]
+
+    async def test__ashare__disconnect(self) -> None:
+        """Case: a slow subscriber is disconnected."""
+        share = ashare(Source(23), maxsize=2, overflow="disconnect")
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        nums = [await anext(aiterator1) for _ in range(4)]
+
+        assert nums == [0, 1, 2, 3]
+        assert share.subscribers == 1
+
+        assert [await anext(aiterator2), await anext(aiterator2)] == [0, 1]
+
+        with pytest.raises(asyncio.QueueFull):
+            await anext(aiterator2)
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator2)
+
+    async def test__ashare__drop__batch(self) -> None:
+        """Case: a subscriber with room drops nothing, even if the items come in batches."""
+        nums = []
+
+        async with ashare(arange(100), maxsize=4, overflow="drop") as share:
+            async for num in share:
+                nums.append(num)
+                await asyncio.sleep(0)
+
+        assert nums == list(range(100))
+
+    async def test__ashare__disconnect__batch(self) -> None:
+        """Case: a subscriber with room is not disconnected, even if the items come in batches."""
+        nums = []
+
+        async with ashare(arange(100), maxsize=4, overflow="disconnect") as share:
+            async for num in share:
+                nums.append(num)
+                await asyncio.sleep(0)
+
+        assert nums == list(range(100))
+
+    async def test__ashare__exception(self) -> None:
+        """Case: the asynchronous iterable raises."""
+        share = ashare(failing())
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        for aiterator in (aiterator1, aiterator2):
+            assert await anext(aiterator) == 0
+
+            with pytest.raises(RuntimeError, match="failed"):
+                await anext(aiterator)
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(aiterator)
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await anext(share.subscribe())
+
+    async def test__ashare__unsubscribe(self) -> None:
+        """Case: subscribers come and go."""
+        share = ashare(arange(23))
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        assert share.subscribers == 2
+
+        await aiterator2.aclose()
+
+        assert share.subscribers == 1
+        assert [num async for num in aiterator1] == list(range(23))
+        assert share.subscribers == 0
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator2)
+
+    async def test__ashare__del(self) -> None:
+        """Case: a subscriber is garbage collected."""
+        share = ashare(arange(23), maxsize=1)
+
+        share.subscribe()
+        aiterator = share.subscribe()
+
+        assert [num async for num in aiterator] == list(range(23))
+
+    async def test__ashare__aclose(self) -> None:
+        """Case: the broadcaster is closed."""
+        share = ashare(acount(), maxsize=4)
+        aiterator = share.subscribe()
+
+        assert await anext(aiterator) == 0
+
+        await share.aclose()
+        nums = [num async for num in aiterator]
+
+        assert len(nums) <= 4
+        assert nums == list(range(1, len(nums) + 1))
+
+    async def test__ashare__batches(self) -> None:
+        """Case: items are pulled by batches."""
+        share = ashare(arange(23), maxsize=8)
+
+        aiterator1 = share.subscribe()
+        aiterator2 = share.subscribe()
+
+        batch1 = await aiterator1.__anext_batch__(16)
+        batch2 = await aiterator2.__anext_batch__(4)
+
+        assert batch1 == list(range(8))
+        assert batch2 == list(range(4))
+
+        await share.aclose()
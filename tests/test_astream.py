@@ -0,0 +1,152 @@
+import re
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import (
+    abatched,
+    achain,
+    aenumerate,
+    ahead,
+    aislice,
+    apairwise,
+    arange,
+    astream,
+    atriplewise,
+    awindowed,
+)
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            astream(None)
+
+    def test__batched(self) -> None:
+        """Case: non-positive `n`."""
+        with pytest.raises(ValueError, match="'n' must be positive"):
+            astream(arange(23)).batched(0)
+
+    def test__chain(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            astream(arange(23)).chain(None)
+
+    def test__enumerate(self) -> None:
+        """Case: non-integer `start`."""
+        with pytest.raises(TypeError):
+            astream(arange(23)).enumerate(None)
+
+    def test__head(self) -> None:
+        """Case: negative `n`."""
+        with pytest.raises(ValueError, match="'n' must be non-negative"):
+            astream(arange(23)).head(-1)
+
+    def test__slice(self) -> None:
+        """Case: non-positive `step`."""
+        with pytest.raises(ValueError, match="'step' must be positive"):
+            astream(arange(23)).slice(0, 23, 0)
+
+    def test__slice__step(self) -> None:
+        """Case: `step` without `stop`."""
+        with pytest.raises(ValueError, match=re.escape("'step' is not specified but 'stop' is")):
+            astream(arange(23)).slice(23, None, 4)
+
+    def test__window(self) -> None:
+        """Case: non-integer `n`."""
+        with pytest.raises(TypeError):
+            astream(arange(23)).window(None)
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__astream(self) -> None:
+        """Case: default usage."""
+        aiterable = astream(arange(23))
+
+        nums = [num async for num in aiterable]
+
+        assert nums == list(range(23))
+
+    async def test__astream__chain(self) -> None:
+        """Case: `chain()` used."""
+        aiterable = astream(arange(2)).chain(arange(2, 4)).enumerate().chain(arange(2))
+
+        items = [item async for item in aiterable]
+        expected = [item async for item in achain(aenumerate(arange(4)), arange(2))]
+
+        assert items == expected
+
+    async def test__astream__window(self) -> None:
+        """Case: `window()`, `pairwise()` and `triplewise()` used."""
+        for n in range(1, 5):
+            windows = [window async for window in astream(arange(2050)).window(n)]
+            assert windows == [window async for window in awindowed(arange(2050), n=n)]
+
+        pairs = [pair async for pair in astream(arange(23)).pairwise()]
+        triplets = [triplet async for triplet in astream(arange(23)).triplewise()]
+
+        assert pairs == [pair async for pair in apairwise(arange(23))]
+        assert triplets == [triplet async for triplet in atriplewise(arange(23))]
+
+    async def test__astream__batched(self) -> None:
+        """Case: `batched()` used."""
+        batches = [batch async for batch in astream(arange(2050)).batched(3)]
+
+        assert batches == [batch async for batch in abatched(arange(2050), n=3)]
+
+    async def test__astream__slice(self) -> None:
+        """Case: `slice()` and `head()` used."""
+        cases = [(0, 23, 1), (4, 23, 1), (4, 23, 3), (23, 4, 1), (1500, 2500, 7)]
+
+        for start, stop, step in cases:
+            aiterable = astream(arange(3000)).slice(start, stop, step).head(50)
+            expected = ahead(aislice(arange(3000), start, stop, step), n=50)
+
+            assert [num async for num in aiterable] == [num async for num in expected]
+
+    async def test__astream__pushdown(self) -> None:
+        """Case: slices pushed through stateful stages."""
+        pipelines = [
+            (astream(arange(100)).enumerate(5), aenumerate(arange(100), start=5), 1),
+            (astream(arange(100)).window(3), awindowed(arange(100), n=3), 1),
+            (astream(arange(100)).batched(3), abatched(arange(100), n=3), 1),
+            (astream(arange(100)).enumerate(), aenumerate(arange(100)), 3),
+        ]
+
+        for aiterable, expected, step in pipelines:
+            items = [item async for item in aiterable.slice(4, 23, step)]
+            assert items == [item async for item in aislice(expected, 4, 23, step)]
+
+    async def test__astream__demand(self) -> None:
+        """Case: the sources are not pulled beyond the slice."""
+        pulled: list[int] = []
+
+        async def agenerator() -> AsyncIterator[int]:
+            for num in range(100):
+                pulled.append(num)
+                yield num
+
+        aiterable = astream(agenerator()).enumerate().window(2).head(4)
+        items = [item async for item in aiterable]
+
+        assert items == [((0, 0), (1, 1)), ((1, 1), (2, 2)), ((2, 2), (3, 3)), ((3, 3), (4, 4))]
+        assert pulled == [0, 1, 2, 3, 4]
+
+    async def test__astream__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = aiter(astream(arange(10)).slice(2, 8))
+
+        batch1 = await aiterator.__anext_batch__(4)
+        batch2 = await aiterator.__anext_batch__(4)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(4)
+
+        assert batch1 == [2, 3, 4, 5]
+        assert batch2 == [6, 7]
@@ -1,6 +1,12 @@
+import math
+
+from array import array
+from collections.abc import AsyncIterator
+from typing import Literal
+
 import pytest
 
-from aioplus import arange, asum
+from aioplus import anextify, arange, asum
 
 
 class TestParameters:
@@ -11,6 +17,16 @@ class TestParameters:
         with pytest.raises(TypeError):
             await asum(None)
 
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await asum(arange(23), flatten=None)
+
+    async def test__mode(self) -> None:
+        """Case: unknown mode."""
+        with pytest.raises(ValueError, match="'mode' must be"):
+            await asum(arange(23), mode="fast")
+
 
 class TestFunction:
     """Function tests."""
@@ -46,3 +62,122 @@ class TestFunction:
         total = await asum(aiterable, start=4)
 
         assert total == 4
+
+    async def test__asum__agenerator(self) -> None:
+        """Case: asynchronous generator."""
+
+        async def agenerator(n: int) -> AsyncIterator[int]:
+            for num in range(n):
+                yield num
+
+        total = await asum(agenerator(23))
+
+        assert total == 253
+
+    async def test__asum__agenerator__floats(self) -> None:
+        """Case: ill-conditioned floats, batches and asynchronous generator."""
+        nums = [1e16, 1.0, -1e16] * 4
+
+        async def agenerator() -> AsyncIterator[float]:
+            for num in nums:
+                yield num
+
+        total1 = await asum(anextify(nums))
+        total2 = await asum(agenerator())
+
+        assert total1 == total2
+
+    async def test__asum__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        aiterable = anextify([array("d", [1.5, 2.5]), 3.0, array("d"), array("i", [4, 5])])
+
+        total = await asum(aiterable, flatten=True)
+
+        assert total == 16
+
+    async def test__asum__flatten__agenerator(self) -> None:
+        """Case: `flatten` provided, asynchronous generator."""
+
+        async def agenerator() -> AsyncIterator[array]:
+            for num in range(3):
+                yield array("i", range(num * 10, num * 10 + 10))
+
+        total = await asum(agenerator(), flatten=True)
+
+        assert total == sum(range(30))
+
+    async def test__asum__flatten__numpy(self) -> None:
+        """Case: `flatten` provided, :mod:`numpy` arrays."""
+        numpy = pytest.importorskip("numpy")
+        aiterable = anextify([numpy.arange(10).reshape(2, 5), numpy.arange(5)])
+
+        total = await asum(aiterable, flatten=True)
+
+        assert total == 55
+
+    @pytest.mark.parametrize("mode", ["plain", "fsum", "kahan", "pairwise"])
+    async def test__asum__mode(self, mode: Literal["plain", "fsum", "kahan", "pairwise"]) -> None:
+        """Case: `mode` provided."""
+        aiterable = arange(1000)
+
+        total = await asum(aiterable, mode=mode)
+
+        assert total == sum(range(1000))
+
+    @pytest.mark.parametrize("mode", ["fsum", "kahan"])
+    async def test__asum__mode__cancellation(self, mode: Literal["fsum", "kahan"]) -> None:
+        """Case: `mode` provided, catastrophic cancellation."""
+        aiterable = anextify([1e100, 1.0, -1e100] * 100)
+
+        total = await asum(aiterable, mode=mode)
+
+        assert total == math.fsum([1e100, 1.0, -1e100] * 100)
+
+    async def test__asum__mode__fsum(self) -> None:
+        """Case: `mode='fsum'`, asynchronous generator."""
+        data = [0.1 * num for num in range(5000)] + [1e16, 1.0, -1e16]
+
+        async def agenerator() -> AsyncIterator[float]:
+            for num in data:
+                yield num
+
+        total = await asum(agenerator(), start=0.5, mode="fsum")
+
+        assert total == math.fsum([0.5, *data])
+
+    async def test__asum__mode__fsum__inf(self) -> None:
+        """Case: `mode='fsum'`, infinite items."""
+        aiterable = anextify([1.0, math.inf, 2.0])
+
+        total = await asum(aiterable, mode="fsum")
+
+        assert total == math.inf
+
+    async def test__asum__mode__pairwise(self) -> None:
+        """Case: `mode='pairwise'`, many small items."""
+        data = [0.1] * 100_000
+
+        total = await asum(anextify(data, chunksize=1024), mode="pairwise")
+
+        assert abs(total - 10_000) < abs(sum(data) - 10_000)
+
+    @pytest.mark.parametrize("mode", ["plain", "fsum", "kahan", "pairwise"])
+    async def test__asum__mode__flatten(
+        self,
+        mode: Literal["plain", "fsum", "kahan", "pairwise"],
+    ) -> None:
+        """Case: `mode` and `flatten` provided."""
+        chunks = [array("d", range(num * 300, num * 300 + 300)) for num in range(4)]
+        aiterable = anextify([*chunks, 0.5, array("d")])
+
+        total = await asum(aiterable, flatten=True, mode=mode)
+
+        assert total == sum(range(1200)) + 0.5
+
+    async def test__asum__mode__flatten__fsum(self) -> None:
+        """Case: `mode='fsum'` and `flatten` provided, catastrophic cancellation."""
+        aiterable = anextify([array("d", [1e100, 1.0]), array("d", [-1e100, 1.0])])
+
+        total = await asum(aiterable, flatten=True, mode="fsum")
+
+        assert total == 2.0  # noqa: PLR2004
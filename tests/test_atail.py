@@ -21,6 +21,11 @@ class TestParameters:
         with pytest.raises(ValueError, match="'n' must be non-negative"):
             atail(arange(23), n=-4)
 
+    def test__yield_policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError):
+            atail(arange(23), n=4, yield_policy=23)
+
 
 class TestFunction:
     """Function tests."""
@@ -56,3 +61,16 @@ class TestFunction:
         tail = [num async for num in atail(aiterable, n=0)]
 
         assert not tail
+
+    async def test__atail__batch(self) -> None:
+        """Case: `__anext_batch__` used."""
+        aiterator = atail(arange(23), n=5)
+
+        batch1 = await aiterator.__anext_batch__(3)
+        batch2 = await aiterator.__anext_batch__(3)
+
+        with pytest.raises(StopAsyncIteration):
+            await aiterator.__anext_batch__(3)
+
+        assert batch1 == [18, 19, 20]
+        assert batch2 == [21, 22]
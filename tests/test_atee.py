@@ -0,0 +1,204 @@
+import asyncio
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import arange, atee
+
+
+class Source:
+    """An asynchronous iterable that counts its pulls."""
+
+    def __init__(self, n: int) -> None:
+        """Initialize the object."""
+        self.n = n
+        self.pulls = 0
+
+    async def __aiter__(self) -> AsyncIterator[int]:
+        """Yield ``0, 1, ..., n - 1``, suspending before each item."""
+        for num in range(self.n):
+            self.pulls += 1
+            await asyncio.sleep(0)
+            yield num
+
+
+async def alist(aiterator: AsyncIterator[int]) -> list[int]:
+    """Return the items of the asynchronous iterator."""
+    return [num async for num in aiterator]
+
+
+async def failing() -> AsyncIterator[int]:
+    """Yield a single item, then raise."""
+    yield 0
+    detail = "failing(): failed"
+    raise RuntimeError(detail)
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            atee(None)
+
+    def test__n(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            atee(arange(23), n=None)
+
+    def test__n__negative(self) -> None:
+        """Case: `n < 0`."""
+        with pytest.raises(ValueError, match="'n' must be non-negative"):
+            atee(arange(23), n=-1)
+
+    def test__maxsize(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            atee(arange(23), maxsize="4")
+
+    def test__maxsize__zero(self) -> None:
+        """Case: `maxsize == 0`."""
+        with pytest.raises(ValueError, match="'maxsize' must be positive"):
+            atee(arange(23), maxsize=0)
+
+    def test__overflow(self) -> None:
+        """Case: unknown policy."""
+        with pytest.raises(ValueError, match="'overflow' must be 'block' or 'drop'"):
+            atee(arange(23), overflow="spill")
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__atee(self) -> None:
+        """Case: default usage."""
+        aiterator1, aiterator2 = atee(arange(23))
+
+        nums1 = [num async for num in aiterator1]
+        nums2 = [num async for num in aiterator2]
+
+        assert nums1 == list(range(23))
+        assert nums2 == list(range(23))
+
+    async def test__atee__zero(self) -> None:
+        """Case: `n == 0`."""
+        assert atee(arange(23), n=0) == ()
+
+    async def test__atee__pulls(self) -> None:
+        """Case: each item is pulled once."""
+        source = Source(23)
+        aiterators = atee(source, n=4, maxsize=2)
+
+        results = await asyncio.gather(*(alist(aiterator) for aiterator in aiterators))
+
+        assert results == [list(range(23))] * 4
+        assert source.pulls == 23
+
+    async def test__atee__concurrent(self) -> None:
+        """Case: the same iterator is pulled by several tasks."""
+        aiterator, _ = atee(Source(23))
+
+        nums = await asyncio.gather(*(anext(aiterator) for _ in range(4)))
+
+        assert sorted(nums) == [0, 1, 2, 3]
+
+    async def test__atee__block(self) -> None:
+        """Case: the fastest iterator waits for the slowest one."""
+        source = Source(23)
+        aiterator1, aiterator2 = atee(source, maxsize=2)
+
+        assert [await anext(aiterator1), await anext(aiterator1)] == [0, 1]
+
+        task = asyncio.create_task(anext(aiterator1))
+        for _ in range(4):
+            await asyncio.sleep(0)
+
+        assert not task.done()
+        assert source.pulls == 2
+
+        assert await anext(aiterator2) == 0
+        assert await task == 2
+
+    async def test__atee__drop(self) -> None:
+        """Case: the slowest iterator skips the oldest items."""
+        aiterator1, aiterator2 = atee(Source(23), maxsize=2, overflow="drop")
+
+        nums1 = [num async for num in aiterator1]
+        nums2 = [num async for num in aiterator2]
+
+        assert nums1 == list(range(23))
+        assert nums2 == [21, 22]
+
+    async def test__atee__exception(self) -> None:
+        """Case: the asynchronous iterable raises."""
+        aiterator1, aiterator2 = atee(failing())
+
+        for aiterator in (aiterator1, aiterator2):
+            assert await anext(aiterator) == 0
+
+            with pytest.raises(RuntimeError, match="failed"):
+                await anext(aiterator)
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(aiterator)
+
+    async def test__atee__cancelled(self) -> None:
+        """Case: a waiting iterator is cancelled."""
+        source = Source(23)
+        aiterator1, aiterator2 = atee(source)
+
+        task = asyncio.create_task(anext(aiterator1))
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await anext(aiterator2) == 0
+        assert await anext(aiterator1) == 0
+        assert source.pulls == 1
+
+    async def test__atee__aclose(self) -> None:
+        """Case: an iterator is closed."""
+        aiterator1, aiterator2 = atee(Source(23), maxsize=1)
+
+        await aiterator2.aclose()
+        nums = [num async for num in aiterator1]
+
+        assert nums == list(range(23))
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator2)
+
+    async def test__atee__aclose__all(self) -> None:
+        """Case: every iterator is closed while pulling."""
+        aiterator1, aiterator2 = atee(Source(23))
+
+        task = asyncio.create_task(anext(aiterator1))
+        await asyncio.sleep(0)
+
+        await aiterator2.aclose()
+        await aiterator1.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    async def test__atee__batches(self) -> None:
+        """Case: items are pulled by batches."""
+        aiterator1, aiterator2 = atee(arange(23), maxsize=8)
+
+        batch1 = await aiterator1.__anext_batch__(16)
+        batch2 = await aiterator2.__anext_batch__(16)
+
+        assert batch1 == list(range(8))
+        assert batch2 == list(range(8))
+
+    async def test__atee__del(self) -> None:
+        """Case: an iterator is garbage collected."""
+        aiterator = atee(arange(23), maxsize=1)[0]
+
+        nums = [num async for num in aiterator]
+
+        assert nums == list(range(23))
@@ -0,0 +1,104 @@
+import re
+import statistics
+
+from array import array
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import anextify, arange, avar
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    async def test__aiterable(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            await avar(None)
+
+    async def test__ddof(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            await avar(arange(23), ddof=None)
+
+    async def test__ddof__negative(self) -> None:
+        """Case: negative `ddof`."""
+        with pytest.raises(ValueError, match="'ddof' must be non-negative"):
+            await avar(arange(23), ddof=-1)
+
+    async def test__flatten(self) -> None:
+        """Case: non-boolean."""
+        with pytest.raises(TypeError):
+            await avar(arange(23), flatten=None)
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__avar(self) -> None:
+        """Case: default usage."""
+        aiterable = arange(23)
+
+        variance = await avar(aiterable)
+
+        assert variance == 44
+
+    async def test__avar__ddof(self) -> None:
+        """Case: `ddof` provided."""
+        aiterable = arange(23)
+
+        variance = await avar(aiterable, ddof=1)
+
+        assert variance == 46
+
+    async def test__avar__ddof__not_enough(self) -> None:
+        """Case: `len(...) <= ddof`."""
+        aiterable = arange(1)
+
+        with pytest.raises(ValueError, match=re.escape("avar(): not enough items")):
+            await avar(aiterable, ddof=1)
+
+    async def test__avar__empty(self) -> None:
+        """Case: `len(...) == 0`."""
+        aiterable = arange(0)
+
+        with pytest.raises(ValueError, match=re.escape("avar(): empty iterable")):
+            await avar(aiterable)
+
+    async def test__avar__default(self) -> None:
+        """Case: `default` provided."""
+        aiterable = arange(0)
+
+        variance = await avar(aiterable, default=None)
+
+        assert variance is None
+
+    async def test__avar__large_mean(self) -> None:
+        """Case: small variance around a large mean."""
+        data = [1e9 + num % 7 for num in range(1000)]
+
+        async def agenerator() -> AsyncIterator[float]:
+            for num in data:
+                yield num
+
+        variance = await avar(agenerator())
+
+        assert variance == pytest.approx(statistics.pvariance(data), rel=1e-6)
+
+    async def test__avar__flatten(self) -> None:
+        """Case: `flatten` provided."""
+        data = [1e9 + num % 7 for num in range(1000)]
+        chunks = [array("d", data[index : index + 64]) for index in range(0, 1000, 64)]
+
+        variance = await avar(anextify(chunks), flatten=True)
+
+        assert variance == pytest.approx(statistics.pvariance(data), rel=1e-9)
+
+    async def test__avar__flatten__mixed(self) -> None:
+        """Case: `flatten` provided, chunks and scalars."""
+        aiterable = anextify([array("d", [1.0, 2.0]), 3.0, array("d"), array("i", [4, 5])])
+
+        variance = await avar(aiterable, flatten=True)
+
+        assert variance == 2
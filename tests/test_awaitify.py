@@ -1,6 +1,9 @@
+import asyncio
 import json
+import operator
 import tomllib
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tomllib import TOMLDecodeError
 
@@ -25,6 +28,26 @@ class TestParameters:
         with pytest.raises(TypeError):
             awaitify(print, executor=23)
 
+    def test__batch_size(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            awaitify(print, batch_size=None)
+
+    def test__batch_size__zero(self) -> None:
+        """Case: `batch_size == 0`."""
+        with pytest.raises(ValueError, match="'batch_size' must be positive"):
+            awaitify(print, batch_size=0)
+
+    def test__max_wait(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError):
+            awaitify(print, max_wait=None)
+
+    def test__max_wait__negative(self) -> None:
+        """Case: `max_wait < 0`."""
+        with pytest.raises(ValueError, match="'max_wait' must be non-negative"):
+            awaitify(print, max_wait=-1.0)
+
 
 class TestFunction:
     """Function tests."""
@@ -77,3 +100,39 @@ class TestFunction:
         exists_flg = await aexists()
 
         assert exists_flg
+
+    async def test__awaitify__process_pool(self) -> None:
+        """Case: `ProcessPoolExecutor` provided."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            amul = awaitify(operator.mul, executor=executor)
+            product = await amul(4, 23)
+
+        assert product == 92
+
+    async def test__awaitify__batch_size(self) -> None:
+        """Case: `batch_size` provided."""
+        executor = CallerThreadExecutor()
+
+        amul = awaitify(operator.mul, executor=executor, batch_size=3)
+        products = await asyncio.gather(*(amul(num, 2) for num in range(7)))
+
+        assert products == [0, 2, 4, 6, 8, 10, 12]
+        assert executor.stats.submitted == 3
+
+    async def test__awaitify__batch_size__exception(self) -> None:
+        """Case: `batch_size` provided & exception raised."""
+        executor = CallerThreadExecutor()
+
+        adiv = awaitify(operator.floordiv, executor=executor, batch_size=2)
+        results = await asyncio.gather(adiv(4, 2), adiv(4, 0), return_exceptions=True)
+
+        assert results[0] == 2
+        assert isinstance(results[1], ZeroDivisionError)
+
+    async def test__awaitify__batch_size__process_pool(self) -> None:
+        """Case: `batch_size` & `ProcessPoolExecutor` provided."""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            amul = awaitify(operator.mul, executor=executor, batch_size=4, max_wait=0.01)
+            products = await asyncio.gather(*(amul(num, 3) for num in range(10)))
+
+        assert products == [num * 3 for num in range(10)]
@@ -1,6 +1,7 @@
+import asyncio
 import re
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable
 from contextlib import aclosing
 
 import pytest
@@ -8,6 +9,10 @@ import pytest
 from aioplus import arange, azip
 
 
+class Halt(BaseException):
+    """A base exception."""
+
+
 class TestParameters:
     """Parameter tests."""
 
@@ -45,6 +50,38 @@ class TestFunction:
         with pytest.raises(ValueError, match=re.escape("azip(): len(*aiterables) differ")):
             [triplet async for triplet in azip(*aiterables, strict=True)]
 
+    async def test__azip__suspended(self) -> None:
+        """Case: some iterables suspend on futures."""
+
+        async def gen(delay: float) -> AsyncGenerator[int]:
+            for num in range(4):
+                await asyncio.sleep(delay)
+                yield num
+
+        async def nums() -> AsyncGenerator[int]:
+            for num in range(100, 104):
+                yield num
+
+        async with aclosing(gen(0.001)) as nums1, aclosing(nums()) as nums2:
+            pairs = [pair async for pair in azip(nums1, nums2, arange(200, 204))]
+
+        assert pairs == [(0, 100, 200), (1, 101, 201), (2, 102, 202), (3, 103, 203)]
+
+    async def test__azip__cancelled(self) -> None:
+        """Case: cancelled while iterables are suspended."""
+
+        async def gen() -> AsyncGenerator[int]:
+            await asyncio.sleep(23.0)
+            yield 4
+
+        async with aclosing(gen()) as nums:
+            task = asyncio.create_task(anext(azip(nums, arange(23))))
+            await asyncio.sleep(0.0)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
     async def test__azip__one_exception(self) -> None:
         """Case: one exception."""
 
@@ -80,3 +117,59 @@ class TestFunction:
                 [(num1, num2) async for num1, num2 in azip(nums1, nums2)]
 
         assert len(group.value.exceptions) == 2
+
+    @pytest.mark.parametrize("index", [0, 1])
+    async def test__azip__base_exception(self, index: int) -> None:
+        """Case: base exception raised."""
+
+        async def gen() -> AsyncGenerator[int]:
+            if True:
+                raise Halt
+            yield 0
+
+        async with aclosing(gen()) as nums:
+            aiterables: list[AsyncIterable[int]] = [arange(3)]
+            aiterables.insert(index, nums)
+            aiterator = azip(*aiterables)
+
+            detail = "azip(): base exception(-s) occurred"
+
+            with pytest.raises(BaseExceptionGroup, match=re.escape(detail)):
+                await anext(aiterator)
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(aiterator)
+
+    async def test__azip__timeout__consumer(self) -> None:
+        """Case: the consumer times out while every iterable is suspended."""
+
+        async def gen() -> AsyncGenerator[int]:
+            await asyncio.sleep(1.0)
+            yield 0
+
+        async with aclosing(gen()) as nums1, aclosing(gen()) as nums2:
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    await anext(azip(nums1, nums2))
+
+    @pytest.mark.parametrize("index", [0, 2])
+    async def test__azip__timeout(self, index: int) -> None:
+        """Case: an iterable relies on its task."""
+
+        async def gen() -> AsyncGenerator[int | str]:
+            for num in range(3):
+                try:
+                    async with asyncio.timeout(0.01):
+                        await asyncio.sleep(1.0 if num == 1 else 0.0)
+                except TimeoutError:
+                    yield "timeout"
+                else:
+                    yield num
+
+        async with aclosing(gen()) as nums:
+            aiterables: list[AsyncIterable[int | str]] = [arange(3), arange(3)]
+            aiterables.insert(index, nums)
+            rows = [row async for row in azip(*aiterables)]
+
+        assert [row[index] for row in rows] == [0, "timeout", 2]
+        assert [row[2 - index] for row in rows] == [0, 1, 2]
@@ -0,0 +1,138 @@
+import asyncio
+import re
+
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import aclosing
+
+import pytest
+
+from aioplus import arange, azip_longest
+
+
+class Halt(BaseException):
+    """A base exception."""
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__aiterables(self) -> None:
+        """Case: non-iterable."""
+        with pytest.raises(TypeError):
+            azip_longest(None)
+
+    def test__fillvalues(self) -> None:
+        """Case: non-sequence."""
+        with pytest.raises(TypeError):
+            azip_longest(arange(4), fillvalues=23)
+
+    def test__fillvalues__length(self) -> None:
+        """Case: `len(fillvalues) != len(*aiterables)`."""
+        detail = "'len(fillvalues)' must be equal to 'len(*aiterables)'"
+        with pytest.raises(ValueError, match=re.escape(detail)):
+            azip_longest(arange(4), arange(23), fillvalues=[None])
+
+    async def test__azip_longest__empty(self) -> None:
+        """Case: empty call."""
+        with pytest.raises(ValueError, match=re.escape("'*aiterables' must be non-empty")):
+            azip_longest()
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__azip_longest(self) -> None:
+        """Case: default usage."""
+        aiterables = [arange(2), arange(100, 104), arange(200, 203)]
+
+        triplets = [triplet async for triplet in azip_longest(*aiterables)]
+
+        assert triplets == [(0, 100, 200), (1, 101, 201), (None, 102, 202), (None, 103, None)]
+
+    async def test__azip_longest__fillvalue(self) -> None:
+        """Case: `fillvalue` provided."""
+        aiterables = [arange(2), arange(100, 104)]
+
+        pairs = [pair async for pair in azip_longest(*aiterables, fillvalue=23)]
+
+        assert pairs == [(0, 100), (1, 101), (23, 102), (23, 103)]
+
+    async def test__azip_longest__fillvalues(self) -> None:
+        """Case: `fillvalues` provided."""
+        aiterables = [arange(1), arange(100, 102), arange(200, 203)]
+
+        triplets = [triplet async for triplet in azip_longest(*aiterables, fillvalues=[4, 23, 0])]
+
+        assert triplets == [(0, 100, 200), (4, 101, 201), (4, 23, 202)]
+
+    async def test__azip_longest__exhausted(self) -> None:
+        """Case: exhausted iterables are not pulled again."""
+        pulls: list[int] = []
+
+        async def gen() -> AsyncGenerator[int]:
+            pulls.append(0)
+            yield 0
+            pulls.append(1)
+
+        async with aclosing(gen()) as nums:
+            pairs = [pair async for pair in azip_longest(nums, arange(4))]
+
+        assert pairs == [(0, 0), (None, 1), (None, 2), (None, 3)]
+        assert pulls == [0, 1]
+
+    async def test__azip_longest__exception(self) -> None:
+        """Case: exception raised."""
+
+        async def gen() -> AsyncGenerator[int]:
+            yield 1
+            raise RuntimeError
+
+        async with aclosing(gen()) as nums:
+            with pytest.raises(ExceptionGroup) as group:
+                [pair async for pair in azip_longest(nums, arange(4))]
+
+        assert len(group.value.exceptions) == 1
+
+    @pytest.mark.parametrize("index", [0, 1])
+    async def test__azip_longest__base_exception(self, index: int) -> None:
+        """Case: base exception raised."""
+
+        async def gen() -> AsyncGenerator[int]:
+            if True:
+                raise Halt
+            yield 0
+
+        async with aclosing(gen()) as nums:
+            aiterables: list[AsyncIterable[int]] = [arange(3)]
+            aiterables.insert(index, nums)
+            aiterator = azip_longest(*aiterables)
+
+            detail = "azip_longest(): base exception(-s) occurred"
+
+            with pytest.raises(BaseExceptionGroup, match=re.escape(detail)):
+                await anext(aiterator)
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(aiterator)
+
+    @pytest.mark.parametrize("index", [0, 1])
+    async def test__azip_longest__timeout(self, index: int) -> None:
+        """Case: an iterable relies on its task."""
+
+        async def gen() -> AsyncGenerator[int | str]:
+            for num in range(3):
+                try:
+                    async with asyncio.timeout(0.01):
+                        await asyncio.sleep(1.0 if num == 1 else 0.0)
+                except TimeoutError:
+                    yield "timeout"
+                else:
+                    yield num
+
+        async with aclosing(gen()) as nums:
+            aiterables: list[AsyncIterable[int | str]] = [arange(4)]
+            aiterables.insert(index, nums)
+            pairs = [pair async for pair in azip_longest(*aiterables)]
+
+        assert [pair[index] for pair in pairs] == [0, "timeout", 2, None]
+        assert [pair[1 - index] for pair in pairs] == [0, 1, 2, 3]
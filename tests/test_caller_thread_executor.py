@@ -1,8 +1,11 @@
 import asyncio
+import time
+
+from threading import Event, Thread
 
 import pytest
 
-from aioplus import CallerThreadExecutor
+from aioplus import CallerThreadExecutor, CallerThreadExecutorStats
 
 
 class TestParameters:
@@ -97,3 +100,37 @@ class TestClass:
 
         coroutine = asyncio.sleep(0.0)
         loop.run_until_complete(coroutine)
+
+    def test__caller_thread_executor__stats(self) -> None:
+        """Case: counters after submits."""
+        executor = CallerThreadExecutor()
+
+        executor.submit(lambda x: x + 4, 23)
+        executor.submit(lambda x: x / 0, 23)
+
+        stats = executor.stats
+
+        assert isinstance(stats, CallerThreadExecutorStats)
+        assert stats.submitted == 2
+        assert stats.completed == 1
+        assert stats.failed == 1
+        assert stats.busy_time >= 0.0
+
+    def test__caller_thread_executor__shutdown_waits(self) -> None:
+        """Case: shutdown while another thread runs a callable."""
+        executor = CallerThreadExecutor()
+        started = Event()
+
+        def func() -> None:
+            started.set()
+            time.sleep(0.05)
+
+        thread = Thread(target=executor.submit, args=(func,))
+        thread.start()
+        started.wait()
+
+        executor.shutdown(wait=True)
+
+        assert executor.stats.completed == 1
+
+        thread.join()
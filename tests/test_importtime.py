@@ -0,0 +1,59 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+import aioplus
+
+
+# The cumulative import time of `aioplus`, in microseconds (about 20ms measured)
+IMPORT_TIME_BUDGET = 40_000
+
+
+def run(code: str, /, *args: str) -> subprocess.CompletedProcess[str]:
+    """Run the code in a fresh interpreter."""
+    command = [sys.executable, *args, "-c", code]
+    return subprocess.run(command, capture_output=True, check=True, text=True)  # noqa: S603
+
+
+class TestImport:
+    """Import tests."""
+
+    def test__importtime(self) -> None:
+        """Case: `python -X importtime`."""
+        process = run("import aioplus", "-X", "importtime")
+
+        pattern = r"^import time:\s+\d+ \|\s+(\d+) \| aioplus$"
+        match = re.search(pattern, process.stderr, re.MULTILINE)
+
+        assert match is not None
+        assert int(match.group(1)) < IMPORT_TIME_BUDGET
+
+    def test__lazy(self) -> None:
+        """Case: heavy modules are not imported eagerly."""
+        code = "import sys, aioplus; print(*sorted(sys.modules))"
+
+        modules = run(code).stdout.split()
+
+        assert "asyncio" not in modules
+        assert "concurrent.futures" not in modules
+        assert "threading" not in modules
+
+    def test__getattr(self) -> None:
+        """Case: unknown name."""
+        with pytest.raises(AttributeError, match="has no attribute 'amagic'"):
+            _ = aioplus.amagic  # type: ignore[attr-defined]
+
+    def test__dir(self) -> None:
+        """Case: `dir(...)` lists names not imported yet."""
+        names = dir(aioplus)
+
+        assert set(aioplus.__all__) <= set(names)
+
+    @pytest.mark.parametrize("name", aioplus.__all__)
+    def test__all(self, name: str) -> None:
+        """Case: every public name is importable."""
+        obj = getattr(aioplus, name)
+
+        assert obj.__module__ == "aioplus"
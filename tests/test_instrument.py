@@ -0,0 +1,228 @@
+import asyncio
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import IteratorStats, abatched, aenumerate, arace, arange, azip, instrument
+
+
+async def suspending(n: int, delay: float = 0.001) -> AsyncIterator[int]:
+    """Yield ``0, 1, ..., n - 1``, sleeping before each item."""
+    for num in range(n):
+        await asyncio.sleep(delay)
+        yield num
+
+
+async def failing() -> AsyncIterator[int]:
+    """Yield a single item, then raise."""
+    yield 0
+    detail = "failing(): failed"
+    raise RuntimeError(detail)
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__callback(self) -> None:
+        """Case: non-callable."""
+        with pytest.raises(TypeError), instrument(None):
+            pass
+
+    def test__sample_rate(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError), instrument(print, sample_rate=1):
+            pass
+
+    def test__sample_rate__zero(self) -> None:
+        """Case: `sample_rate == 0.0`."""
+        with (
+            pytest.raises(ValueError, match=r"'sample_rate' must be in range \(0, 1\]"),
+            instrument(print, sample_rate=0.0),
+        ):
+            pass
+
+    def test__sample_rate__greater(self) -> None:
+        """Case: `sample_rate > 1.0`."""
+        with (
+            pytest.raises(ValueError, match="'sample_rate' must be in range"),
+            instrument(print, sample_rate=1.5),
+        ):
+            pass
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__instrument(self) -> None:
+        """Case: default usage."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = aenumerate(suspending(23))
+
+        items = [item async for item in aiterable]
+
+        assert items == list(enumerate(range(23)))
+        assert len(stats) == 1
+        assert stats[0].name == "aenumerate"
+        assert stats[0].items == 23
+        assert stats[0].exceptions == 0
+        assert stats[0].upstream_time > 0.0
+        assert stats[0].wait_time >= stats[0].upstream_time
+
+    async def test__instrument__outside(self) -> None:
+        """Case: iterators created outside the block."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            pass
+
+        aiterator = aenumerate(arange(23))
+        items = [item async for item in aiterator]
+
+        assert items == list(enumerate(range(23)))
+        assert type(aiterator).__name__ == "AenumerateIterator"
+        assert not stats
+
+    async def test__instrument__nested(self) -> None:
+        """Case: iterators created from each other."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = aenumerate(arange(23))
+
+        _ = [item async for item in aiterable]
+
+        assert [(entry.name, entry.items) for entry in stats] == [
+            ("arange", 23),
+            ("aenumerate", 23),
+        ]
+
+    async def test__instrument__batches(self) -> None:
+        """Case: items pulled by batches."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = abatched(arange(23), n=5)
+
+        batches = [batch async for batch in aiterable]
+
+        assert len(batches) == 5
+        assert hasattr(type(aiterable), "__anext_batch__")
+        assert [(entry.name, entry.items) for entry in stats] == [
+            ("arange", 23),
+            ("abatched", 5),
+        ]
+
+    async def test__instrument__exceptions(self) -> None:
+        """Case: the iterator raises."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = aenumerate(failing())
+
+        with pytest.raises(RuntimeError, match="failed"):
+            _ = [item async for item in aiterable]
+
+        assert len(stats) == 1
+        assert stats[0].items == 1
+        assert stats[0].exceptions == 1
+
+    async def test__instrument__tasks(self) -> None:
+        """Case: tasks are counted."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = arace(suspending(4), suspending(4))
+
+        nums = [num async for num in aiterable]
+
+        assert sorted(nums) == [0, 0, 1, 1, 2, 2, 3, 3]
+        assert stats[0].name == "arace"
+        assert stats[0].tasks_created == 10
+        assert stats[0].tasks_cancelled == 0
+
+    async def test__instrument__cancelled(self) -> None:
+        """Case: tasks are cancelled on close."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterator = arace(suspending(4), suspending(4, delay=1.0))
+
+        await anext(aiterator)
+        await aiterator.aclose()
+
+        assert len(stats) == 1
+        assert stats[0].items == 1
+        assert stats[0].tasks_created == 3
+        assert stats[0].tasks_cancelled == 2
+
+    async def test__instrument__close(self) -> None:
+        """Case: closed synchronously."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterator = arace(suspending(4), suspending(4, delay=1.0))
+
+        await anext(aiterator)
+
+        with pytest.warns(RuntimeWarning, match="will never be awaited"):
+            aiterator.close()
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(aiterator)
+
+        assert len(stats) == 1
+        assert stats[0].items == 1
+
+    async def test__instrument__concurrent(self) -> None:
+        """Case: upstream pulls are concurrent."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = azip(suspending(8), suspending(8))
+
+        _ = [item async for item in aiterable]
+
+        assert stats[0].name == "azip"
+        assert stats[0].items == 8
+        assert stats[0].upstream_time > stats[0].wait_time
+
+    async def test__instrument__idle(self) -> None:
+        """Case: the consumer is slow."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            aiterable = aenumerate(arange(4))
+
+        async for _ in aiterable:
+            await asyncio.sleep(0.001)
+
+        assert stats[-1].idle_time > stats[-1].wait_time
+
+    async def test__instrument__sample_rate(self) -> None:
+        """Case: iterators are not sampled."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append, sample_rate=1e-12):
+            aiterator = aenumerate(arange(23))
+
+        _ = [item async for item in aiterator]
+
+        assert type(aiterator).__name__ == "AenumerateIterator"
+        assert not stats
+
+    async def test__instrument__context(self) -> None:
+        """Case: the instrumentation is reset after the block."""
+        stats: list[IteratorStats] = []
+
+        with instrument(stats.append):
+            pass
+
+        with instrument(stats.append), pytest.raises(RuntimeError):
+            raise RuntimeError
+
+        aiterator = arange(23)
+
+        assert type(aiterator).__name__ == "ArangeIterator"
@@ -0,0 +1,91 @@
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import pytest
+
+from aioplus import (
+    abatched,
+    achain,
+    acount,
+    acycle,
+    aenumerate,
+    aislice,
+    amap,
+    anextify,
+    apairwise,
+    apostpend,
+    aprepend,
+    arace,
+    arange,
+    arepeat,
+    areversed,
+    ashare,
+    astream,
+    atabulate,
+    atail,
+    atee,
+    atriplewise,
+    awindowed,
+    azip,
+    azip_longest,
+    instrument,
+)
+
+
+async def identity(num: int) -> int:
+    """Return the number."""
+    return num
+
+
+FACTORIES: list[Callable[[], Any]] = [
+    lambda: abatched(arange(23), n=4),
+    lambda: achain(arange(23), arange(4)),
+    lambda: acount(),
+    lambda: acycle(arange(23)),
+    lambda: aenumerate(arange(23)),
+    lambda: aislice(arange(23), 4),
+    lambda: amap(identity, arange(23)),
+    lambda: anextify(range(23)),
+    lambda: anextify(range(23), mode="thread"),
+    lambda: apairwise(arange(23)),
+    lambda: apostpend(arange(23), 4),
+    lambda: aprepend(4, arange(23)),
+    lambda: arace(arange(23), arange(4)),
+    lambda: arange(23),
+    lambda: arepeat(23),
+    lambda: areversed(arange(23)),
+    lambda: ashare(arange(23)).subscribe(),
+    lambda: aiter(astream(arange(23)).enumerate()),
+    lambda: atabulate(identity),
+    lambda: atee(arange(23))[0],
+    lambda: atail(arange(23), n=4),
+    lambda: atriplewise(arange(23)),
+    lambda: awindowed(arange(23), n=4),
+    lambda: azip(arange(23), arange(4)),
+    lambda: azip_longest(arange(23), arange(4)),
+]
+
+
+class TestSlots:
+    """Slots tests."""
+
+    @pytest.mark.parametrize("factory", FACTORIES)
+    async def test__slots(self, factory: Callable[[], AsyncIterator[Any]]) -> None:
+        """Case: the iterator has no `__dict__`."""
+        aiterator = factory()
+
+        assert not hasattr(aiterator, "__dict__")
+
+        if hasattr(aiterator, "aclose"):
+            await aiterator.aclose()
+
+    @pytest.mark.parametrize("factory", FACTORIES)
+    async def test__slots__instrumented(self, factory: Callable[[], AsyncIterator[Any]]) -> None:
+        """Case: the instrumented iterator has no `__dict__`."""
+        with instrument(lambda _: None):
+            aiterator = factory()
+
+        assert not hasattr(aiterator, "__dict__")
+
+        if hasattr(aiterator, "aclose"):
+            await aiterator.aclose()
@@ -0,0 +1,229 @@
+import asyncio
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from aioplus import (
+    Exporter,
+    HistogramData,
+    InMemoryExporter,
+    SpanData,
+    aenumerate,
+    arace,
+    arange,
+    trace,
+)
+
+
+async def suspending(n: int) -> AsyncIterator[int]:
+    """Yield ``0, 1, ..., n - 1``, suspending before each item."""
+    for num in range(n):
+        await asyncio.sleep(0)
+        yield num
+
+
+async def failing() -> AsyncIterator[int]:
+    """Yield a single item, then raise."""
+    yield 0
+    detail = "failing(): failed"
+    raise RuntimeError(detail)
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__exporter(self) -> None:
+        """Case: non-exporter."""
+        with pytest.raises(TypeError, match="'exporter' must be 'Exporter'"), trace(print):
+            pass
+
+    def test__sample_rate(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError), trace(InMemoryExporter(), sample_rate=1):
+            pass
+
+    def test__sample_rate__zero(self) -> None:
+        """Case: `sample_rate == 0.0`."""
+        with (
+            pytest.raises(ValueError, match="'sample_rate'"),
+            trace(InMemoryExporter(), sample_rate=0.0),
+        ):
+            pass
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__trace(self) -> None:
+        """Case: default usage."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter) as current:
+            aiterable = aenumerate(arange(23))
+
+        items = [item async for item in aiterable]
+
+        assert current is exporter
+        assert isinstance(exporter, Exporter)
+        assert items == list(enumerate(range(23)))
+        assert [span.name for span in exporter.spans] == ["aenumerate", "arange"]
+
+        root, child = exporter.spans
+
+        assert root.parent_span_id is None
+        assert child.parent_span_id == root.span_id
+        assert child.trace_id == root.trace_id
+        assert root.attributes["aioplus.items"] == 23
+        assert child.start_time_unix_nano <= root.start_time_unix_nano
+        assert root.end_time_unix_nano >= root.start_time_unix_nano
+
+    async def test__trace__tree(self) -> None:
+        """Case: the sources of `arace`."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter):
+            aiterable = arace(suspending(4), aenumerate(arange(4)))
+
+        _ = [item async for item in aiterable]
+
+        names = [span.name for span in exporter.spans]
+        ids = {span.name: span.span_id for span in exporter.spans}
+        parents = {span.name: span.parent_span_id for span in exporter.spans}
+
+        assert names == ["arace", "suspending", "aenumerate", "arange"]
+        assert parents["arace"] is None
+        assert parents["suspending"] == ids["arace"]
+        assert parents["aenumerate"] == ids["arace"]
+        assert parents["arange"] == ids["aenumerate"]
+        assert {span.attributes["aioplus.items"] for span in exporter.spans} == {4, 8}
+
+    async def test__trace__histograms(self) -> None:
+        """Case: the latency and throughput histograms."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter):
+            aiterable = aenumerate(suspending(23))
+
+        _ = [item async for item in aiterable]
+
+        latencies = [
+            histogram
+            for histogram in exporter.histograms
+            if histogram.name == "aioplus.iterator.latency"
+        ]
+        throughputs = [
+            histogram
+            for histogram in exporter.histograms
+            if histogram.name == "aioplus.iterator.throughput"
+        ]
+
+        assert len(latencies) == 2
+        assert [histogram.count for histogram in latencies] == [24, 24]
+        assert all(histogram.unit == "s" for histogram in latencies)
+        assert all(histogram.count == 1 for histogram in throughputs)
+        assert all(
+            len(histogram.bucket_counts) == len(histogram.explicit_bounds) + 1
+            for histogram in exporter.histograms
+        )
+
+    async def test__trace__error(self) -> None:
+        """Case: the pipeline raises."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter):
+            aiterable = aenumerate(failing())
+
+        with pytest.raises(RuntimeError, match="failed"):
+            _ = [item async for item in aiterable]
+
+        assert [(span.name, span.error) for span in exporter.spans] == [
+            ("aenumerate", True),
+            ("failing", True),
+        ]
+        assert exporter.spans[0].to_otlp()["status"] == {"code": 2}
+
+    async def test__trace__once(self) -> None:
+        """Case: each pipeline is exported once."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter):
+            first = aenumerate(arange(4))
+            second = aenumerate(arange(4))
+
+        _ = [item async for item in first]
+        _ = [item async for item in second]
+
+        roots = [span for span in exporter.spans if span.parent_span_id is None]
+
+        assert len(exporter.spans) == 4
+        assert len(roots) == 2
+        assert roots[0].trace_id != roots[1].trace_id
+
+    async def test__trace__sample_rate(self) -> None:
+        """Case: iterators are not sampled."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter, sample_rate=1e-12):
+            aiterable = aenumerate(arange(23))
+
+        _ = [item async for item in aiterable]
+
+        assert not exporter.spans
+        assert not exporter.histograms
+
+    async def test__trace__clear(self) -> None:
+        """Case: the exporter is cleared."""
+        exporter = InMemoryExporter()
+
+        with trace(exporter):
+            aiterable = arange(23)
+
+        _ = [num async for num in aiterable]
+        exporter.clear()
+
+        assert not exporter.spans
+        assert not exporter.histograms
+
+
+class TestOTLP:
+    """OTLP/JSON tests."""
+
+    def test__span(self) -> None:
+        """Case: span encoding."""
+        span = SpanData("arange", 23, 5, 7, 1, 2, {"aioplus.items": 23, "aioplus.wait_time": 0.5})
+        otlp = span.to_otlp()
+
+        assert otlp["traceId"] == f"{23:032x}"
+        assert otlp["spanId"] == "0000000000000005"
+        assert otlp["parentSpanId"] == "0000000000000007"
+        assert otlp["startTimeUnixNano"] == "1"
+        assert otlp["endTimeUnixNano"] == "2"
+        assert otlp["attributes"] == [
+            {"key": "aioplus.items", "value": {"intValue": "23"}},
+            {"key": "aioplus.wait_time", "value": {"doubleValue": 0.5}},
+        ]
+        assert "status" not in otlp
+
+    def test__span__root(self) -> None:
+        """Case: span without a parent."""
+        span = SpanData("arange", 23, 5, None, 1, 2)
+
+        assert "parentSpanId" not in span.to_otlp()
+
+    def test__histogram(self) -> None:
+        """Case: histogram encoding."""
+        attributes: dict[str, int | float | str] = {"aioplus.iterator": "arange"}
+        histogram = HistogramData("latency", "s", attributes, 1, 2, (1.0,), (3, 1), 4.5)
+        otlp = histogram.to_otlp()
+        point = otlp["histogram"]["dataPoints"][0]
+
+        assert otlp["name"] == "latency"
+        assert otlp["unit"] == "s"
+        assert otlp["histogram"]["aggregationTemporality"] == 1
+        assert point["count"] == "4"
+        assert point["bucketCounts"] == ["3", "1"]
+        assert point["explicitBounds"] == [1.0]
+        assert point["attributes"] == [
+            {"key": "aioplus.iterator", "value": {"stringValue": "arange"}},
+        ]
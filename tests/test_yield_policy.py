@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from aioplus import YieldPolicy, arange, yield_policy
+
+
+async def interleave(policy: YieldPolicy | None) -> list[str]:
+    """Return the order in which two iterators are advanced."""
+    order: list[str] = []
+
+    async def consume(name: str) -> None:
+        async for _ in arange(4, yield_policy=policy):
+            order.append(name)  # noqa: PERF401
+
+    await asyncio.gather(consume("x"), consume("y"))
+    return order
+
+
+class TestParameters:
+    """Parameter tests."""
+
+    def test__every(self) -> None:
+        """Case: non-integer."""
+        with pytest.raises(TypeError):
+            YieldPolicy(every=4.0)
+
+    def test__every__zero(self) -> None:
+        """Case: `every == 0`."""
+        with pytest.raises(ValueError, match="'every' must be positive"):
+            YieldPolicy(every=0)
+
+    def test__interval(self) -> None:
+        """Case: non-float."""
+        with pytest.raises(TypeError):
+            YieldPolicy(interval=1)
+
+    def test__interval__zero(self) -> None:
+        """Case: `interval == 0.0`."""
+        with pytest.raises(ValueError, match="'interval' must be positive"):
+            YieldPolicy(interval=0.0)
+
+    def test__policy(self) -> None:
+        """Case: non-policy."""
+        with pytest.raises(TypeError), yield_policy(None):
+            pass
+
+
+class TestFunction:
+    """Function tests."""
+
+    async def test__yield_policy(self) -> None:
+        """Case: default usage."""
+        with yield_policy(YieldPolicy(every=None)):
+            aiterable = arange(23)
+
+        nums = [num async for num in aiterable]
+
+        assert nums == list(range(23))
+
+    async def test__yield_policy__default(self) -> None:
+        """Case: control is yielded on every item."""
+        order = await interleave(None)
+
+        assert order == ["x", "y", "x", "y", "x", "y", "x", "y"]
+
+    async def test__yield_policy__every(self) -> None:
+        """Case: control is yielded every two items."""
+        order = await interleave(YieldPolicy(every=2))
+
+        assert order == ["x", "y", "x", "x", "y", "y", "x", "y"]
+
+    async def test__yield_policy__never(self) -> None:
+        """Case: control is never yielded."""
+        order = await interleave(YieldPolicy(every=None))
+
+        assert order == ["x", "x", "x", "x", "y", "y", "y", "y"]
+
+    async def test__yield_policy__interval(self) -> None:
+        """Case: control is yielded by time."""
+        order = await interleave(YieldPolicy(every=None, interval=60.0))
+
+        assert order == ["x", "x", "x", "x", "y", "y", "y", "y"]
+
+    async def test__yield_policy__context(self) -> None:
+        """Case: the default policy is set."""
+        with yield_policy(YieldPolicy(every=None)):
+            order = await interleave(None)
+
+        assert order == ["x", "x", "x", "x", "y", "y", "y", "y"]